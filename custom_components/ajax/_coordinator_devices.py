@@ -7,6 +7,8 @@ Owns the heavy device-reconciliation pipeline:
   fans out `SIGNAL_NEW_DEVICE` on first sight.
 * `_async_cleanup_stale_devices`: prunes the HA device registry for IDs
   that no longer appear in the Ajax account.
+* `async_queue_device_update`: coalesces setting writes aimed at the same
+  device within ``DEVICE_UPDATE_BATCH_DELAY`` into one API call.
 
 The per-family attribute application (battery/signal, contacts, siren,
 sockets, lightswitch…) lives in ``_device_apply.apply_device_payload``
@@ -17,11 +19,13 @@ after the 30 s window) live in ``_device_normalize``
 (``AjaxDeviceNormalizeMixin``), inherited by this mixin.
 
 State stays on ``self`` (``account``, ``api``, ``hass``, the optimistic
-guards on each ``AjaxDevice``); the mixin owns no attributes.
+guards on each ``AjaxDevice``, ``_pending_device_updates``); the mixin
+owns no attributes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -32,7 +36,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from ._device_apply import apply_device_payload
 from ._device_normalize import AjaxDeviceNormalizeMixin
 from ._ids import device_identifier
-from .const import DOMAIN, SIGNAL_NEW_DEVICE
+from .const import DEVICE_UPDATE_BATCH_DELAY, DOMAIN, SIGNAL_NEW_DEVICE
 from .models import AjaxDevice, DeviceType
 
 if TYPE_CHECKING:
@@ -58,9 +62,55 @@ class AjaxDevicesMixin(AjaxDeviceNormalizeMixin):
         hass: HomeAssistant
         entry_id: str
         _initial_load_done: bool
+        _pending_device_updates: dict[tuple[str, str], tuple[dict[str, Any], asyncio.Future[None]]]
 
         def _parse_device_type(self, type_str: str) -> DeviceType: ...
 
+    async def async_queue_device_update(self, hub_id: str, device_id: str, settings: dict[str, Any]) -> None:
+        """Write device settings, merged with any write queued for the same device.
+
+        ``async_update_device`` is a full GET+PUT of the device, so two
+        sliders moved together cost two round-trips and the second PUT can
+        overwrite the first with stale data. The first caller for a device
+        starts a flush task that waits ``DEVICE_UPDATE_BATCH_DELAY``, later
+        callers merge their settings into its payload, and every caller
+        returns (or raises) with the outcome of that single API call. The
+        write runs in its own task, so cancelling any caller neither drops
+        the merged settings nor leaves the other callers waiting.
+        """
+        key = (hub_id, device_id)
+        pending = self._pending_device_updates.get(key)
+        if pending is not None:
+            pending[0].update(settings)
+            future = pending[1]
+        else:
+            future = self.hass.loop.create_future()
+            self._pending_device_updates[key] = (dict(settings), future)
+            self.hass.async_create_task(self._async_flush_device_update(key))
+        # Shielded: one cancelled caller must not cancel the shared write.
+        await asyncio.shield(future)
+
+    async def _async_flush_device_update(self, key: tuple[str, str]) -> None:
+        """Send the merged write queued for ``key`` and resolve its future."""
+        merged, future = self._pending_device_updates[key]
+        try:
+            try:
+                await asyncio.sleep(DEVICE_UPDATE_BATCH_DELAY)
+            finally:
+                # Writes queued from here on start a new batch.
+                del self._pending_device_updates[key]
+            await self.api.async_update_device(key[0], key[1], merged)
+        except Exception as err:
+            future.set_exception(err)
+            # Mark retrieved: every caller may have been cancelled meanwhile.
+            future.exception()
+        except BaseException:
+            # Task cancelled (HA shutting down): release the waiting callers.
+            future.cancel()
+            raise
+        else:
+            future.set_result(None)
+
     def _async_cleanup_stale_devices(self) -> None:
         """Remove HA device registry entries for devices no longer in Ajax.
 
@@ -3,7 +3,7 @@
 Owns the local-AI detection path: ONVIF subscription bootstrap
 (`_async_init_onvif`), event handler that routes NVR-channel events
 to the right camera and fires the matching HA entity / bus event
-(`_handle_onvif_event`), and the NVR-channel-to-camera mapping helper
+(`_handle_onvif_event` / `_handle_onvif_events`), and the NVR-channel-to-camera mapping helper
 (`_find_camera_for_nvr_channel`).
 
 The path is optional — ONVIF only initialises when the user has
@@ -156,6 +156,7 @@ class AjaxOnvifMixin:
                 username=username,
                 password=password,
                 event_callback=self._handle_onvif_event,
+                batch_event_callback=self._handle_onvif_events,
             )
 
             await self.onvif_manager.async_start(video_edges)
@@ -275,16 +276,37 @@ class AjaxOnvifMixin:
     # ------------------------------------------------------------------
 
     def _handle_onvif_event(self, event: OnvifDetectionEvent) -> None:
-        """Handle an ONVIF detection event from a camera or NVR.
+        """Handle a single ONVIF detection event from a camera or NVR."""
+        if self._apply_onvif_event(event):
+            # Refresh entities so the detection change is reflected.
+            self.async_set_updated_data(self.account)
+
+    def _handle_onvif_events(self, events: list[OnvifDetectionEvent]) -> None:
+        """Handle every event of one PullMessages response.
+
+        An NVR can coalesce many detections into a single response; they
+        are all applied first, then entities are refreshed once.
+        """
+        applied = False
+        for event in events:
+            applied = self._apply_onvif_event(event) or applied
+        if applied:
+            self.async_set_updated_data(self.account)
+
+    def _apply_onvif_event(self, event: OnvifDetectionEvent) -> bool:
+        """Apply an ONVIF detection event without refreshing entities.
 
         For NVR events, routes the detection to the correct camera based
         on ``channel_id``. Updates the per-channel video-edge detection
         state, fires the matching HA entity, and emits the
         ``ajax_camera_detection`` / ``ajax_doorbell_ring`` bus events.
+
+        Returns:
+            True if a tracked video edge was updated.
         """
         self.stats["events_onvif_received"] += 1
         if not self.account:
-            return
+            return False
 
         _LOGGER.debug(
             "ONVIF event received: %s (channel %s, active=%s)",
@@ -366,9 +388,9 @@ class AjaxOnvifMixin:
                         bus_data["snapshot_url"] = f"/api/camera_proxy/{camera_entity_id}"
                     self.hass.bus.async_fire(EVENT_AJAX_CAMERA_DETECTION, bus_data)
 
-            # Refresh entities so the detection_key change is reflected.
-            self.async_set_updated_data(self.account)
-            return
+            return True
+
+        return False
 
     # ------------------------------------------------------------------
     # NVR channel → camera routing
@@ -121,7 +121,7 @@ def _apply_config_flags(device: AjaxDevice, device_data: dict[str, Any]) -> None
         device.attributes["shock_sensor_aware"] = device_data.get("shockSensorAware", False)
     if "accelerometerAware" in device_data and not device.is_optimistic("accelerometer_aware"):
         device.attributes["accelerometer_aware"] = device_data.get("accelerometerAware", False)
-    if "shockSensorSensitivity" in device_data:
+    if "shockSensorSensitivity" in device_data and not device.is_optimistic("shock_sensor_sensitivity"):
         device.attributes["shock_sensor_sensitivity"] = device_data.get("shockSensorSensitivity", 0)
     if "accelerometerTiltDegrees" in device_data:
         device.attributes["accelerometer_tilt_degrees"] = device_data.get("accelerometerTiltDegrees", 5)
@@ -197,14 +197,16 @@ def _apply_contact_states(device: AjaxDevice, device_data: dict[str, Any]) -> No
 
 def _apply_siren(device: AjaxDevice, device_data: dict[str, Any]) -> None:
     """HomeSiren / StreetSiren volume, indication and chime settings."""
-    # Prefer v2sirenVolumeLevel (supports DISABLED), fallback to deprecated sirenVolumeLevel
-    if "v2sirenVolumeLevel" in device_data:
-        device.attributes["siren_volume_level"] = device_data.get("v2sirenVolumeLevel")
-    elif "sirenVolumeLevel" in device_data:
-        device.attributes["siren_volume_level"] = device_data.get("sirenVolumeLevel")
-    if "beepVolumeLevel" in device_data:
+    # Prefer v2sirenVolumeLevel (supports DISABLED), fallback to deprecated sirenVolumeLevel.
+    # Volume, beep and duration back selects that mark them optimistic.
+    if not device.is_optimistic("siren_volume_level"):
+        if "v2sirenVolumeLevel" in device_data:
+            device.attributes["siren_volume_level"] = device_data.get("v2sirenVolumeLevel")
+        elif "sirenVolumeLevel" in device_data:
+            device.attributes["siren_volume_level"] = device_data.get("sirenVolumeLevel")
+    if "beepVolumeLevel" in device_data and not device.is_optimistic("beep_volume_level"):
         device.attributes["beep_volume_level"] = device_data.get("beepVolumeLevel")
-    if "alarmDuration" in device_data:
+    if "alarmDuration" in device_data and not device.is_optimistic("alarm_duration"):
         device.attributes["alarm_duration"] = device_data.get("alarmDuration")
     if not device.is_optimistic("led_indication"):
         if "v2sirenIndicatorLightMode" in device_data:
@@ -338,7 +340,9 @@ def _apply_socket_power(device: AjaxDevice, device_data: dict[str, Any]) -> None
         else:
             device.attributes["is_on"] = False
 
-    # Socket specific attributes (power monitoring, protection settings)
+    # Socket specific attributes (power monitoring, protection settings).
+    # The indication keys are backed by selects that mark them optimistic;
+    # indicationEnabled is also derived locally from a pending indicationMode.
     for attr in (
         "indicationEnabled",
         "indicationBrightness",
@@ -348,8 +352,11 @@ def _apply_socket_power(device: AjaxDevice, device_data: dict[str, Any]) -> None
         "lockupRelayMode",
         "lockupRelayTimeSeconds",
     ):
-        if attr in device_data:
-            device.attributes[attr] = device_data.get(attr)
+        if attr not in device_data or device.is_optimistic(attr):
+            continue
+        if attr == "indicationEnabled" and device.is_optimistic("indicationMode"):
+            continue
+        device.attributes[attr] = device_data.get(attr)
     # Power monitoring values
     # powerConsumedWattsPerHour = energy consumed (for Socket without Outlet suffix)
     if "powerConsumedWattsPerHour" in device_data:
@@ -371,12 +378,13 @@ def _apply_socket_power(device: AjaxDevice, device_data: dict[str, Any]) -> None
     # Current threshold (SocketOutlet)
     if "currentThresholdAmpere" in device_data:
         device.attributes["current_threshold"] = device_data.get("currentThresholdAmpere")
-    # Indication settings (SocketOutlet)
-    if "indicationMode" in device_data:
+    # Indication settings (SocketOutlet). Both back selects that mark them
+    # optimistic; the select also keeps the derived indicationEnabled in step.
+    if "indicationMode" in device_data and not device.is_optimistic("indicationMode"):
         device.attributes["indicationMode"] = device_data.get("indicationMode")
         # indicationEnabled derived from indicationMode
         device.attributes["indicationEnabled"] = device_data.get("indicationMode") == "ENABLED"
-    if "indicationBrightnessV2" in device_data:
+    if "indicationBrightnessV2" in device_data and not device.is_optimistic("indicationBrightness"):
         device.attributes["indicationBrightness"] = device_data.get("indicationBrightnessV2")
 
 
@@ -439,6 +447,7 @@ def _apply_lightswitch(device: AjaxDevice, device_data: dict[str, Any]) -> None:
         device.attributes["settingsSwitch"] = device_data.get("settingsSwitch", [])
     if "protectStatuses" in device_data:
         device.attributes["protectStatuses"] = device_data.get("protectStatuses", [])
+    # touchMode / dimmerSettings back dimmer selects that mark them optimistic.
     for attr in (
         "touchSensitivity",
         "touchMode",
@@ -446,9 +455,9 @@ def _apply_lightswitch(device: AjaxDevice, device_data: dict[str, Any]) -> None:
         "dataChannelOk",
         "panelColor",
     ):
-        if attr in device_data:
+        if attr in device_data and not device.is_optimistic(attr):
             device.attributes[attr] = device_data.get(attr)
-    if "dimmerSettings" in device_data:
+    if "dimmerSettings" in device_data and not device.is_optimistic("dimmerSettings"):
         device.attributes["dimmerSettings"] = device_data.get("dimmerSettings", {})
 
     if "buttonOne" in device_data or "buttonTwo" in device_data:
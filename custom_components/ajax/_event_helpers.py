@@ -26,6 +26,12 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# One indexed match: the video edge, the ``channels`` list it was read from
+# and the NVR channel id (None for a match on the camera itself).
+type _VideoEdgeHit = tuple[AjaxVideoEdge, Any, str | None]
+# (by NVR channel id, by camera or channel name) for one space.
+type _VideoEdgeIndex = tuple[dict[str, _VideoEdgeHit], dict[str, _VideoEdgeHit]]
+
 
 def resolve_camera_entity_id(hass: HomeAssistant, video_edge_id: str) -> str | None:
     """Resolve the main-stream camera entity_id for a video_edge.
@@ -74,6 +80,8 @@ class EventHandlerMixin:
 
     coordinator: AjaxDataCoordinator
     _last_discovery_refresh: float = 0.0
+    # space_id -> video edge index, created on first use (see _find_video_edge)
+    _video_edge_index: dict[str, _VideoEdgeIndex] | None = None
 
     @staticmethod
     def _apply_tamper_state(device: AjaxDevice, event_tag: str, transition: str) -> str:
@@ -145,25 +153,66 @@ class EventHandlerMixin:
         when the match is done through an NVR channel (either by ID or by
         the channel's ``name`` field).
         """
-        if source_id:
-            if source_id in space.video_edges:
-                return space.video_edges[source_id], None
-
-            # For NVR: the source_id might be a channel ID
-            for video_edge in space.video_edges.values():
-                for channel in video_edge.channels:
-                    if isinstance(channel, dict) and channel.get("id") == source_id:
-                        return video_edge, source_id
-
-        if source_name:
-            for video_edge in space.video_edges.values():
-                if video_edge.name == source_name:
-                    return video_edge, None
-                for channel in video_edge.channels:
-                    if isinstance(channel, dict) and channel.get("name") == source_name:
-                        return video_edge, channel.get("id")
-
-        return None, None
+        if source_id and source_id in space.video_edges:
+            return space.video_edges[source_id], None
+        if not source_id and not source_name:
+            return None, None
+
+        # NVR channel ids and camera/channel names go through a cached
+        # per-space index instead of nested scans; a miss or a stale hit
+        # rebuilds it once, so edges refreshed by a poll are picked up.
+        cache = self._video_edge_index
+        if cache is None:
+            cache = self._video_edge_index = {}
+        index = cache.get(space.id)
+        hit = self._match_video_edge_index(space, index, source_name, source_id) if index is not None else None
+        if hit is None:
+            index = cache[space.id] = self._build_video_edge_index(space)
+            hit = self._match_video_edge_index(space, index, source_name, source_id)
+        return hit or (None, None)
+
+    @staticmethod
+    def _build_video_edge_index(space: AjaxSpace) -> _VideoEdgeIndex:
+        """Index a space's video edges by NVR channel id and by name.
+
+        ``setdefault`` keeps the first match in the order the former nested
+        scans visited edges and their channels.
+        """
+        by_channel_id: dict[str, _VideoEdgeHit] = {}
+        by_name: dict[str, _VideoEdgeHit] = {}
+        for video_edge in space.video_edges.values():
+            channels = video_edge.channels
+            by_name.setdefault(video_edge.name, (video_edge, channels, None))
+            for channel in channels:
+                if not isinstance(channel, dict):
+                    continue
+                channel_id = channel.get("id")
+                if isinstance(channel_id, str):
+                    by_channel_id.setdefault(channel_id, (video_edge, channels, channel_id))
+                channel_name = channel.get("name")
+                if isinstance(channel_name, str):
+                    by_name.setdefault(channel_name, (video_edge, channels, channel_id))
+        return by_channel_id, by_name
+
+    @staticmethod
+    def _match_video_edge_index(
+        space: AjaxSpace, index: _VideoEdgeIndex, source_name: str, source_id: str
+    ) -> tuple[AjaxVideoEdge, str | None] | None:
+        """Look an event source up in a video edge index.
+
+        Returns ``(video_edge, channel_id)``, or ``None`` on a miss or a stale
+        entry so the caller rebuilds the index once and retries.
+        """
+        for key, table in ((source_id, index[0]), (source_name, index[1])):
+            if not key or (hit := table.get(key)) is None:
+                continue
+            video_edge, channels, channel_id = hit
+            # A poll reassigns the edge's name and channels together, so an
+            # unchanged channels list means the entry is still current.
+            if space.video_edges.get(video_edge.id) is video_edge and video_edge.channels is channels:
+                return video_edge, channel_id
+            return None
+        return None
 
     def _update_video_detection(
         self,
@@ -190,10 +239,10 @@ class EventHandlerMixin:
             else:
                 return
 
-        if not isinstance(target_channel.get("state"), list):
-            target_channel["state"] = []
+        state_list = target_channel.get("state")
+        if not isinstance(state_list, list):
+            state_list = target_channel["state"] = []
 
-        state_list = target_channel["state"]
         for entry in state_list:
             if isinstance(entry, dict) and entry.get("type") == detection_type:
                 entry["active"] = active
@@ -235,15 +284,16 @@ class EventHandlerMixin:
     def _reset_doorbell_ring(self, space_id: str, device_id: str) -> None:
         """Clear the transient ``doorbell_ring`` flag for a device."""
         try:
-            if not self.coordinator.account:
+            account = self.coordinator.account
+            if not account:
                 return
-            space = self.coordinator.account.spaces.get(space_id)
+            space = account.spaces.get(space_id)
             if not space:
                 return
             device = space.devices.get(device_id)
             if device:
                 device.attributes["doorbell_ring"] = False
                 _LOGGER.debug("Doorbell ring auto-reset: %s", device.name)
-                self.coordinator.async_set_updated_data(self.coordinator.account)
+                self.coordinator.async_set_updated_data(account)
         except Exception as err:  # noqa: BLE001 — best-effort reset
             _LOGGER.debug("Error resetting doorbell ring: %s", err)
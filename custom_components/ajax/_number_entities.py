@@ -2,7 +2,8 @@
 
 Split out of ``number.py`` (which keeps only ``async_setup_entry`` and the
 discovery builder). Contains the dimmer number definitions and the entity
-classes (tilt degrees, current threshold, LED brightness, dimmer settings).
+classes (tilt degrees, current threshold, LED brightness, dimmer settings),
+all built on ``AjaxBaseNumber``.
 """
 
 from __future__ import annotations
@@ -12,7 +13,6 @@ from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import DEGREE, PERCENTAGE, UnitOfElectricCurrent
-from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
@@ -102,6 +102,16 @@ DIMMER_NUMBER_DEFINITIONS = [
     },
 ]
 
+# Dimmer definitions keyed by device attribute. Setup intersects a device's
+# attribute keys with this table in one set operation, then sorts the few
+# matches back into definition order with DIMMER_NUMBER_ATTR_ORDER.
+DIMMER_NUMBER_DEFS_BY_ATTR_KEY: dict[str, dict[str, Any]] = {
+    number_def["attr_key"]: number_def for number_def in DIMMER_NUMBER_DEFINITIONS
+}
+DIMMER_NUMBER_ATTR_ORDER: dict[str, int] = {
+    attr_key: index for index, attr_key in enumerate(DIMMER_NUMBER_DEFS_BY_ATTR_KEY)
+}
+
 
 # LightSwitch (non-dimmer) touch-sensitivity definition — was duplicated
 # inline in both the static setup and the discovery builder.
@@ -116,9 +126,20 @@ LIGHTSWITCH_TOUCH_SENSITIVITY_NUMBER: dict[str, Any] = {
     "entity_category": "config",
 }
 
+# Definition "entity_category" strings -> HA enum (absent/unknown -> None).
+_ENTITY_CATEGORIES: dict[str | None, EntityCategory] = {
+    "config": EntityCategory.CONFIG,
+    "diagnostic": EntityCategory.DIAGNOSTIC,
+}
+
+
+class AjaxBaseNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
+    """Shared base for every Ajax number entity.
 
-class AjaxDoorPlusBaseNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
-    """Base class for DoorProtect Plus number entities."""
+    Holds the space/device binding, device lookup, availability and device
+    info; subclasses only provide ``native_value`` and
+    ``async_set_native_value``.
+    """
 
     _attr_has_entity_name = True
     _attr_mode = NumberMode.SLIDER
@@ -143,12 +164,12 @@ class AjaxDoorPlusBaseNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntit
     def device_info(self) -> DeviceInfo:
         return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
 
+# Historical name, still re-exported by ``number``.
+AjaxDoorPlusBaseNumber = AjaxBaseNumber
 
-class AjaxTiltDegreesNumber(AjaxDoorPlusBaseNumber):
+
+class AjaxTiltDegreesNumber(AjaxBaseNumber):
     """Number entity for tilt angle threshold."""
 
     _attr_native_min_value = 5
@@ -188,7 +209,7 @@ class AjaxTiltDegreesNumber(AjaxDoorPlusBaseNumber):
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
         try:
-            await self.coordinator.api.async_update_device(
+            await self.coordinator.async_queue_device_update(
                 space.hub_id, self._device_id, {"accelerometerTiltDegrees": int(value)}
             )
             _LOGGER.info(
@@ -208,11 +229,9 @@ class AjaxTiltDegreesNumber(AjaxDoorPlusBaseNumber):
             ) from err
 
 
-class AjaxCurrentThresholdNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
+class AjaxCurrentThresholdNumber(AjaxBaseNumber):
     """Number entity for socket current threshold (protection limit)."""
 
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.SLIDER
     _attr_native_min_value = 1
     _attr_native_max_value = 16
     _attr_native_step = 1
@@ -220,27 +239,10 @@ class AjaxCurrentThresholdNumber(CoordinatorEntity[AjaxDataCoordinator], NumberE
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
+        super().__init__(coordinator, space_id, device_id)
         self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_current_threshold"
         self._attr_translation_key = "current_threshold"
 
-    def _get_device(self) -> AjaxDevice | None:
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
-    @property
-    def available(self) -> bool:
-        if not self.coordinator.last_update_success:
-            return False
-        device = self._get_device()
-        return device.online if device else False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
     @property
     def native_value(self) -> float | None:
         device = self._get_device()
@@ -248,10 +250,6 @@ class AjaxCurrentThresholdNumber(CoordinatorEntity[AjaxDataCoordinator], NumberE
             return None
         return device.attributes.get("current_threshold")
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
-
     async def async_set_native_value(self, value: float) -> None:
         """Set the current threshold."""
         space = self.coordinator.get_space(self._space_id)
@@ -265,7 +263,7 @@ class AjaxCurrentThresholdNumber(CoordinatorEntity[AjaxDataCoordinator], NumberE
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
         try:
-            await self.coordinator.api.async_update_device(
+            await self.coordinator.async_queue_device_update(
                 space.hub_id, self._device_id, {"currentThresholdAmpere": int(value)}
             )
             _LOGGER.info(
@@ -285,27 +283,19 @@ class AjaxCurrentThresholdNumber(CoordinatorEntity[AjaxDataCoordinator], NumberE
             ) from err
 
 
-class AjaxLedBrightnessV2Number(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
+class AjaxLedBrightnessV2Number(AjaxBaseNumber):
     """Number entity for SocketOutlet LED brightness (1-8 scale)."""
 
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.SLIDER
     _attr_native_min_value = 1
     _attr_native_max_value = 8
     _attr_native_step = 1
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
+        super().__init__(coordinator, space_id, device_id)
         self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_led_brightness"
         self._attr_translation_key = "led_brightness_level"
 
-    def _get_device(self) -> AjaxDevice | None:
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
     @property
     def available(self) -> bool:
         if not self.coordinator.last_update_success:
@@ -316,10 +306,6 @@ class AjaxLedBrightnessV2Number(CoordinatorEntity[AjaxDataCoordinator], NumberEn
         # Only available when indication mode is not DISABLED
         return device.attributes.get("indicationMode") != "DISABLED"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
     @property
     def native_value(self) -> float | None:
         device = self._get_device()
@@ -327,10 +313,6 @@ class AjaxLedBrightnessV2Number(CoordinatorEntity[AjaxDataCoordinator], NumberEn
             return None
         return device.attributes.get("indicationBrightness", 8)  # type: ignore[no-any-return]
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
-
     async def async_set_native_value(self, value: float) -> None:
         """Set the LED brightness level."""
         space = self.coordinator.get_space(self._space_id)
@@ -344,7 +326,7 @@ class AjaxLedBrightnessV2Number(CoordinatorEntity[AjaxDataCoordinator], NumberEn
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
         try:
-            await self.coordinator.api.async_update_device(
+            await self.coordinator.async_queue_device_update(
                 space.hub_id, self._device_id, {"indicationBrightnessV2": int(value)}
             )
             _LOGGER.info(
@@ -364,12 +346,9 @@ class AjaxLedBrightnessV2Number(CoordinatorEntity[AjaxDataCoordinator], NumberEn
             ) from err
 
 
-class AjaxDimmerNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
+class AjaxDimmerNumber(AjaxBaseNumber):
     """Number entity for LightSwitchDimmer settings."""
 
-    _attr_has_entity_name = True
-    _attr_mode = NumberMode.SLIDER
-
     def __init__(
         self,
         coordinator: AjaxDataCoordinator,
@@ -378,10 +357,10 @@ class AjaxDimmerNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
         number_def: dict[str, Any],
     ) -> None:
         """Initialize the dimmer number entity."""
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
+        super().__init__(coordinator, space_id, device_id)
         self._number_def = number_def
+        # Resolved once: native_value runs on every state write.
+        self._value_key: str = number_def["attr_key"]
 
         self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_{number_def['key']}"
         self._attr_translation_key = number_def["translation_key"]
@@ -390,26 +369,7 @@ class AjaxDimmerNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
         self._attr_native_step = number_def["step"]
         self._attr_native_unit_of_measurement = number_def.get("unit")
 
-        if number_def.get("entity_category") == "config":
-            self._attr_entity_category = EntityCategory.CONFIG
-        elif number_def.get("entity_category") == "diagnostic":
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get current device from coordinator."""
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self._get_device()
-        return self.coordinator.last_update_success and device is not None and device.online
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
+        self._attr_entity_category = _ENTITY_CATEGORIES.get(number_def.get("entity_category"))
 
     @property
     def native_value(self) -> float | None:
@@ -417,7 +377,7 @@ class AjaxDimmerNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
         device = self._get_device()
         if not device:
             return None
-        return device.attributes.get(self._number_def["attr_key"])
+        return device.attributes.get(self._value_key)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
@@ -432,7 +392,7 @@ class AjaxDimmerNumber(CoordinatorEntity[AjaxDataCoordinator], NumberEntity):
         api_key = self._number_def["api_key"]
 
         try:
-            await self.coordinator.api.async_update_device(space.hub_id, self._device_id, {api_key: int(value)})
+            await self.coordinator.async_queue_device_update(space.hub_id, self._device_id, {api_key: int(value)})
             _LOGGER.info(
                 "Set %s=%d for device %s",
                 api_key,
@@ -8,6 +8,7 @@ brightness, indication mode, dimmer definitions) and the entity classes.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
@@ -18,6 +19,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ._ids import device_identifier
+from .api import AjaxRestApiError
 from .const import DOMAIN
 from .coordinator import AjaxDataCoordinator
 from .devices.door_contact import DOOR_PLUS_DEVICE_TYPES
@@ -26,8 +28,8 @@ from .models import AjaxDevice, DeviceType, SecurityState
 
 _LOGGER = logging.getLogger(__name__)
 
-# Device handlers that support get_selects()
-SELECT_DEVICE_HANDLERS = {
+# Device handlers that support get_selects() (every entry must implement it)
+SELECT_DEVICE_HANDLERS: dict[DeviceType, type[SirenHandler]] = {
     DeviceType.SIREN: SirenHandler,
 }
 
@@ -44,6 +46,10 @@ SHOCK_SENSITIVITY_VALUES = {v: k for k, v in SHOCK_SENSITIVITY_OPTIONS.items()}
 
 # LED brightness options for Socket (lowercase for HA translation keys)
 LED_BRIGHTNESS_OPTIONS = ["min", "max"]
+# API values are uppercase (MIN/MAX); map both ways instead of re-casing
+# the string on every read and write.
+_LED_BRIGHTNESS_FROM_API = {option.upper(): option for option in LED_BRIGHTNESS_OPTIONS}
+_LED_BRIGHTNESS_TO_API = {option: api for api, option in _LED_BRIGHTNESS_FROM_API.items()}
 
 # Indication mode options for SocketOutlet
 INDICATION_MODE_OPTIONS = {
@@ -98,6 +104,9 @@ DIMMER_SELECT_DEFINITIONS: list[dict[str, Any]] = [
     },
 ]
 
+# Top-level attributes the dimmer selects read; a dimmer reporting none of
+# them gets no dimmer selects, so setup can skip probing each definition.
+DIMMER_SELECT_ROOT_ATTRS = frozenset(d["attr_key"].split(".", 1)[0] for d in DIMMER_SELECT_DEFINITIONS)
 
 # LightSwitch touch mode select definition
 LIGHTSWITCH_TOUCH_MODE_SELECT = {
@@ -114,80 +123,132 @@ LIGHTSWITCH_TOUCH_MODE_SELECT = {
 }
 
 
+def _get_attr_path(attributes: dict[str, Any], path: tuple[str, ...]) -> Any:
+    """Follow a pre-split attribute path (``("dimmerSettings", "curveType")``)."""
+    if len(path) == 1:
+        return attributes.get(path[0])
+    value: Any = attributes
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
 def _get_dimmer_attr(device: AjaxDevice, attr_key: str) -> Any:
     """Get nested attribute value from device."""
-    if "." in attr_key:
-        parts = attr_key.split(".")
-        value: Any = device.attributes
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-        return value
-    return device.attributes.get(attr_key)
+    return _get_attr_path(device.attributes, tuple(attr_key.split(".")))
+
 
+class AjaxBaseSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
+    """Base class for Ajax device configuration selects.
 
-class AjaxDoorPlusBaseSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
-    """Base class for DoorProtect Plus select entities."""
+    The device is resolved once per coordinator update and cached in
+    ``_device``: HA reads several properties on every state write. The
+    device info never changes, so it is built once in ``__init__``.
+    """
 
     _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
         super().__init__(coordinator)
         self._space_id = space_id
         self._device_id = device_id
+        self._device: AjaxDevice | None = None
+        self._refresh_device()
+        self._attr_device_info = DeviceInfo(identifiers={device_identifier(coordinator.entry_id, device_id)})
 
-    def _get_device(self) -> AjaxDevice | None:
+    def _refresh_device(self) -> None:
+        """Re-resolve the device from the coordinator data."""
         space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
+        self._device = space.devices.get(self._device_id) if space else None
 
     @property
     def available(self) -> bool:
         if not self.coordinator.last_update_success:
             return False
-        device = self._get_device()
+        device = self._device
         return device.online if device else False
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._refresh_device()
         self.async_write_ha_state()
 
-
-class AjaxShockSensitivitySelect(AjaxDoorPlusBaseSelect):
-    """Select entity for shock sensor sensitivity."""
-
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_options = list(SHOCK_SENSITIVITY_OPTIONS.values())
+    @callback
+    def _apply_local_value(self, attr_key: str, value: Any) -> None:
+        """Store a value the API just accepted and push it to listeners.
+
+        The new value is already known, so a full account refresh would only
+        re-read it. Dotted keys (``dimmerSettings.curveType``) address nested
+        dicts. The root key is marked optimistic, like the switches do, so a
+        poll already in flight cannot revert it before the hub reports it.
+        """
+        device = self._device
+        if device is None:
+            return
+        target = device.attributes
+        *parents, leaf = attr_key.split(".")
+        for part in parents:
+            nested = target.get(part)
+            if not isinstance(nested, dict):
+                nested = target[part] = {}
+            target = nested
+        target[leaf] = value
+        device.mark_optimistic(parents[0] if parents else leaf, 15.0)
+        self.coordinator.async_update_listeners()
+
+
+# Former name of the base class, kept for older imports.
+AjaxDoorPlusBaseSelect = AjaxBaseSelect
+
+
+class AjaxMappedAttributeSelect(AjaxBaseSelect):
+    """Select backed by one flat device attribute with a fixed option mapping.
+
+    Subclasses only declare the attribute, the API key and the option
+    tables in both directions; reading, writing and error handling are
+    shared. The unique id suffix is the translation key.
+    """
+
+    _attribute: str
+    _api_key: str
+    _from_api: Mapping[Any, str]
+    _to_api: Mapping[str, Any]
+    # Sent for an option missing from ``_to_api`` (HA only passes declared
+    # options, so this is a safety net).
+    _default_api_value: Any
+    _label: str
+    _requires_disarmed = False
 
     def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
         super().__init__(coordinator, space_id, device_id)
-        self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_shock_sensitivity"
-        self._attr_translation_key = "shock_sensitivity"
+        self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_{self._attr_translation_key}"
+
+    def _api_value(self, option: str) -> Any:
+        """Return the API value for ``option``."""
+        return self._to_api.get(option, self._default_api_value)
 
     @property
     def current_option(self) -> str | None:
-        device = self._get_device()
+        device = self._device
         if not device:
             return None
-        value = device.attributes.get("shock_sensor_sensitivity")
-        # Return None for unmapped values so HA displays "unknown" rather
-        # than forcing a wrong option.
-        return SHOCK_SENSITIVITY_OPTIONS.get(value)  # type: ignore[arg-type]
+        # Unmapped values return None so HA displays "unknown" rather than
+        # forcing a wrong option.
+        try:
+            return self._from_api.get(device.attributes.get(self._attribute))
+        except TypeError:  # unhashable payload value
+            return None
 
     async def async_select_option(self, option: str) -> None:
-        """Change the shock sensor sensitivity."""
+        """Change the option."""
         space = self.coordinator.get_space(self._space_id)
         if not space:
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="space_not_found")
 
-        value = SHOCK_SENSITIVITY_VALUES.get(option, 0)
-
-        if space.security_state != SecurityState.DISARMED:
+        if self._requires_disarmed and space.security_state != SecurityState.DISARMED:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="system_armed",
@@ -196,186 +257,89 @@ class AjaxShockSensitivitySelect(AjaxDoorPlusBaseSelect):
         if not space.hub_id:
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
+        api_value = self._api_value(option)
+
         try:
-            await self.coordinator.api.async_update_device(
-                space.hub_id, self._device_id, {"shockSensorSensitivity": value}
-            )
+            await self.coordinator.api.async_update_device(space.hub_id, self._device_id, {self._api_key: api_value})
             _LOGGER.info(
-                "Set shockSensorSensitivity=%d (%s) for device %s",
-                value,
+                "Set %s=%s (%s) for device %s",
+                self._api_key,
+                api_value,
                 option,
                 self._device_id,
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except AjaxRestApiError as err:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="failed_to_change",
                 translation_placeholders={
-                    "entity": "shock sensitivity level",
+                    "entity": self._label,
                     "error": str(err),
                 },
             ) from err
+        self._apply_local_value(self._attribute, api_value)
 
 
-class AjaxLedBrightnessSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
-    """Select entity for Socket LED brightness."""
+class AjaxShockSensitivitySelect(AjaxMappedAttributeSelect):
+    """Select entity for shock sensor sensitivity."""
 
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.CONFIG
-    _attr_options = LED_BRIGHTNESS_OPTIONS
+    _attr_options = list(SHOCK_SENSITIVITY_OPTIONS.values())
+    _attr_translation_key = "shock_sensitivity"
+    _attribute = "shock_sensor_sensitivity"
+    _api_key = "shockSensorSensitivity"
+    _from_api = SHOCK_SENSITIVITY_OPTIONS
+    _to_api = SHOCK_SENSITIVITY_VALUES
+    _default_api_value = 0
+    _label = "shock sensitivity level"
+    _requires_disarmed = True
 
-    def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
-        self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_led_brightness"
-        self._attr_translation_key = "led_brightness"
 
-    def _get_device(self) -> AjaxDevice | None:
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
+class AjaxLedBrightnessSelect(AjaxMappedAttributeSelect):
+    """Select entity for Socket LED brightness."""
+
+    _attr_options = LED_BRIGHTNESS_OPTIONS
+    _attr_translation_key = "led_brightness"
+    _attribute = "indicationBrightness"
+    _api_key = "indicationBrightness"
+    _from_api = _LED_BRIGHTNESS_FROM_API
+    _to_api = _LED_BRIGHTNESS_TO_API
+    _default_api_value = "MIN"
+    _label = "LED brightness"
 
     @property
     def available(self) -> bool:
-        if not self.coordinator.last_update_success:
-            return False
-        device = self._get_device()
-        if not device or not device.online:
+        device = self._device
+        if not super().available or device is None:
             return False
         # Hide when LED indication is disabled
         return device.attributes.get("indicationEnabled", False)  # type: ignore[no-any-return]
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
-    @property
-    def current_option(self) -> str | None:
-        device = self._get_device()
-        if not device:
-            return None
-        # API returns uppercase (MIN/MAX), convert to lowercase for HA
-        value = device.attributes.get("indicationBrightness")
-        if not isinstance(value, str):
-            return None
-        lowered = value.lower()
-        return lowered if lowered in LED_BRIGHTNESS_OPTIONS else None
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the LED brightness."""
-        space = self.coordinator.get_space(self._space_id)
-        if not space:
-            raise HomeAssistantError(translation_domain=DOMAIN, translation_key="space_not_found")
 
-        if not space.hub_id:
-            raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
-
-        # Convert lowercase HA option to uppercase for API
-        api_value = option.upper()
-
-        try:
-            await self.coordinator.api.async_update_device(
-                space.hub_id, self._device_id, {"indicationBrightness": api_value}
-            )
-            _LOGGER.info(
-                "Set indicationBrightness=%s for device %s",
-                api_value,
-                self._device_id,
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="failed_to_change",
-                translation_placeholders={
-                    "entity": "LED brightness",
-                    "error": str(err),
-                },
-            ) from err
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
-
-
-class AjaxIndicationModeSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
+class AjaxIndicationModeSelect(AjaxMappedAttributeSelect):
     """Select entity for SocketOutlet indication mode (LED backlight mode)."""
 
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.CONFIG
     _attr_options = list(INDICATION_MODE_OPTIONS.values())
-
-    def __init__(self, coordinator: AjaxDataCoordinator, space_id: str, device_id: str) -> None:
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
-        self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_indication_mode"
-        self._attr_translation_key = "indication_mode"
-
-    def _get_device(self) -> AjaxDevice | None:
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
-    @property
-    def available(self) -> bool:
-        if not self.coordinator.last_update_success:
-            return False
-        device = self._get_device()
-        return device.online if device else False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
-    @property
-    def current_option(self) -> str | None:
-        device = self._get_device()
-        if not device:
-            return None
-        api_value = device.attributes.get("indicationMode")
-        return INDICATION_MODE_OPTIONS.get(api_value)  # type: ignore[arg-type]
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the indication mode."""
-        space = self.coordinator.get_space(self._space_id)
-        if not space:
-            raise HomeAssistantError(translation_domain=DOMAIN, translation_key="space_not_found")
-
-        if not space.hub_id:
-            raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
-
-        api_value = INDICATION_MODE_VALUES.get(option, "ENABLED")
-
-        try:
-            await self.coordinator.api.async_update_device(space.hub_id, self._device_id, {"indicationMode": api_value})
-            _LOGGER.info(
-                "Set indicationMode=%s for device %s",
-                api_value,
-                self._device_id,
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="failed_to_change",
-                translation_placeholders={
-                    "entity": "indication mode",
-                    "error": str(err),
-                },
-            ) from err
+    _attr_translation_key = "indication_mode"
+    _attribute = "indicationMode"
+    _api_key = "indicationMode"
+    _from_api = INDICATION_MODE_OPTIONS
+    _to_api = INDICATION_MODE_VALUES
+    _default_api_value = "ENABLED"
+    _label = "indication mode"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
+    def _apply_local_value(self, attr_key: str, value: Any) -> None:
+        # indicationEnabled is derived from the mode (see _device_apply) and
+        # gates the LED brightness select, so update it in the same step.
+        device = self._device
+        if device is not None:
+            device.attributes["indicationEnabled"] = value == "ENABLED"
+        super()._apply_local_value(attr_key, value)
 
 
-class AjaxDimmerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
+class AjaxDimmerSelect(AjaxBaseSelect):
     """Select entity for LightSwitchDimmer settings."""
 
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.CONFIG
-
     def __init__(
         self,
         coordinator: AjaxDataCoordinator,
@@ -384,46 +348,37 @@ class AjaxDimmerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
         select_def: dict[str, Any],
     ) -> None:
         """Initialize the dimmer select entity."""
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
+        super().__init__(coordinator, space_id, device_id)
         self._select_def = select_def
+        # Split the dotted attribute key once; current_option runs on every
+        # state write.
+        self._attr_path = tuple(select_def["attr_key"].split("."))
+        # Write-side fields are fixed too: resolve them once as well.
+        self._api_key: str = select_def["api_key"]
+        self._api_nested_key: str | None = select_def.get("api_nested_key")
+        self._api_options: dict[str, str] = select_def.get("api_options", {})
 
         self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_{select_def['key']}"
         self._attr_translation_key = select_def["translation_key"]
         self._attr_options = select_def["options"]
-
-    def _get_device(self) -> AjaxDevice | None:
-        """Get current device from coordinator."""
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        device = self._get_device()
-        return self.coordinator.last_update_success and device is not None and device.online
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
+        self._option_set = frozenset(self._attr_options)
+        # Reverse of api_options: the API reports the uppercase enum value.
+        self._from_api: dict[str, str] = {api: option for option, api in self._api_options.items()}
 
     @property
     def current_option(self) -> str | None:
         """Return current option from device attributes."""
-        device = self._get_device()
+        device = self._device
         if not device:
             return None
-        value = _get_dimmer_attr(device, self._select_def["attr_key"])
+        value = _get_attr_path(device.attributes, self._attr_path)
         if value is None:
             return None
-        # Convert API value to HA option
+        if isinstance(value, str) and (option := self._from_api.get(value)) is not None:
+            return option
+        # Values already in option form (lowercase) are accepted as-is.
         value_lower = str(value).lower()
-        for option in self._select_def["options"]:
-            if option == value_lower:
-                return option  # type: ignore[no-any-return]
-        return None
+        return value_lower if value_lower in self._option_set else None
 
     async def async_select_option(self, option: str) -> None:
         """Set the select option."""
@@ -434,31 +389,23 @@ class AjaxDimmerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
         if not space.hub_id:
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
-        # Get API value from option
-        api_options = self._select_def.get("api_options", {})
-        api_value = api_options.get(option, option)
-        api_key = self._select_def["api_key"]
-        api_nested_key = self._select_def.get("api_nested_key")
-
-        # Build payload
-        if api_nested_key:
-            payload = {api_nested_key: {api_key: api_value}}
-        else:
-            payload = {api_key: api_value}
+        api_value = self._api_options.get(option, option)
+        api_key = self._api_key
+        api_nested_key = self._api_nested_key
 
         try:
             if api_nested_key:
+                payload: dict[str, Any] = {api_nested_key: {api_key: api_value}}
                 await self.coordinator.api.async_update_device_nested(space.hub_id, self._device_id, payload)
             else:
-                await self.coordinator.api.async_update_device(space.hub_id, self._device_id, payload)
+                await self.coordinator.api.async_update_device(space.hub_id, self._device_id, {api_key: api_value})
             _LOGGER.info(
                 "Set %s=%s for device %s",
                 api_key,
                 api_value,
                 self._device_id,
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except AjaxRestApiError as err:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="failed_to_change",
@@ -467,14 +414,12 @@ class AjaxDimmerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
                     "error": str(err),
                 },
             ) from err
+        self._apply_local_value(self._select_def["attr_key"], api_value)
 
 
-class AjaxHandlerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
+class AjaxHandlerSelect(AjaxBaseSelect):
     """Generic select entity created from device handler definitions (for sirens, etc.)."""
 
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.CONFIG
-
     def __init__(
         self,
         coordinator: AjaxDataCoordinator,
@@ -482,36 +427,25 @@ class AjaxHandlerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
         device_id: str,
         select_desc: dict[str, Any],
     ) -> None:
-        super().__init__(coordinator)
-        self._space_id = space_id
-        self._device_id = device_id
+        super().__init__(coordinator, space_id, device_id)
         self._select_desc = select_desc
+        # The descriptor is fixed for the entity's lifetime: resolve the
+        # optional hooks once instead of on every state write / selection.
+        self._value_fn: Callable[[], str] | None = select_desc.get("value_fn")
+        self._api_key: str | None = select_desc.get("api_key")
+        self._api_options: dict[str, str] | None = select_desc.get("api_options")
+        self._api_transform: Callable[[str], Any] | None = select_desc.get("api_transform")
+        self._api_nested_key: str | None = select_desc.get("api_nested_key")
+        self._attr_key: str | None = select_desc.get("attr_key")
 
         self._attr_unique_id = f"{self.coordinator.entry_id}_{device_id}_{select_desc['key']}"
         self._attr_translation_key = select_desc.get("translation_key", select_desc["key"])
         self._attr_options = select_desc.get("options", [])
 
-    def _get_device(self) -> AjaxDevice | None:
-        space = self.coordinator.get_space(self._space_id)
-        return space.devices.get(self._device_id) if space else None
-
-    @property
-    def available(self) -> bool:
-        if not self.coordinator.last_update_success:
-            return False
-        device = self._get_device()
-        return device.online if device else False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={device_identifier(self.coordinator.entry_id, self._device_id)})
-
     @property
     def current_option(self) -> str | None:
-        value_fn = self._select_desc.get("value_fn")
-        if value_fn:
-            return value_fn()  # type: ignore[no-any-return]
-        return None
+        value_fn = self._value_fn
+        return value_fn() if value_fn is not None else None
 
     async def async_select_option(self, option: str) -> None:
         """Change the select option."""
@@ -522,49 +456,45 @@ class AjaxHandlerSelect(CoordinatorEntity[AjaxDataCoordinator], SelectEntity):
         if not space.hub_id:
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="hub_not_found")
 
-        api_key = self._select_desc.get("api_key")
+        api_key = self._api_key
         if not api_key:
             raise HomeAssistantError(translation_domain=DOMAIN, translation_key="no_api_key")
 
         # Transform the option value if needed
-        api_options = self._select_desc.get("api_options")
+        api_options = self._api_options
         if api_options:
             # Use api_options mapping (HA value -> API value)
             api_value = api_options.get(option, option)
         else:
-            api_transform = self._select_desc.get("api_transform")
+            api_transform = self._api_transform
             api_value = api_transform(option) if api_transform else option
 
-        # Build payload (handle nested keys like dimmerSettings.curveType)
-        api_nested_key = self._select_desc.get("api_nested_key")
-        if api_nested_key:
-            payload = {api_nested_key: {api_key: api_value}}
-        else:
-            payload = {api_key: api_value}
-
+        api_nested_key = self._api_nested_key
         try:
             # Use nested update for settings inside nested structures (e.g., dimmerSettings)
             if api_nested_key:
+                payload: dict[str, Any] = {api_nested_key: {api_key: api_value}}
                 await self.coordinator.api.async_update_device_nested(space.hub_id, self._device_id, payload)
             else:
-                await self.coordinator.api.async_update_device(space.hub_id, self._device_id, payload)
+                await self.coordinator.api.async_update_device(space.hub_id, self._device_id, {api_key: api_value})
             _LOGGER.info(
                 "Set %s=%s for device %s",
                 api_key,
                 api_value,
                 self._device_id,
             )
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
+        except AjaxRestApiError as err:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="failed_to_change",
                 translation_placeholders={
-                    "entity": self._select_desc.get("key", "select"),
+                    "entity": self._select_desc["key"],
                     "error": str(err),
                 },
             ) from err
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
+        # Descriptors that name the attribute ``value_fn`` reads get a local
+        # update; the others still need a refresh to show the new value.
+        if self._attr_key:
+            self._apply_local_value(self._attr_key, api_value)
+        else:
+            await self.coordinator.async_request_refresh()
@@ -841,7 +841,12 @@ class AjaxRestClientBase:
                             self.suggested_interval or "N/A",
                         )
 
-                return await response.json()
+                try:
+                    return await response.json()
+                except ValueError as err:
+                    # Malformed body (json.JSONDecodeError): callers only
+                    # handle the API error hierarchy, not decode errors.
+                    raise AjaxRestApiError(f"Invalid JSON response from {endpoint}") from err
 
         except aiohttp.ClientError as err:
             # Transient network errors - retry with backoff
@@ -88,6 +88,7 @@ UPDATE_INTERVAL = 30  # Default poll interval when disarmed (need faster updates
 UPDATE_INTERVAL_ARMED = 60  # Poll interval when armed (SSE/SQS handles real-time)
 UPDATE_INTERVAL_DOOR_SENSORS = 5  # Fast poll interval for door sensors when disarmed
 METADATA_REFRESH_INTERVAL = 3600  # Full metadata refresh every hour (rooms, users, groups)
+DEVICE_UPDATE_BATCH_DELAY = 0.25  # Window for coalescing setting writes to the same device
 
 # Dispatcher signals
 SIGNAL_NEW_DEVICE = f"{DOMAIN}_new_device"
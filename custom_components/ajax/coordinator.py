@@ -132,6 +132,10 @@ class AjaxDataCoordinator(
         # out-of-order. Without this, two automations firing arm() then
         # disarm() within ms can land in the wrong order on Ajax's side.
         self._arm_locks: dict[str, asyncio.Lock] = {}
+        # Setting writes waiting out the batch window, keyed per device so
+        # several sliders moved together become one GET+PUT round-trip
+        # (see AjaxDevicesMixin.async_queue_device_update).
+        self._pending_device_updates: dict[tuple[str, str], tuple[dict[str, Any], asyncio.Future[None]]] = {}
         # Cycle counter for adaptive polling — when SSE/SQS is delivering
         # real-time events, video_edges and smart_locks state is already
         # event-driven, so we only need a periodic REST sync (every Nth tick)
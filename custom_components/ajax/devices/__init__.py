@@ -11,6 +11,7 @@ platforms (binary_sensor, sensor, switch, light, etc.).
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from .base import AjaxDeviceHandler
@@ -73,15 +74,24 @@ DEVICE_HANDLERS: dict[DeviceType, type[AjaxDeviceHandler]] = {
 }
 
 
+@functools.lru_cache(maxsize=128)
+def _normalize_raw_type(raw_type: str) -> str:
+    """Return ``raw_type`` lowercased with underscores and spaces removed.
+
+    Every platform runs the predicates below for every device, and an
+    account only ever reports a handful of distinct model strings.
+    """
+    return raw_type.lower().replace("_", "").replace(" ", "")
+
+
 def is_dimmer_device(device: AjaxDevice) -> bool:
     """Check if device is a LightSwitchDimmer (any dimmer variant)."""
-    raw_type = (device.raw_type or "").lower().replace("_", "").replace(" ", "")
-    return "dimmer" in raw_type
+    return "dimmer" in _normalize_raw_type(device.raw_type or "")
 
 
 def is_lightswitch_device(device: AjaxDevice) -> bool:
     """Check if device is a LightSwitch (non-dimmer)."""
-    raw_type = (device.raw_type or "").lower().replace("_", "").replace(" ", "")
+    raw_type = _normalize_raw_type(device.raw_type or "")
     return "lightswitch" in raw_type and "dimmer" not in raw_type
 
 
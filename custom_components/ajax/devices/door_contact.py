@@ -16,10 +16,12 @@ from .base import AjaxDeviceHandler
 
 # DoorProtect Plus variants exposing shock/tilt configuration (shared by the
 # select and number platforms — single source of truth).
-DOOR_PLUS_DEVICE_TYPES = (
-    "DoorProtectPlus",
-    "DoorProtectPlusFibra",
-    "DoorProtectSPlus",
+DOOR_PLUS_DEVICE_TYPES = frozenset(
+    {
+        "DoorProtectPlus",
+        "DoorProtectPlusFibra",
+        "DoorProtectSPlus",
+    }
 )
 
 
@@ -78,6 +78,7 @@ class SirenHandler(AjaxDeviceHandler):
                     "options": ["disabled", "quiet", "loud", "very_loud"],
                     "value_fn": lambda: str(self.device.attributes.get("siren_volume_level") or "VERY_LOUD").lower(),
                     "api_key": "v2sirenVolumeLevel",
+                    "attr_key": "siren_volume_level",
                     "api_transform": lambda x: x.upper(),
                     "enabled_by_default": True,
                 }
@@ -92,6 +93,7 @@ class SirenHandler(AjaxDeviceHandler):
                     "options": ["quiet", "loud", "very_loud"],
                     "value_fn": lambda: str(self.device.attributes.get("beep_volume_level") or "LOUD").lower(),
                     "api_key": "beepVolumeLevel",
+                    "attr_key": "beep_volume_level",
                     "api_transform": lambda x: x.upper(),
                     "enabled_by_default": True,
                 }
@@ -110,6 +112,7 @@ class SirenHandler(AjaxDeviceHandler):
                     "options": ["1", "2", "3", "5", "10", "15"],
                     "value_fn": self._get_alarm_duration_option,
                     "api_key": "alarmDuration",
+                    "attr_key": "alarm_duration",
                     "api_transform": self._alarm_duration_to_api,
                     "enabled_by_default": True,
                 }
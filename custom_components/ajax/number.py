@@ -20,8 +20,11 @@ from ._discovery import connect_new_entity_signal
 from ._number_entities import (
     DEVICES_WITH_CURRENT_THRESHOLD,
     DEVICES_WITH_DOOR_PLUS_NUMBERS,
+    DIMMER_NUMBER_ATTR_ORDER,
     DIMMER_NUMBER_DEFINITIONS,
+    DIMMER_NUMBER_DEFS_BY_ATTR_KEY,
     LIGHTSWITCH_TOUCH_SENSITIVITY_NUMBER,
+    AjaxBaseNumber,
     AjaxCurrentThresholdNumber,
     AjaxDimmerNumber,
     AjaxDoorPlusBaseNumber,
@@ -37,6 +40,7 @@ __all__ = [
     "DIMMER_NUMBER_DEFINITIONS",
     "DOMAIN",
     "LIGHTSWITCH_TOUCH_SENSITIVITY_NUMBER",
+    "AjaxBaseNumber",
     "AjaxCurrentThresholdNumber",
     "AjaxDimmerNumber",
     "AjaxDoorPlusBaseNumber",
@@ -82,17 +86,16 @@ async def async_setup_entry(
                 )
             )
 
-        if device.type in DEVICES_WITH_CURRENT_THRESHOLD and "current_threshold" in device.attributes:
-            pairs.append(
-                (
-                    f"{coordinator.entry_id}_{device_id}_current_threshold",
-                    AjaxCurrentThresholdNumber(coordinator, space_id, device_id),
-                )
-            )
-
         if device.type in DEVICES_WITH_CURRENT_THRESHOLD:
-            brightness = device.attributes.get("indicationBrightness")
-            if isinstance(brightness, int):
+            attrs = device.attributes
+            if "current_threshold" in attrs:
+                pairs.append(
+                    (
+                        f"{coordinator.entry_id}_{device_id}_current_threshold",
+                        AjaxCurrentThresholdNumber(coordinator, space_id, device_id),
+                    )
+                )
+            if isinstance(attrs.get("indicationBrightness"), int):
                 pairs.append(
                     (
                         f"{coordinator.entry_id}_{device_id}_led_brightness",
@@ -101,14 +104,17 @@ async def async_setup_entry(
                 )
 
         if is_dimmer_device(device):
-            for number_def in DIMMER_NUMBER_DEFINITIONS:
-                if number_def["attr_key"] in device.attributes:
-                    pairs.append(
-                        (
-                            f"{coordinator.entry_id}_{device_id}_{number_def['key']}",
-                            AjaxDimmerNumber(coordinator, space_id, device_id, number_def),
-                        )
+            # One keys-view intersection instead of a membership test per
+            # definition, sorted so entities are created in definition order.
+            present = device.attributes.keys() & DIMMER_NUMBER_DEFS_BY_ATTR_KEY.keys()
+            for attr_key in sorted(present, key=DIMMER_NUMBER_ATTR_ORDER.__getitem__):
+                number_def = DIMMER_NUMBER_DEFS_BY_ATTR_KEY[attr_key]
+                pairs.append(
+                    (
+                        f"{coordinator.entry_id}_{device_id}_{number_def['key']}",
+                        AjaxDimmerNumber(coordinator, space_id, device_id, number_def),
                     )
+                )
 
         if is_lightswitch_device(device) and "touchSensitivity" in device.attributes:
             pairs.append(
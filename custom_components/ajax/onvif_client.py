@@ -15,6 +15,9 @@ import asyncio
 import contextlib
 import logging
 import os
+import re
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -34,14 +37,74 @@ _LOGGER = logging.getLogger(__name__)
 
 # ONVIF ports - Ajax cameras use 8080 for ONVIF
 DEFAULT_ONVIF_PORT = 8080
+# Bound on the initial device-service discovery (update_xaddrs): an
+# unreachable camera must not hold up the other connects in async_start.
+ONVIF_CONNECT_TIMEOUT = 10
 
 # PullPoint subscription settings
 SUBSCRIPTION_TIME = timedelta(minutes=10)
-PULLPOINT_POLL_INTERVAL = 0.5  # Short delay between polls (long poll handles waiting)
+PULLPOINT_POLL_INTERVAL = 0.5  # Base backoff after a failed pull, and the minimum pull period
 PULLPOINT_MAX_BACKOFF = 60  # Max backoff delay in seconds on errors
-
-
-@dataclass
+PULLPOINT_MESSAGE_LIMIT = 500  # Drain an event burst in one PullMessages round-trip
+PULLPOINT_PULL_TIMEOUT = timedelta(seconds=30)  # Long-poll wait when no events
+
+# PullMessages request, built once: the poll loop issues it continuously.
+_PULL_ARGS = {"MessageLimit": PULLPOINT_MESSAGE_LIMIT, "Timeout": PULLPOINT_PULL_TIMEOUT}
+
+# Upper bound on the duplicate-filter cache (one entry per channel/detection
+# type); least recently seen entries are evicted first.
+LAST_STATES_MAX = 256
+
+
+def _is_true(value: str) -> bool:
+    """Return True for an ONVIF boolean SimpleItem value ("true", any case)."""
+    return value.lower() == "true"
+
+
+# Topic families, matched by substring anywhere in the topic (vendor
+# prefixes such as ``tns1:RuleEngine/tnsajax:`` vary between firmwares).
+#
+# Ajax Object Detection (Human, Vehicle, Pet):
+#   tns1:RuleEngine/ObjectDetection/Object (generic ONVIF)
+#   tns1:RuleEngine/tnsajax:ObjectDetector/Detection (Ajax-specific)
+_OBJECT_DETECTION_TOPICS = frozenset({"ObjectDetection/Object", "ObjectDetector/Detection"})
+
+# Object detection ClassTypes (lower-cased) -> AI detection type.
+_CLASS_TO_TYPE: dict[str, str] = {
+    "human": "VIDEO_HUMAN",
+    "person": "VIDEO_HUMAN",
+    **dict.fromkeys(("vehicle", "car", "truck", "bus", "bicycle", "motorcycle", "motorbike"), "VIDEO_VEHICLE"),
+    **dict.fromkeys(("animal", "dog", "cat", "pet"), "VIDEO_PET"),
+}
+_AI_DETECTION_TYPES = ("VIDEO_HUMAN", "VIDEO_VEHICLE", "VIDEO_PET")
+
+# Single-type topics: token -> (detection type, active-flag parser).
+_SINGLE_TYPE_TOPICS: dict[str, tuple[str, Callable[[dict[str, str]], bool]]] = {
+    # tns1:RuleEngine/tnsajax:MotionDetector/Detection
+    # Data: State = true/false (Ajax R&D) or Detected = true/false
+    "MotionDetector/Detection": (
+        "VIDEO_MOTION",
+        lambda data: _is_true(data.get("State", data.get("Detected", "false"))),
+    ),
+    # tns1:VideoSource/MotionAlarm (alternative motion detection topic)
+    # Data: State = true/false
+    "VideoSource/MotionAlarm": ("VIDEO_MOTION", lambda data: _is_true(data.get("State", "false"))),
+    # tns1:RuleEngine/tnsajax:LineDetector/Crossing and
+    # tns1:RuleEngine/LineDetector/Crossed (Ajax R&D)
+    # Data: ClassTypes = "Animal"/"Human"/"Vehicle" or combination; line
+    # crossing is active when ClassTypes is non-empty
+    "LineDetector/Crossing": ("VIDEO_LINE_CROSSING", lambda data: bool(data.get("ClassTypes"))),
+    "LineDetector/Crossed": ("VIDEO_LINE_CROSSING", lambda data: bool(data.get("ClassTypes"))),
+    # tns1:RuleEngine/RingDetector/Detection
+    # Data: Detected = true/false
+    "RingDetector/Detection": ("DOORBELL_RING", lambda data: _is_true(data.get("Detected", "false"))),
+}
+
+# One alternation over every known token replaces a chain of ``in`` scans.
+_TOPIC_RE = re.compile("|".join(re.escape(token) for token in (*_OBJECT_DETECTION_TOPICS, *_SINGLE_TYPE_TOPICS)))
+
+
+@dataclass(slots=True)
 class OnvifDetectionEvent:
     """Represents an ONVIF detection event from Ajax camera."""
 
@@ -50,12 +113,37 @@ class OnvifDetectionEvent:
     detection_type: str  # VIDEO_HUMAN, VIDEO_VEHICLE, VIDEO_PET, VIDEO_MOTION
     active: bool
     rule: str = ""  # Detection zone/rule name (e.g., "Zone Entrée")
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Cheap monotonic capture time; the wall-clock ``timestamp`` is derived
+    # from it only when read, which nothing on the event path does.
+    monotonic_ns: int = field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the (UTC) wall-clock time the event was received."""
+        age_ns = time.monotonic_ns() - self.monotonic_ns
+        return datetime.fromtimestamp((time.time_ns() - age_ns) / 1e9, UTC)
 
     def __str__(self) -> str:
         return f"OnvifDetectionEvent({self.detection_type}, active={self.active}, rule={self.rule})"
 
 
+def _simple_items(element: Any) -> dict[str, str]:
+    """Flatten an ONVIF Source/Data element's ``SimpleItem`` list to ``{Name: Value}``.
+
+    Items without a name or value are dropped; a missing element yields ``{}``.
+    """
+    items = getattr(element, "SimpleItem", None) if element else None
+    if not items:
+        return {}
+    result: dict[str, str] = {}
+    for item in items:
+        name = getattr(item, "Name", None)
+        value = getattr(item, "Value", None)
+        if name and value is not None:
+            result[str(name)] = str(value)
+    return result
+
+
 class AjaxOnvifClient:
     """ONVIF client for a single Ajax camera."""
 
@@ -65,6 +153,7 @@ class AjaxOnvifClient:
         username: str,
         password: str,
         event_callback: Callable[[OnvifDetectionEvent], None] | None = None,
+        batch_event_callback: Callable[[list[OnvifDetectionEvent]], None] | None = None,
     ) -> None:
         """Initialize the ONVIF client.
 
@@ -73,19 +162,29 @@ class AjaxOnvifClient:
             username: ONVIF username
             password: ONVIF password
             event_callback: Callback function for detection events
+            batch_event_callback: Callback receiving all events of one
+                PullMessages response at once (preferred over
+                ``event_callback`` when set)
         """
         self.video_edge = video_edge
         self._username = username
         self._password = password
         self._event_callback = event_callback
+        self._batch_event_callback = batch_event_callback
+        # Events collected while a PullMessages response is being processed.
+        self._batch: list[OnvifDetectionEvent] | None = None
 
         self._camera: ONVIFCamera | None = None
         self._pullpoint_manager: Any = None
+        # PullPoint service proxy of the current manager, fetched once per
+        # subscription instead of on every long poll.
+        self._pullpoint_service: Any = None
         self._running = False
         self._poll_task: asyncio.Task[Any] | None = None
         # Flag set by _on_subscription_lost so _poll_loop reacts immediately.
         self._subscription_lost = False
-        self._last_states: dict[str, bool] = {}  # Cache to filter duplicate events
+        # Cache to filter duplicate events, LRU-bounded by LAST_STATES_MAX
+        self._last_states: OrderedDict[tuple[str, str], bool] = OrderedDict()
 
     @property
     def connected(self) -> bool:
@@ -125,7 +224,8 @@ class AjaxOnvifClient:
             _LOGGER.info("ONVIF: Camera instance created, updating xaddrs...")
 
             # Update camera services
-            await self._camera.update_xaddrs()
+            async with asyncio.timeout(ONVIF_CONNECT_TIMEOUT):
+                await self._camera.update_xaddrs()
 
             _LOGGER.info(
                 "ONVIF: Successfully connected to %s",
@@ -142,6 +242,10 @@ class AjaxOnvifClient:
                 type(err).__name__,
                 err,
             )
+            # Release the transport the half-built camera already opened.
+            if self._camera:
+                with contextlib.suppress(Exception):
+                    await self._camera.close()
             self._camera = None
             return False
 
@@ -163,6 +267,7 @@ class AjaxOnvifClient:
             # alive, leaking one per network blip until async_stop().
             old_manager = self._pullpoint_manager
             self._pullpoint_manager = None
+            self._pullpoint_service = None
             if old_manager is not None:
                 with contextlib.suppress(Exception):
                     await old_manager.shutdown()
@@ -178,6 +283,7 @@ class AjaxOnvifClient:
 
             # Set synchronization point to get current state
             await self._pullpoint_manager.set_synchronization_point()
+            self._pullpoint_service = self._pullpoint_manager.get_service()
 
             _LOGGER.info(
                 "ONVIF: PullPoint subscription active for %s",
@@ -201,6 +307,7 @@ class AjaxOnvifClient:
         Flag the poll loop so it recreates the subscription on the next iteration.
         """
         self._subscription_lost = True
+        self._pullpoint_service = None
         _LOGGER.warning(
             "%s: ONVIF subscription lost, will recreate on next poll",
             self.video_edge.name,
@@ -235,6 +342,7 @@ class AjaxOnvifClient:
                 await self._pullpoint_manager.shutdown()
 
         self._pullpoint_manager = None
+        self._pullpoint_service = None
 
         # Close ONVIFCamera to release HTTP transport sockets
         if self._camera:
@@ -248,7 +356,15 @@ class AjaxOnvifClient:
         )
 
     async def _poll_loop(self) -> None:
-        """Poll for events continuously with auto-reconnect and backoff."""
+        """Poll for events continuously with auto-reconnect and backoff.
+
+        PullMessages is itself a long poll, so a successful pull re-arms
+        immediately once it has lasted at least ``PULLPOINT_POLL_INTERVAL``;
+        a quicker one (a camera ignoring the Timeout, or failing instantly
+        with a "timeout" fault) is padded to that period so it cannot spin.
+        The loop sleeps with exponential backoff when a pull failed or there
+        was no live subscription to pull from.
+        """
         backoff = PULLPOINT_POLL_INTERVAL
 
         while self._running:
@@ -258,19 +374,19 @@ class AjaxOnvifClient:
                 needs_recreate = self._subscription_lost or (
                     self._pullpoint_manager is not None and self._pullpoint_manager.closed
                 )
-                if needs_recreate:
-                    _LOGGER.info(
-                        "%s: ONVIF subscription lost, recreating...",
-                        self.video_edge.name,
-                    )
-                    self._subscription_lost = False
-                    if not await self.async_subscribe_events():
-                        backoff = min(backoff * 2, PULLPOINT_MAX_BACKOFF)
-                        await asyncio.sleep(backoff)
-                        continue
-
-                await self._pull_messages()
-                backoff = PULLPOINT_POLL_INTERVAL  # Reset on success
+                if needs_recreate and not await self._resubscribe():
+                    backoff = min(backoff * 2, PULLPOINT_MAX_BACKOFF)
+                    await asyncio.sleep(backoff)
+                    continue
+
+                started = time.monotonic()
+                if await self._pull_messages():
+                    backoff = PULLPOINT_POLL_INTERVAL  # Reset on success
+                    remaining = PULLPOINT_POLL_INTERVAL - (time.monotonic() - started)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+                    continue
+                backoff = min(backoff * 2, PULLPOINT_MAX_BACKOFF)
             except asyncio.CancelledError:
                 break
             except Exception as err:
@@ -283,36 +399,64 @@ class AjaxOnvifClient:
 
             await asyncio.sleep(backoff)
 
-    async def _pull_messages(self) -> None:
-        """Pull messages from the PullPoint."""
+    async def _resubscribe(self) -> bool:
+        """Recreate a lost PullPoint subscription.
+
+        The lost flag is only cleared once a new subscription is up: a
+        failed attempt leaves no manager behind, and without the flag the
+        poll loop would keep pulling from nothing instead of retrying.
+        """
+        _LOGGER.info(
+            "%s: ONVIF subscription lost, recreating...",
+            self.video_edge.name,
+        )
+        self._subscription_lost = True
+        if not await self.async_subscribe_events():
+            return False
+        self._subscription_lost = False
+        return True
+
+    async def _pull_messages(self) -> bool:
+        """Pull messages from the PullPoint.
+
+        Returns:
+            True once a long poll completed (with or without messages),
+            False when nothing could be pulled and the caller should back off.
+        """
         if not self._pullpoint_manager or self._pullpoint_manager.closed:
-            return
+            return False
 
         try:
-            # Get the service from the manager
-            service = self._pullpoint_manager.get_service()
-
-            response = await service.PullMessages(
-                {
-                    "MessageLimit": 100,
-                    "Timeout": timedelta(seconds=30),
-                }
-            )
+            service = self._pullpoint_service
+            if service is None:
+                service = self._pullpoint_service = self._pullpoint_manager.get_service()
 
-            if response and hasattr(response, "NotificationMessage"):
-                messages = response.NotificationMessage
-                if messages:
-                    for msg in messages:
-                        await self._process_message(msg)
+            response = await service.PullMessages(_PULL_ARGS)
+
+            # Idle long polls (the common case) come back empty: stop here.
+            messages = getattr(response, "NotificationMessage", None)
+            if not messages:
+                return True
+
+            self._batch = []
+            try:
+                for msg in messages:
+                    await self._process_message(msg)
+            finally:
+                batch, self._batch = self._batch, None
+            self._flush_batch(batch)
 
         except (ONVIFError, Fault, TimeoutError) as err:
             # Timeout is normal when no events
-            if "timeout" not in str(err).lower():
-                _LOGGER.debug(
-                    "%s: PullMessages error: %s",
-                    self.video_edge.name,
-                    err,
-                )
+            if "timeout" in str(err).lower():
+                return True
+            _LOGGER.debug(
+                "%s: PullMessages error: %s",
+                self.video_edge.name,
+                err,
+            )
+            return False
+        return True
 
     async def _process_message(self, msg: Any) -> None:
         """Process an ONVIF notification message.
@@ -320,39 +464,37 @@ class AjaxOnvifClient:
         Args:
             msg: The ONVIF notification message
         """
+        # Nobody is listening (e.g. a client probed before the manager wires
+        # its callback): skip parsing altogether.
+        if not self._has_listener:
+            return
+
+        # Incomplete messages fall out through getattr defaults; the single
+        # try below only covers genuinely malformed payloads.
         try:
             # Extract topic
-            topic = None
-            if hasattr(msg, "Topic") and msg.Topic:
-                topic_value = msg.Topic._value_1
-                if topic_value:
-                    topic = str(topic_value)
-
+            topic = getattr(getattr(msg, "Topic", None), "_value_1", None)
             if not topic:
                 return
 
             # Extract message data
-            message_data = None
-            if hasattr(msg, "Message") and msg.Message:
-                message_data = msg.Message._value_1
-
+            message_data = getattr(getattr(msg, "Message", None), "_value_1", None)
             if not message_data:
                 return
 
+            # Flatten Source/Data SimpleItems once; both parsers read the dicts.
+            source_items = _simple_items(getattr(message_data, "Source", None))
+            data_items = _simple_items(getattr(message_data, "Data", None))
+
             # Extract source info (channel + rule)
-            channel_id, rule = self._extract_source_info(message_data)
+            channel_id, rule = self._extract_source_info(source_items)
 
             # Parse based on topic
-            event = self._parse_event(topic, message_data, channel_id, rule)
+            event = self._parse_event(str(topic), data_items, channel_id, rule)
 
-            if event and self._event_callback:
-                # Filter duplicate events using state cache
-                state_key = f"{event.channel_id}_{event.detection_type}"
-                last_state = self._last_states.get(state_key)
-
-                if last_state != event.active:
-                    # State changed, update cache and notify
-                    self._last_states[state_key] = event.active
+            # Filter duplicate events using state cache
+            if event and self._is_state_change(event):
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         "%s: ONVIF %s %s (channel %s)",
                         self.video_edge.name,
@@ -360,7 +502,7 @@ class AjaxOnvifClient:
                         "active" if event.active else "cleared",
                         event.channel_id,
                     )
-                    self._event_callback(event)
+                self._emit(event)
 
         except Exception as err:
             _LOGGER.debug(
@@ -369,157 +511,120 @@ class AjaxOnvifClient:
                 err,
             )
 
-    def _extract_source_info(self, message_data: Any) -> tuple[str, str]:
-        """Extract channel ID and rule name from message source.
+    @property
+    def _has_listener(self) -> bool:
+        """Return True if detection events have somewhere to go."""
+        return self._event_callback is not None or self._batch_event_callback is not None
+
+    def _emit(self, event: OnvifDetectionEvent) -> None:
+        """Queue ``event`` for delivery on the next loop iteration.
+
+        Inside a PullMessages response the event joins the current batch;
+        otherwise it is delivered on its own. ``call_soon`` keeps the
+        coordinator fan-out off the polling path and preserves order.
+        """
+        if self._batch is not None:
+            self._batch.append(event)
+        else:
+            self._flush_batch([event])
+
+    def _flush_batch(self, batch: list[OnvifDetectionEvent]) -> None:
+        """Deliver ``batch`` through the batch callback, or event by event."""
+        if not batch:
+            return
+        loop = asyncio.get_running_loop()
+        if self._batch_event_callback is not None:
+            loop.call_soon(self._batch_event_callback, batch)
+        elif self._event_callback is not None:
+            for event in batch:
+                loop.call_soon(self._event_callback, event)
+
+    def _is_state_change(self, event: OnvifDetectionEvent) -> bool:
+        """Record ``event`` in the duplicate filter; return True if its state changed.
+
+        The cache is an LRU capped at ``LAST_STATES_MAX`` so channels that
+        disappear (NVR swaps, renumbered sources) cannot grow it forever.
+        """
+        last_states = self._last_states
+        state_key = (event.channel_id, event.detection_type)
+        if last_states.get(state_key) == event.active:
+            last_states.move_to_end(state_key)
+            return False
+        last_states[state_key] = event.active
+        last_states.move_to_end(state_key)
+        if len(last_states) > LAST_STATES_MAX:
+            last_states.popitem(last=False)
+        return True
+
+    @staticmethod
+    def _extract_source_info(source_items: dict[str, str]) -> tuple[str, str]:
+        """Extract channel ID and rule name from the flattened message source.
 
         Returns:
             Tuple of (channel_id, rule_name)
         """
-        channel_id = "0"
-        rule = ""
-        try:
-            if hasattr(message_data, "Source") and message_data.Source:
-                source = message_data.Source
-                if hasattr(source, "SimpleItem"):
-                    for item in source.SimpleItem:
-                        name = getattr(item, "Name", None)
-                        value = str(getattr(item, "Value", ""))
-                        if name == "VideoSourceToken":
-                            if "-" in value:
-                                channel_id = value.split("-")[-1]
-                        elif name == "Rule":
-                            rule = value
-        except Exception as err:
-            _LOGGER.debug("%s: Error extracting source info: %s", self.video_edge.name, err)
-        return channel_id, rule
+        token = source_items.get("VideoSourceToken", "")
+        channel_id = token.rsplit("-", 1)[-1] if "-" in token else "0"
+        return channel_id, source_items.get("Rule", "")
 
     def _parse_event(
-        self, topic: str, message_data: Any, channel_id: str, rule: str = ""
+        self, topic: str, data_items: dict[str, str], channel_id: str, rule: str = ""
     ) -> OnvifDetectionEvent | None:
         """Parse ONVIF event into detection event.
 
         Args:
             topic: The event topic
-            message_data: The message data
+            data_items: The message Data SimpleItems, flattened by ``_simple_items``
             channel_id: The channel ID
             rule: The detection zone/rule name
 
         Returns:
-            OnvifDetectionEvent if parsed successfully, None otherwise
+            OnvifDetectionEvent, or None for topics this client does not handle
         """
-        try:
-            # Extract data items
-            data_items = {}
-            if hasattr(message_data, "Data") and message_data.Data:
-                data = message_data.Data
-                if hasattr(data, "SimpleItem"):
-                    for item in data.SimpleItem:
-                        name = getattr(item, "Name", None)
-                        value = getattr(item, "Value", None)
-                        if name and value is not None:
-                            data_items[str(name)] = str(value)
-
-            # Parse Ajax Object Detection (Human, Vehicle, Pet)
-            # Topic variants:
-            #   tns1:RuleEngine/ObjectDetection/Object (generic ONVIF)
-            #   tns1:RuleEngine/tnsajax:ObjectDetector/Detection (Ajax-specific)
-            if "ObjectDetection/Object" in topic or "ObjectDetector/Detection" in topic:
-                class_types_raw = data_items.get("ClassTypes", "").lower()
-                # Ajax can send comma-separated: "Animal,Human,Vehicle"
-                class_types = [c.strip() for c in class_types_raw.split(",") if c.strip()]
-
-                all_ai_types = {"VIDEO_HUMAN", "VIDEO_VEHICLE", "VIDEO_PET"}
-                detection_types: set[str] = set()
-                for ct in class_types:
-                    if ct in ("human", "person"):
-                        detection_types.add("VIDEO_HUMAN")
-                    elif ct in ("vehicle", "car", "truck", "bus", "bicycle", "motorcycle", "motorbike"):
-                        detection_types.add("VIDEO_VEHICLE")
-                    elif ct in ("animal", "dog", "cat", "pet"):
-                        detection_types.add("VIDEO_PET")
-
-                # Emit active for detected types, cleared for others
-                first_event = None
-                for det_type in all_ai_types:
-                    is_active = det_type in detection_types
-                    evt = OnvifDetectionEvent(
-                        video_edge_id=self.video_edge.id,
-                        channel_id=channel_id,
-                        detection_type=det_type,
-                        active=is_active,
-                        rule=rule,
-                    )
-                    if first_event is None and is_active:
-                        first_event = evt
-                    elif self._event_callback:
-                        state_key = f"{evt.channel_id}_{evt.detection_type}"
-                        if self._last_states.get(state_key) != evt.active:
-                            self._last_states[state_key] = evt.active
-                            self._event_callback(evt)
-
-                return first_event
-
-            # Parse Ajax Motion Detection
-            # Topic: tns1:RuleEngine/tnsajax:MotionDetector/Detection
-            # Data: State = true/false (Ajax R&D) or Detected = true/false
-            if "MotionDetector/Detection" in topic:
-                detected = data_items.get("State", data_items.get("Detected", "false")).lower() == "true"
-                return OnvifDetectionEvent(
-                    video_edge_id=self.video_edge.id,
-                    channel_id=channel_id,
-                    detection_type="VIDEO_MOTION",
-                    active=detected,
-                    rule=rule,
-                )
-
-            # Parse VideoSource/MotionAlarm (alternative motion detection topic)
-            # Topic: tns1:VideoSource/MotionAlarm
-            # Data: State = true/false
-            if "VideoSource/MotionAlarm" in topic:
-                state = data_items.get("State", "false").lower() == "true"
-                return OnvifDetectionEvent(
-                    video_edge_id=self.video_edge.id,
-                    channel_id=channel_id,
-                    detection_type="VIDEO_MOTION",
-                    active=state,
-                    rule=rule,
-                )
-
-            # Parse Ajax Line Crossing Detection
-            # Topic variants:
-            #   tns1:RuleEngine/tnsajax:LineDetector/Crossing
-            #   tns1:RuleEngine/LineDetector/Crossed (Ajax R&D)
-            # Data: ClassTypes = "Animal"/"Human"/"Vehicle" or combination
-            if "LineDetector/Crossing" in topic or "LineDetector/Crossed" in topic:
-                class_type = data_items.get("ClassTypes", "").lower()
-                # Line crossing is active when ClassTypes is non-empty
-                active = bool(class_type)
-                return OnvifDetectionEvent(
-                    video_edge_id=self.video_edge.id,
-                    channel_id=channel_id,
-                    detection_type="VIDEO_LINE_CROSSING",
-                    active=active,
-                    rule=rule,
-                )
+        # One precompiled scan picks the topic family (see _TOPIC_RE).
+        match = _TOPIC_RE.search(topic)
+        if match is None:
+            return None
+        token = match.group()
+
+        if token in _OBJECT_DETECTION_TOPICS:
+            return self._parse_object_detection(data_items, channel_id, rule)
+
+        detection_type, is_active = _SINGLE_TYPE_TOPICS[token]
+        return OnvifDetectionEvent(
+            video_edge_id=self.video_edge.id,
+            channel_id=channel_id,
+            detection_type=detection_type,
+            active=is_active(data_items),
+            rule=rule,
+        )
 
-            # Parse Ajax Doorbell Ring
-            # Topic: tns1:RuleEngine/RingDetector/Detection
-            # Data: Detected = true/false
-            if "RingDetector/Detection" in topic:
-                detected = data_items.get("Detected", "false").lower() == "true"
-                return OnvifDetectionEvent(
-                    video_edge_id=self.video_edge.id,
-                    channel_id=channel_id,
-                    detection_type="DOORBELL_RING",
-                    active=detected,
-                    rule=rule,
-                )
+    def _parse_object_detection(
+        self, data_items: dict[str, str], channel_id: str, rule: str
+    ) -> OnvifDetectionEvent | None:
+        """Parse Ajax Object Detection (Human, Vehicle, Pet).
 
-        except Exception as err:
-            _LOGGER.debug(
-                "%s: Error parsing ONVIF event: %s",
-                self.video_edge.name,
-                err,
+        Emits cleared events for the AI types absent from ``ClassTypes``
+        through the callback and returns the first active one.
+        """
+        # Ajax can send comma-separated: "Animal,Human,Vehicle"
+        class_types = data_items.get("ClassTypes", "").lower().split(",")
+        detection_types = {_CLASS_TO_TYPE.get(ct.strip()) for ct in class_types}
+
+        # Emit active for detected types, cleared for others
+        first_event = None
+        for det_type in _AI_DETECTION_TYPES:
+            is_active = det_type in detection_types
+            evt = OnvifDetectionEvent(
+                video_edge_id=self.video_edge.id,
+                channel_id=channel_id,
+                detection_type=det_type,
+                active=is_active,
+                rule=rule,
             )
+            if first_event is None and is_active:
+                first_event = evt
+            elif self._has_listener and self._is_state_change(evt):
+                self._emit(evt)
 
-        return None
+        return first_event
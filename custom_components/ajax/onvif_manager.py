@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 from .models import VideoEdgeType
@@ -20,6 +21,40 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _select_targets(
+    video_edges: list[AjaxVideoEdge],
+) -> tuple[list[AjaxVideoEdge], dict[str, tuple[str, ...]]]:
+    """Return the video edges to open an ONVIF subscription on, and their aliases.
+
+    NVRs are skipped (see ``AjaxOnvifManager.async_start``). Every client
+    talks to ``DEFAULT_ONVIF_PORT``, so edges sharing an IP address would
+    open several PullPoint subscriptions on the same endpoint: only the
+    first edge seen for an address is targeted, and the aliases map gives
+    it the ids of the other edges on that address so the manager can copy
+    its events to them. Edges without an IP are kept so they still count
+    as (failed) targets.
+    """
+    targets: list[AjaxVideoEdge] = []
+    owners: dict[str, str] = {}
+    aliases: dict[str, list[str]] = {}
+    for ve in video_edges:
+        if ve.video_edge_type == VideoEdgeType.NVR:
+            continue
+        if ve.ip_address:
+            owner_id = owners.get(ve.ip_address)
+            if owner_id is not None:
+                _LOGGER.debug(
+                    "ONVIF: %s shares %s with another device - reusing its subscription",
+                    ve.name,
+                    ve.ip_address,
+                )
+                aliases.setdefault(owner_id, []).append(ve.id)
+                continue
+            owners[ve.ip_address] = ve.id
+        targets.append(ve)
+    return targets, {owner_id: tuple(ids) for owner_id, ids in aliases.items()}
+
+
 class AjaxOnvifManager:
     """Manages ONVIF connections for all Ajax video edge devices."""
 
@@ -28,6 +63,7 @@ class AjaxOnvifManager:
         username: str,
         password: str,
         event_callback: Callable[[OnvifDetectionEvent], None] | None = None,
+        batch_event_callback: Callable[[list[OnvifDetectionEvent]], None] | None = None,
     ) -> None:
         """Initialize the ONVIF manager.
 
@@ -35,18 +71,31 @@ class AjaxOnvifManager:
             username: ONVIF username (same for all cameras)
             password: ONVIF password (same for all cameras)
             event_callback: Callback function for detection events
+            batch_event_callback: Callback for all events of one
+                PullMessages response (see ``AjaxOnvifClient``)
         """
         self._username = username
         self._password = password
         self._event_callback = event_callback
+        self._batch_event_callback = batch_event_callback
         self._clients: dict[str, AjaxOnvifClient] = {}
         # IDs of the cameras the manager is *trying* to connect (non-NVR),
         # tracked independently of success so target_count stays the true
         # denominator even when a camera fails to connect (failed clients are
         # never inserted into _clients). See target_count / connected_count.
         self._target_ids: set[str] = set()
-        # Serialise add/remove so concurrent callers cannot duplicate clients.
-        self._clients_lock = asyncio.Lock()
+        # Targeted edge id -> ids of the edges sharing its IP address, which
+        # get a copy of its events instead of a subscription of their own.
+        self._edge_aliases: dict[str, tuple[str, ...]] = {}
+        # Per-camera locks serialise add/remove of the *same* camera so
+        # concurrent callers cannot duplicate its client, while different
+        # cameras still connect in parallel (a single manager-wide lock made
+        # the asyncio.gather in async_start effectively sequential).
+        self._edge_locks: dict[str, asyncio.Lock] = {}
+        # Set by async_stop, which takes no edge lock: an add still
+        # connecting when stop runs checks it before publishing its client,
+        # so the client cannot outlive the manager and keep polling.
+        self._stopping = False
 
     @property
     def connected_count(self) -> int:
@@ -66,6 +115,23 @@ class AjaxOnvifManager:
         """
         return len(self._target_ids)
 
+    def _on_events(self, events: list[OnvifDetectionEvent]) -> None:
+        """Deliver one client batch, copied to the edges sharing its IP."""
+        fanned = list(events)
+        for event in events:
+            fanned.extend(
+                replace(event, video_edge_id=alias_id) for alias_id in self._edge_aliases.get(event.video_edge_id, ())
+            )
+        if self._batch_event_callback is not None:
+            self._batch_event_callback(fanned)
+        elif self._event_callback is not None:
+            for event in fanned:
+                self._event_callback(event)
+
+    def _edge_lock(self, video_edge_id: str) -> asyncio.Lock:
+        """Return the add/remove lock for one camera."""
+        return self._edge_locks.setdefault(video_edge_id, asyncio.Lock())
+
     async def async_add_video_edge(self, video_edge: AjaxVideoEdge) -> bool:
         """Add a video edge device and start ONVIF connection.
 
@@ -82,7 +148,7 @@ class AjaxOnvifManager:
             )
             return False
 
-        async with self._clients_lock:
+        async with self._edge_lock(video_edge.id):
             # Skip if already connected
             if video_edge.id in self._clients:
                 existing = self._clients[video_edge.id]
@@ -97,7 +163,12 @@ class AjaxOnvifManager:
                 video_edge=video_edge,
                 username=self._username,
                 password=self._password,
-                event_callback=self._event_callback,
+                # Routed through the manager so aliases get the events too.
+                batch_event_callback=(
+                    self._on_events
+                    if self._event_callback is not None or self._batch_event_callback is not None
+                    else None
+                ),
             )
 
             # Try to connect
@@ -112,6 +183,10 @@ class AjaxOnvifManager:
             # Start polling
             await client.async_start_polling()
 
+            if self._stopping:
+                await client.async_stop()
+                return False
+
             self._clients[video_edge.id] = client
 
         _LOGGER.info(
@@ -127,8 +202,10 @@ class AjaxOnvifManager:
         Args:
             video_edge_id: The ID of the video edge to remove
         """
-        async with self._clients_lock:
+        async with self._edge_lock(video_edge_id):
             client = self._clients.pop(video_edge_id, None)
+            # Removed edges are gone from the targets; don't keep their lock.
+            self._edge_locks.pop(video_edge_id, None)
         if client:
             await client.async_stop()
             _LOGGER.debug("ONVIF client stopped for %s", video_edge_id)
@@ -154,8 +231,8 @@ class AjaxOnvifManager:
         _LOGGER.info("ONVIF: Starting with configured credentials")
 
         nvrs = [ve for ve in video_edges if ve.video_edge_type == VideoEdgeType.NVR]
-        cameras = [ve for ve in video_edges if ve.video_edge_type != VideoEdgeType.NVR]
-        targets = cameras
+        targets, self._edge_aliases = _select_targets(video_edges)
+        cameras = targets
         self._target_ids = {ve.id for ve in targets}
 
         if nvrs:
@@ -188,9 +265,9 @@ class AjaxOnvifManager:
 
     async def async_stop(self) -> None:
         """Stop all ONVIF connections."""
-        async with self._clients_lock:
-            clients = list(self._clients.values())
-            self._clients.clear()
+        self._stopping = True
+        clients = list(self._clients.values())
+        self._clients.clear()
         if clients:
             results = await asyncio.gather(*(c.async_stop() for c in clients), return_exceptions=True)
             for res in results:
@@ -207,17 +284,27 @@ class AjaxOnvifManager:
         Args:
             video_edges: Current list of video edge devices
         """
-        targets = [ve for ve in video_edges if ve.video_edge_type != VideoEdgeType.NVR]
+        targets, self._edge_aliases = _select_targets(video_edges)
 
         current_ids = {ve.id for ve in targets}
         self._target_ids = current_ids
         existing_ids = set(self._clients.keys())
 
         # Remove devices no longer in targets
-        for video_edge_id in existing_ids - current_ids:
-            await self.async_remove_video_edge(video_edge_id)
-
-        # Add new devices
-        for ve in targets:
-            if ve.id not in existing_ids and ve.ip_address:
-                await self.async_add_video_edge(ve)
+        results = await asyncio.gather(
+            *(self.async_remove_video_edge(video_edge_id) for video_edge_id in existing_ids - current_ids),
+            return_exceptions=True,
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                _LOGGER.warning("ONVIF client removal failed: %s", res)
+
+        # Add new devices concurrently: each connect + subscribe can take
+        # seconds, so a batch of cameras reappearing must not queue up.
+        results = await asyncio.gather(
+            *(self.async_add_video_edge(ve) for ve in targets if ve.id not in existing_ids and ve.ip_address),
+            return_exceptions=True,
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                _LOGGER.warning("ONVIF client connect failed: %s", res)
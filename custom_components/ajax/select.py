@@ -20,6 +20,7 @@ from ._discovery import connect_new_entity_signal
 from ._select_entities import (
     DEVICES_WITH_DOOR_PLUS_SELECTS,
     DIMMER_SELECT_DEFINITIONS,
+    DIMMER_SELECT_ROOT_ATTRS,
     INDICATION_MODE_OPTIONS,
     INDICATION_MODE_VALUES,
     LED_BRIGHTNESS_OPTIONS,
@@ -27,11 +28,13 @@ from ._select_entities import (
     SELECT_DEVICE_HANDLERS,
     SHOCK_SENSITIVITY_OPTIONS,
     SHOCK_SENSITIVITY_VALUES,
+    AjaxBaseSelect,
     AjaxDimmerSelect,
     AjaxDoorPlusBaseSelect,
     AjaxHandlerSelect,
     AjaxIndicationModeSelect,
     AjaxLedBrightnessSelect,
+    AjaxMappedAttributeSelect,
     AjaxShockSensitivitySelect,
     _get_dimmer_attr,
 )
@@ -42,6 +45,7 @@ from .models import DeviceType
 __all__ = [
     "DEVICES_WITH_DOOR_PLUS_SELECTS",
     "DIMMER_SELECT_DEFINITIONS",
+    "DIMMER_SELECT_ROOT_ATTRS",
     "DOMAIN",
     "INDICATION_MODE_OPTIONS",
     "INDICATION_MODE_VALUES",
@@ -50,11 +54,13 @@ __all__ = [
     "SELECT_DEVICE_HANDLERS",
     "SHOCK_SENSITIVITY_OPTIONS",
     "SHOCK_SENSITIVITY_VALUES",
+    "AjaxBaseSelect",
     "AjaxDimmerSelect",
     "AjaxDoorPlusBaseSelect",
     "AjaxHandlerSelect",
     "AjaxIndicationModeSelect",
     "AjaxLedBrightnessSelect",
+    "AjaxMappedAttributeSelect",
     "AjaxShockSensitivitySelect",
     "async_setup_entry",
 ]
@@ -86,9 +92,10 @@ async def async_setup_entry(
             return []
 
         pairs: list[tuple[str, SelectEntity]] = []
+        attrs = device.attributes
+        device_type = device.type
 
-        device_type = device.raw_type or ""
-        if device_type in DEVICES_WITH_DOOR_PLUS_SELECTS:
+        if (device.raw_type or "") in DEVICES_WITH_DOOR_PLUS_SELECTS:
             pairs.append(
                 (
                     f"{entry.entry_id}_{device_id}_shock_sensitivity",
@@ -96,33 +103,35 @@ async def async_setup_entry(
                 )
             )
 
-        if device.type == DeviceType.SOCKET and device.attributes.get("indicationBrightness") in ["MIN", "MAX"]:
-            pairs.append(
-                (
-                    f"{entry.entry_id}_{device_id}_led_brightness",
-                    AjaxLedBrightnessSelect(coordinator, space_id, device_id),
+        if device_type == DeviceType.SOCKET:
+            if attrs.get("indicationBrightness") in ("MIN", "MAX"):
+                pairs.append(
+                    (
+                        f"{entry.entry_id}_{device_id}_led_brightness",
+                        AjaxLedBrightnessSelect(coordinator, space_id, device_id),
+                    )
                 )
-            )
-
-        if device.type == DeviceType.SOCKET and "indicationMode" in device.attributes:
-            pairs.append(
-                (
-                    f"{entry.entry_id}_{device_id}_indication_mode",
-                    AjaxIndicationModeSelect(coordinator, space_id, device_id),
+            if "indicationMode" in attrs:
+                pairs.append(
+                    (
+                        f"{entry.entry_id}_{device_id}_indication_mode",
+                        AjaxIndicationModeSelect(coordinator, space_id, device_id),
+                    )
                 )
-            )
 
+        # Dimmers and plain light switches are mutually exclusive
+        # (is_lightswitch_device excludes dimmers), hence the elif.
         if is_dimmer_device(device):
-            for select_def in DIMMER_SELECT_DEFINITIONS:
-                if _get_dimmer_attr(device, select_def["attr_key"]) is not None:
-                    pairs.append(
-                        (
-                            f"{entry.entry_id}_{device_id}_{select_def['key']}",
-                            AjaxDimmerSelect(coordinator, space_id, device_id, select_def),
+            if not attrs.keys().isdisjoint(DIMMER_SELECT_ROOT_ATTRS):
+                for select_def in DIMMER_SELECT_DEFINITIONS:
+                    if _get_dimmer_attr(device, select_def["attr_key"]) is not None:
+                        pairs.append(
+                            (
+                                f"{entry.entry_id}_{device_id}_{select_def['key']}",
+                                AjaxDimmerSelect(coordinator, space_id, device_id, select_def),
+                            )
                         )
-                    )
-
-        if is_lightswitch_device(device) and "touchMode" in device.attributes:
+        elif is_lightswitch_device(device) and "touchMode" in attrs:
             pairs.append(
                 (
                     f"{entry.entry_id}_{device_id}_{LIGHTSWITCH_TOUCH_MODE_SELECT['key']}",
@@ -130,17 +139,15 @@ async def async_setup_entry(
                 )
             )
 
-        handler_class = SELECT_DEVICE_HANDLERS.get(device.type)
+        handler_class = SELECT_DEVICE_HANDLERS.get(device_type)
         if handler_class:
-            handler = handler_class(device)
-            if hasattr(handler, "get_selects"):
-                for select_desc in handler.get_selects():
-                    pairs.append(
-                        (
-                            f"{entry.entry_id}_{device_id}_{select_desc['key']}",
-                            AjaxHandlerSelect(coordinator, space_id, device_id, select_desc),
-                        )
+            for select_desc in handler_class(device).get_selects():
+                pairs.append(
+                    (
+                        f"{entry.entry_id}_{device_id}_{select_desc['key']}",
+                        AjaxHandlerSelect(coordinator, space_id, device_id, select_desc),
                     )
+                )
 
         return pairs
 
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
 from collections.abc import Callable
 from datetime import UTC, datetime
@@ -110,6 +111,8 @@ class SQSManager(EventHandlerMixin):
         # Track scheduled call_later handles so we can cancel them on stop()
         # and strong-ref background tasks so they are not GC'd mid-flight.
         self._pending_timers: set[asyncio.TimerHandle] = set()
+        # (space, video edge, channel, detection type) -> pending auto-reset
+        self._video_resets: dict[tuple[str, str, str | None, str], asyncio.TimerHandle] = {}
         self._background_tasks: set[asyncio.Task[Any]] = set()
         # Serialise security_event handlers so overlapping events cannot
         # flip the coordinator skip-flag in a racy way.
@@ -137,21 +140,23 @@ class SQSManager(EventHandlerMixin):
             _LOGGER.error("Failed to start SQS Manager: %s", err)
             return False
 
-    def _schedule_later(self, delay: float, callback: Callable[[], Any]) -> None:
+    def _schedule_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> asyncio.TimerHandle:
         """Wrap hass.loop.call_later to track the handle for cancellation.
 
         The handle removes itself from ``_pending_timers`` once it fires, so the
         set only ever holds genuinely pending timers (otherwise every doorbell
         ring / video detection would leak a spent TimerHandle for the lifetime
-        of the integration).
+        of the integration). Extra positional *args* are handed to
+        ``call_later`` like the loop API, so callers need no lambda per timer.
         """
 
-        def _wrapped() -> None:
+        def _wrapped(*cb_args: Any) -> None:
             self._pending_timers.discard(handle)
-            callback()
+            callback(*cb_args)
 
-        handle = self.coordinator.hass.loop.call_later(delay, _wrapped)
+        handle = self.coordinator.hass.loop.call_later(delay, _wrapped, *args)
         self._pending_timers.add(handle)
+        return handle
 
     def _spawn_background(self, coro: Any) -> None:
         """Create a tracked background task so it cannot be GC'd mid-flight."""
@@ -165,6 +170,7 @@ class SQSManager(EventHandlerMixin):
         for handle in list(self._pending_timers):
             handle.cancel()
         self._pending_timers.clear()
+        self._video_resets.clear()
         try:
             # close() stops the receive loop itself before releasing the client.
             await self.sqs_client.close()
@@ -197,7 +203,9 @@ class SQSManager(EventHandlerMixin):
 
             # Extract event info
             event = event_data.get("event", {})
-            event_tag = event.get("eventTag", "").lower()
+            # Interned so lookups in the event maps (literal, hence interned,
+            # keys) match on identity; the set of tags is small and fixed.
+            event_tag = sys.intern(event.get("eventTag", "").lower())
             event_type = event.get("eventTypeV2", "")
             event_code = event.get("eventCode", "")  # M_XX_YY format
             hub_id = event.get("hubId", "")
@@ -771,7 +779,9 @@ class SQSManager(EventHandlerMixin):
             # Schedule auto-reset of doorbell_ring state after 10 seconds
             self._schedule_later(
                 10.0,
-                lambda: self._reset_doorbell_ring(space.id, device.id),
+                self._reset_doorbell_ring,
+                space.id,
+                device.id,
             )
         else:
             # Search in video_edges (Ajax Doorbell is a Video Edge)
@@ -995,11 +1005,7 @@ class SQSManager(EventHandlerMixin):
         Updates the channel state to reflect the active detection.
         """
         # Determine the detection type from eventTag or eventTypeV2
-        detection_type = None
-        if event_tag in VIDEO_EVENTS:
-            detection_type = VIDEO_EVENTS[event_tag]
-        elif event_type in VIDEO_EVENT_TYPES:
-            detection_type = VIDEO_EVENT_TYPES[event_type]
+        detection_type = VIDEO_EVENTS.get(event_tag) or VIDEO_EVENT_TYPES.get(event_type)
 
         if not detection_type:
             _LOGGER.debug(
@@ -1032,11 +1038,15 @@ class SQSManager(EventHandlerMixin):
             channel_id or "default",
         )
 
-        # Schedule auto-reset after detection timeout (30 seconds)
-        self._schedule_later(
-            30.0,
-            lambda: self._reset_video_detection(space.id, video_edge.id, channel_id, detection_type),
-        )
+        # Schedule auto-reset after detection timeout (30 seconds), counted
+        # from the latest event: a burst re-arms one timer per detection
+        # instead of stacking timers that clear it early and push repeatedly.
+        key = (space.id, video_edge.id, channel_id, detection_type)
+        previous = self._video_resets.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+            self._pending_timers.discard(previous)
+        self._video_resets[key] = self._schedule_later(30.0, self._reset_video_detection, *key)
 
         return True
 
@@ -1159,6 +1169,7 @@ class SQSManager(EventHandlerMixin):
         detection_type: str,
     ) -> None:
         """Reset video detection after timeout (called from timer)."""
+        self._video_resets.pop((space_id, video_edge_id, channel_id, detection_type), None)
         try:
             if not self.coordinator.account:
                 return
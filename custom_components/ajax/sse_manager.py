@@ -14,7 +14,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -64,6 +66,40 @@ from ._event_helpers import EventHandlerMixin
 
 _LOGGER = logging.getLogger(__name__)
 
+# (by 8-char id suffix, by 8-char id prefix, by name) for one space's devices.
+type _DeviceIndex = tuple[dict[str, AjaxDevice], dict[str, AjaxDevice], dict[str, AjaxDevice]]
+
+# Event tag -> handler category, resolved with one lookup per event. The
+# categories are listed in the precedence of the original if/elif chain, and
+# a tag present in several maps keeps the first category it was given.
+_TAG_CATEGORY: dict[str, str] = {}
+for _category, _tags in (
+    ("security", EVENT_TAG_TO_STATE),
+    ("door", DOOR_EVENTS),
+    ("motion", MOTION_EVENTS),
+    ("smoke", SMOKE_EVENTS),
+    ("flood", FLOOD_EVENTS),
+    ("glass", GLASS_EVENTS),
+    ("tamper", TAMPER_EVENTS),
+    ("device_status", DEVICE_STATUS_EVENTS),
+    ("relay", RELAY_EVENTS),
+    ("button", BUTTON_EVENTS),
+    ("wire_input", WIRE_INPUT_EVENTS),
+    ("scenario", SCENARIO_EVENTS),
+    ("video", VIDEO_EVENTS),
+    ("doorbell", DOORBELL_EVENTS),
+    ("lock", LOCK_EVENTS),
+    ("lock", LOCK_DOOR_EVENTS),
+    ("hub", HUB_EVENTS),
+):
+    for _tag in _tags:
+        _TAG_CATEGORY.setdefault(_tag, _category)
+del _category, _tags, _tag
+
+# Categories ranked below video: an eventTypeV2 video event takes over these
+# (and unknown tags), as it did in the chain.
+_CATEGORIES_AFTER_VIDEO = frozenset({"doorbell", "lock", "hub"})
+
 
 class SSEManager(EventHandlerMixin):
     """Manages SSE events from Ajax proxy."""
@@ -72,6 +108,13 @@ class SSEManager(EventHandlerMixin):
     STATE_PROTECTION_SECONDS = 5.0
     # Deduplication window in seconds (ignore duplicate events within this window)
     DEDUP_WINDOW_SECONDS = 5.0
+    # Dedup keys are forgotten after this many seconds, and the table never
+    # holds more than RECENT_EVENTS_MAX keys (oldest dropped first).
+    RECENT_EVENT_TTL_SECONDS = 60.0
+    RECENT_EVENTS_MAX = 4096
+    # Listener updates from an event burst (alarm cascades) are coalesced
+    # into one push per window; security state changes are pushed at once.
+    PUSH_DEBOUNCE_SECONDS = 0.02
 
     def __init__(
         self,
@@ -88,11 +131,19 @@ class SSEManager(EventHandlerMixin):
         self.sse_client = sse_client
         self._language = DEFAULT_LANGUAGE
         self._last_state_update: dict[str, float] = {}  # hub_id -> timestamp
-        self._recent_events: dict[str, float] = {}  # event_key -> timestamp
+        # event_key -> timestamp, oldest first (see _handle_event dedup)
+        self._recent_events: OrderedDict[tuple[Any, ...], float] = OrderedDict()
+        # hub_id -> space, rebuilt lazily from coordinator.account (see _space_for_hub)
+        self._spaces_by_hub: dict[str, AjaxSpace] = {}
+        # space_id -> (by id suffix, by id prefix, by name), see _find_device
+        self._device_index: dict[str, _DeviceIndex] = {}
+        self._push_scheduled = False
         self._dedup_window = self.DEDUP_WINDOW_SECONDS
         # Track scheduled call_later handles so we can cancel them on stop()
         # and strong-ref background tasks so they are not GC'd mid-flight.
         self._pending_timers: set[asyncio.TimerHandle] = set()
+        # (space, video edge, channel, detection type) -> pending auto-reset
+        self._video_resets: dict[tuple[str, str, str | None, str], asyncio.TimerHandle] = {}
         self._background_tasks: set[asyncio.Task[Any]] = set()
         # Serialise security_event handlers so overlapping events cannot
         # flip the coordinator skip-flag in a racy way.
@@ -123,21 +174,45 @@ class SSEManager(EventHandlerMixin):
 
         return success
 
-    def _schedule_later(self, delay: float, callback: Callable[[], Any]) -> None:
+    def _schedule_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> asyncio.TimerHandle:
         """Wrap hass.loop.call_later to track the handle for cancellation.
 
         The handle removes itself from ``_pending_timers`` once it fires, so the
         set only ever holds genuinely pending timers (otherwise every doorbell
         ring / video detection would leak a spent TimerHandle for the lifetime
-        of the integration).
+        of the integration). Extra positional *args* are handed to
+        ``call_later`` like the loop API, so callers need no lambda per timer.
         """
 
-        def _wrapped() -> None:
+        def _wrapped(*cb_args: Any) -> None:
             self._pending_timers.discard(handle)
-            callback()
+            callback(*cb_args)
 
-        handle = self.coordinator.hass.loop.call_later(delay, _wrapped)
+        handle = self.coordinator.hass.loop.call_later(delay, _wrapped, *args)
         self._pending_timers.add(handle)
+        return handle
+
+    def _schedule_coordinator_push(self) -> None:
+        """Push the account to coordinator listeners once the burst settles."""
+        if self._push_scheduled:
+            return
+        self._push_scheduled = True
+        self._schedule_later(self.PUSH_DEBOUNCE_SECONDS, self._scheduled_push)
+
+    def _scheduled_push(self) -> None:
+        """Run a debounced push unless an immediate one already covered it."""
+        if self._push_scheduled:
+            self._flush_coordinator_push()
+
+    def _flush_coordinator_push(self) -> None:
+        """Push the account to coordinator listeners now."""
+        self._push_scheduled = False
+        try:
+            account = self.coordinator.account
+            if account is not None:
+                self.coordinator.async_set_updated_data(account)
+        except Exception as err:
+            _LOGGER.error("SSE coordinator update error: %s", err, exc_info=True)
 
     def _spawn_background(self, coro: Any) -> None:
         """Create a tracked background task so it cannot be GC'd mid-flight."""
@@ -152,6 +227,8 @@ class SSEManager(EventHandlerMixin):
         for handle in list(self._pending_timers):
             handle.cancel()
         self._pending_timers.clear()
+        self._video_resets.clear()
+        self._push_scheduled = False
         await self.sse_client.stop()
         # Let any spawned background tasks finish gracefully
         if self._background_tasks:
@@ -172,6 +249,26 @@ class SSEManager(EventHandlerMixin):
         last_update = self._last_state_update.get(hub_id, 0)
         return (time.time() - last_update) < self.STATE_PROTECTION_SECONDS
 
+    def _space_for_hub(self, hub_id: str) -> AjaxSpace | None:
+        """Return the space owning ``hub_id`` via a cached index.
+
+        A hit is only trusted while the space is still in the account under
+        the same hub; a miss or a stale entry rebuilds the index, so spaces
+        added, removed or re-bound by a poll are picked up without hooks.
+        """
+        account = self.coordinator.account
+        if account is None:
+            return None
+        space = self._spaces_by_hub.get(hub_id)
+        if space is not None and space.hub_id == hub_id and account.spaces.get(space.id) is space:
+            return space
+        index: dict[str, AjaxSpace] = {}
+        for candidate in account.spaces.values():
+            if candidate.hub_id:
+                index.setdefault(candidate.hub_id, candidate)
+        self._spaces_by_hub = index
+        return index.get(hub_id)
+
     async def _handle_event(self, event_data: dict[str, Any]) -> None:
         """Handle an SSE event.
 
@@ -200,7 +297,9 @@ class SSEManager(EventHandlerMixin):
             # Handle both nested and flat event formats
             event = event_data.get("event", event_data)
 
-            event_tag = event.get("eventTag", "").lower()
+            # Interned so lookups in the event maps (literal, hence interned,
+            # keys) match on identity; the set of tags is small and fixed.
+            event_tag = sys.intern(event.get("eventTag", "").lower())
             hub_id = event.get("hubId")
 
             if not event_tag or not hub_id:
@@ -210,61 +309,26 @@ class SSEManager(EventHandlerMixin):
             # Extract event details
             event_code = event.get("eventCode", "")
 
-            # Try multiple ways to get source info (different proxy formats)
-            source = event.get("source", {})
-            device = event.get("device", {})
-
-            # Source name: try device.name, source.name, sourceObjectName, sourceName
-            source_name = (
-                device.get("name")
-                if isinstance(device, dict) and device.get("name")
-                else (source.get("name") if isinstance(source, dict) else None)
-            )
-            if not source_name:
-                source_name = event.get("sourceObjectName") or event.get("sourceName", "")
-
-            # Source ID: try device.id, sourceObjectId, deviceId
-            source_id: str = str(
-                device.get("id")
-                if isinstance(device, dict) and device.get("id")
-                else event.get("sourceObjectId") or event.get("deviceId") or ""
-            )
+            # Try multiple ways to get source info (different proxy formats).
+            # Anything but a dict is treated as absent, checked once here.
+            source = event.get("source")
+            if not isinstance(source, dict):
+                source = {}
+            device = event.get("device")
+            if not isinstance(device, dict):
+                device = {}
 
-            # Source type: try device.type, source.type, sourceObjectType, sourceType
-            source_type = (
-                device.get("type")
-                if isinstance(device, dict) and device.get("type")
-                else (source.get("type") if isinstance(source, dict) else None)
-            )
-            if not source_type:
-                source_type = event.get("sourceObjectType") or event.get("sourceType", "")
+            # Source ID: try device.id, sourceObjectId, deviceId. Only coerce
+            # when the proxy did not already send a string (numeric ids).
+            raw_source_id = device.get("id") or event.get("sourceObjectId") or event.get("deviceId") or ""
+            source_id: str = raw_source_id if isinstance(raw_source_id, str) else str(raw_source_id)
 
             # Parse event code for type info
             code_info = parse_event_code(event_code)
-            event_type = code_info.get("category", "unknown") if code_info else "unknown"
             transition = code_info.get("transition", "TRIGGERED") if code_info else "TRIGGERED"
 
-            # Also check eventTypeV2 for video AI events
-            event_type_v2 = event.get("eventTypeV2", "")
-
-            # DEBUG, not INFO: source_name can be an Ajax user's display
-            # name (PII) and this fires on every event.
-            _LOGGER.debug(
-                "SSE event: type=%s, tag=%s, code=%s, source=%s (%s), id=%s, transition=%s, typeV2=%s",
-                event_type,
-                event_tag,
-                event_code,
-                source_name,
-                source_type,
-                source_id,
-                transition,
-                event_type_v2 or "none",
-            )
-
-            # Log raw event data at DEBUG level for troubleshooting
-            _LOGGER.debug("SSE raw event data: %s", event)
-
-            # Deduplication: ignore duplicate events within window
+            # Deduplication runs before the remaining extraction and logging:
+            # duplicates are common during alarm cascades and need nothing else.
             # For group events, include group ID to allow multiple zones from same user
             group_id = None
             if event_tag in GROUP_ARM_EVENT_TAGS:
@@ -278,13 +342,12 @@ class SSEManager(EventHandlerMixin):
             # it gives parity with SQS dedup (which uses timestamp) so that two
             # back-to-back events of the same tag with different codes are
             # both processed instead of the second being silently dropped.
-            if group_id:
-                event_key = f"{source_id}:{event_tag}:{group_id}:{transition}:{event_code}"
-            else:
-                event_key = f"{source_id}:{event_tag}:{transition}:{event_code}"
+            # A tuple of the existing strings avoids formatting a key per event.
+            event_key = (source_id, event_tag, group_id, transition, event_code)
 
             now = time.time()
-            last_time = self._recent_events.get(event_key, 0)
+            recent = self._recent_events
+            last_time = recent.get(event_key, 0)
             if now - last_time < self._dedup_window:
                 _LOGGER.debug(
                     "SSE event ignored (duplicate): %s, last seen %.1fs ago",
@@ -292,59 +355,93 @@ class SSEManager(EventHandlerMixin):
                     now - last_time,
                 )
                 return
-            self._recent_events[event_key] = now
+            recent[event_key] = now
+            recent.move_to_end(event_key)
+
+            # Keys are kept in timestamp order, so expired ones sit at the
+            # head: drop them until the first live one (usually none).
+            while recent and (
+                now - next(iter(recent.values())) >= self.RECENT_EVENT_TTL_SECONDS
+                or len(recent) > self.RECENT_EVENTS_MAX
+            ):
+                recent.popitem(last=False)
 
-            # Cleanup old entries in-place (avoid dict reassignment)
-            expired = [k for k, v in self._recent_events.items() if now - v >= 60]
-            for k in expired:
-                del self._recent_events[k]
+            # Source name: try device.name, source.name, sourceObjectName, sourceName
+            source_name = (
+                device.get("name") or source.get("name") or event.get("sourceObjectName") or event.get("sourceName", "")
+            )
+
+            # Source type: try device.type, source.type, sourceObjectType, sourceType
+            source_type = (
+                device.get("type") or source.get("type") or event.get("sourceObjectType") or event.get("sourceType", "")
+            )
+
+            # Also check eventTypeV2 for video AI events
+            event_type_v2 = event.get("eventTypeV2", "")
+
+            # DEBUG, not INFO: source_name can be an Ajax user's display
+            # name (PII) and this fires on every event. Guarded so the
+            # argument setup is skipped entirely at the usual INFO level.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "SSE event: type=%s, tag=%s, code=%s, source=%s (%s), id=%s, transition=%s, typeV2=%s",
+                    code_info.get("category", "unknown") if code_info else "unknown",
+                    event_tag,
+                    event_code,
+                    source_name,
+                    source_type,
+                    source_id,
+                    transition,
+                    event_type_v2 or "none",
+                )
+                # Raw event data for troubleshooting
+                _LOGGER.debug("SSE raw event data: %s", event)
 
             # Get space by hub_id
-            space = None
             if self.coordinator.account is None:
                 _LOGGER.warning("SSE: No account data available")
                 return
-            for s in self.coordinator.account.spaces.values():
-                if s.hub_id == hub_id:
-                    space = s
-                    break
-
+            space = self._space_for_hub(hub_id)
             if not space:
                 _LOGGER.warning("SSE: Unknown hub %s", hub_id)
                 return
 
             # Process event by type
-            if event_tag in EVENT_TAG_TO_STATE:
+            category = _TAG_CATEGORY.get(event_tag)
+            if event_type_v2 in VIDEO_EVENT_TYPES and (category is None or category in _CATEGORIES_AFTER_VIDEO):
+                category = "video"
+
+            if category == "security":
                 await self._handle_security_event(space, event_tag, source_name, source_type)
-            elif event_tag in DOOR_EVENTS:
+            elif category == "door":
                 self._handle_door_event(space, event_tag, source_name, source_id, transition)
-            elif event_tag in MOTION_EVENTS:
+            elif category == "motion":
                 self._handle_motion_event(space, event_tag, source_name, source_id)
-            elif event_tag in SMOKE_EVENTS:
+            elif category == "smoke":
                 self._handle_smoke_event(space, event_tag, source_name, source_id)
-            elif event_tag in FLOOD_EVENTS:
+            elif category == "flood":
                 self._handle_flood_event(space, event_tag, source_name, source_id)
-            elif event_tag in GLASS_EVENTS:
+            elif category == "glass":
                 self._handle_glass_event(space, event_tag, source_name, source_id)
-            elif event_tag in TAMPER_EVENTS:
+            elif category == "tamper":
                 self._handle_tamper_event(space, event_tag, source_name, source_id, transition)
-            elif event_tag in DEVICE_STATUS_EVENTS:
+            elif category == "device_status":
                 self._handle_device_status_event(space, event_tag, source_name, source_id)
-            elif event_tag in RELAY_EVENTS:
+            elif category == "relay":
                 self._handle_relay_event(space, event_tag, source_name, source_id)
-            elif event_tag in BUTTON_EVENTS:
+            elif category == "button":
                 self._handle_button_event(space, event_tag, source_name, source_id)
-            elif event_tag in WIRE_INPUT_EVENTS:
+            elif category == "wire_input":
                 self._handle_wire_input_event(space, event_tag, source_name, source_id, transition)
-            elif event_tag in SCENARIO_EVENTS:
+            elif category == "scenario":
                 self._handle_scenario_event(space, event, event_tag)
-            elif event_tag in VIDEO_EVENTS or event_type_v2 in VIDEO_EVENT_TYPES:
+            elif category == "video":
                 self._handle_video_event(space, event_tag, event_type_v2, source_name, source_id)
-            elif event_tag in DOORBELL_EVENTS:
+            elif category == "doorbell":
                 self._handle_doorbell_event(space, source_name, source_id)
-            elif event_tag in LOCK_EVENTS or event_tag in LOCK_DOOR_EVENTS:
+            elif category == "lock":
                 self._handle_lock_event(space, event_tag, source_name, source_id, event_code, event)
-            elif event_tag in HUB_EVENTS:
+            elif category == "hub":
                 _LOGGER.info("SSE: Hub event: %s (%s)", event_tag, source_name)
             elif event_type_v2 == "LIFECYCLE":
                 # Device add/remove/(de)activate notices (e.g. ObjectAdded) carry
@@ -367,9 +464,12 @@ class SSEManager(EventHandlerMixin):
                     event,
                 )
 
-            # Notify HA of update
-            if self.coordinator.account is not None:
-                self.coordinator.async_set_updated_data(self.coordinator.account)
+            # Notify HA of update. Hub, lifecycle and unhandled notices only
+            # log, so they have no state for listeners to pick up.
+            if category == "security":
+                self._flush_coordinator_push()
+            elif category is not None and category != "hub":
+                self._schedule_coordinator_push()
 
         except Exception as err:
             _LOGGER.error("SSE event processing error: %s", err, exc_info=True)
@@ -554,6 +654,7 @@ class SSEManager(EventHandlerMixin):
         message = get_event_message(action_key, language)
 
         # Mirror SQS _add_event_to_history: insert most-recent-first, cap at 10.
+        now = datetime.now(UTC)
         event: dict[str, Any] = {
             "action": action_key,
             "message": message,
@@ -562,8 +663,8 @@ class SSEManager(EventHandlerMixin):
             "room_name": room_name,
             "hub_id": space.hub_id or space.id,
             "space_id": space.id,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "event_time": datetime.now(UTC),
+            "timestamp": now.isoformat(),
+            "event_time": now,
         }
         space.recent_events.insert(0, event)
         space.recent_events = space.recent_events[:10]
@@ -581,45 +682,69 @@ class SSEManager(EventHandlerMixin):
             )
         )
 
+    @staticmethod
+    def _build_device_index(space: AjaxSpace) -> _DeviceIndex:
+        """Index ``space.devices`` by 8-char id suffix, id prefix and name.
+
+        ``setdefault`` keeps the first device in iteration order, matching
+        what the former linear scans returned.
+        """
+        by_suffix: dict[str, AjaxDevice] = {}
+        by_prefix: dict[str, AjaxDevice] = {}
+        by_name: dict[str, AjaxDevice] = {}
+        for device in space.devices.values():
+            if len(device.id) == 16:
+                by_suffix.setdefault(device.id[8:], device)
+                by_prefix.setdefault(device.id[:8], device)
+            if device.name:
+                by_name.setdefault(device.name, device)
+        return by_suffix, by_prefix, by_name
+
+    @staticmethod
+    def _match_device_index(
+        space: AjaxSpace, index: _DeviceIndex, source_name: str, source_id: str
+    ) -> tuple[AjaxDevice, str] | None:
+        """Look ``source_id`` / ``source_name`` up in a device index.
+
+        Returns ``(device, strategy)``, or ``None`` on a miss or a stale
+        entry so the caller rebuilds the index once and retries.
+        """
+        by_suffix, by_prefix, by_name = index
+        if len(source_id) == 8:
+            for strategy, table in (("suffix", by_suffix), ("prefix", by_prefix)):
+                device = table.get(source_id)
+                if device is not None:
+                    return (device, strategy) if space.devices.get(device.id) is device else None
+        if source_name:
+            device = by_name.get(source_name)
+            if device is not None and device.name == source_name and space.devices.get(device.id) is device:
+                return device, "name"
+        return None
+
     def _find_device(self, space: AjaxSpace, source_name: str, source_id: str) -> AjaxDevice | None:
         """Find device by name or ID.
 
         Tries multiple matching strategies similar to SQS manager.
         """
         # Try by exact ID match first
-        if source_id:
-            if source_id in space.devices:
-                return space.devices[source_id]
-
-            # For WireInput devices: try matching by suffix (wire input index)
-            if len(source_id) == 8:
-                for device in space.devices.values():
-                    if len(device.id) == 16 and device.id.endswith(source_id):
-                        _LOGGER.debug(
-                            "SSE: Matched device %s by suffix %s",
-                            device.name,
-                            source_id,
-                        )
-                        return device
-
-            # Try matching by prefix (parent ID) — parity with the SQS
-            # manager: a MultiTransmitter child identified by its parent's
-            # 8-char prefix must resolve in proxy mode too.
-            if len(source_id) == 8:
-                for device in space.devices.values():
-                    if len(device.id) == 16 and device.id.startswith(source_id):
-                        _LOGGER.debug(
-                            "SSE: Matched device %s by prefix %s",
-                            device.name,
-                            source_id,
-                        )
-                        return device
-
-        # Fall back to name match
-        if source_name:
-            for device in space.devices.values():
-                if device.name == source_name:
-                    return device
+        if source_id and source_id in space.devices:
+            return space.devices[source_id]
+
+        # Suffix (WireInput index), prefix (MultiTransmitter parent — parity
+        # with the SQS manager) and name matches go through a cached index;
+        # a miss or a stale hit rebuilds it, so devices added, removed or
+        # renamed by a poll are picked up without hooks.
+        if source_id or source_name:
+            index = self._device_index.get(space.id)
+            match = self._match_device_index(space, index, source_name, source_id) if index is not None else None
+            if match is None:
+                index = self._device_index[space.id] = self._build_device_index(space)
+                match = self._match_device_index(space, index, source_name, source_id)
+            if match is not None:
+                device, strategy = match
+                if strategy != "name":
+                    _LOGGER.debug("SSE: Matched device %s by %s %s", device.name, strategy, source_id)
+                return device
 
         # The device may have been added since the last poll — let the
         # coordinator discover it instead of staying blind until the next
@@ -817,7 +942,9 @@ class SSEManager(EventHandlerMixin):
 
             self._schedule_later(
                 10.0,
-                lambda: self._reset_doorbell_ring(space.id, dev.id),
+                self._reset_doorbell_ring,
+                space.id,
+                dev.id,
             )
         else:
             for ve in space.video_edges.values():
@@ -1002,8 +1129,8 @@ class SSEManager(EventHandlerMixin):
             )
 
         smart_lock.last_event_tag = event_tag
-        smart_lock.last_event_time = datetime.now(UTC)
-        smart_lock.last_sse_event_time = datetime.now(UTC)
+        # One clock read so both fields carry the same instant.
+        smart_lock.last_event_time = smart_lock.last_sse_event_time = datetime.now(UTC)
 
     def _handle_scenario_event(self, space: AjaxSpace, event: dict[str, Any], event_tag: str) -> None:
         """Handle scenario events that might be triggered by a Button.
@@ -1061,11 +1188,7 @@ class SSEManager(EventHandlerMixin):
         Updates the channel state to reflect the active detection.
         """
         # Determine the detection type from eventTag or eventTypeV2
-        detection_type = None
-        if event_tag in VIDEO_EVENTS:
-            detection_type = VIDEO_EVENTS[event_tag]
-        elif event_type_v2 in VIDEO_EVENT_TYPES:
-            detection_type = VIDEO_EVENT_TYPES[event_type_v2]
+        detection_type = VIDEO_EVENTS.get(event_tag) or VIDEO_EVENT_TYPES.get(event_type_v2)
 
         if not detection_type:
             _LOGGER.debug(
@@ -1098,11 +1221,15 @@ class SSEManager(EventHandlerMixin):
             channel_id or "default",
         )
 
-        # Schedule auto-reset after detection timeout (30 seconds)
-        self._schedule_later(
-            30.0,
-            lambda: self._reset_video_detection(space.id, video_edge.id, channel_id, detection_type),
-        )
+        # Schedule auto-reset after detection timeout (30 seconds), counted
+        # from the latest event: a burst re-arms one timer per detection
+        # instead of stacking timers that clear it early and push repeatedly.
+        key = (space.id, video_edge.id, channel_id, detection_type)
+        previous = self._video_resets.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+            self._pending_timers.discard(previous)
+        self._video_resets[key] = self._schedule_later(30.0, self._reset_video_detection, *key)
 
     def _reset_video_detection(
         self,
@@ -1112,11 +1239,13 @@ class SSEManager(EventHandlerMixin):
         detection_type: str,
     ) -> None:
         """Reset video detection after timeout (called from timer)."""
+        self._video_resets.pop((space_id, video_edge_id, channel_id, detection_type), None)
         try:
-            if not self.coordinator.account:
+            account = self.coordinator.account
+            if not account:
                 return
 
-            space = self.coordinator.account.spaces.get(space_id)
+            space = account.spaces.get(space_id)
             if not space:
                 return
 
@@ -1133,8 +1262,7 @@ class SSEManager(EventHandlerMixin):
             )
 
             # Notify HA of update
-            if self.coordinator.account is not None:
-                self.coordinator.async_set_updated_data(self.coordinator.account)
+            self.coordinator.async_set_updated_data(account)
 
         except Exception as err:
             _LOGGER.debug("Error resetting video detection: %s", err)
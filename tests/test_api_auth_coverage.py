@@ -13,6 +13,7 @@ backoff retries do not actually pause the test suite.
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
@@ -590,6 +591,13 @@ async def test_request_success_returns_json() -> None:
     assert kwargs["headers"]["X-Session-Token"] == "tok"
 
 
+@pytest.mark.asyncio
+async def test_request_wraps_invalid_json() -> None:
+    api = _api(responses=[_FakeResponse(200, json_exc=json.JSONDecodeError("bad", "", 0))])
+    with pytest.raises(AjaxRestApiError, match="Invalid JSON response from hubs"):
+        await api._request("GET", "hubs")
+
+
 @pytest.mark.asyncio
 async def test_request_proxy_adds_user_and_cache_headers() -> None:
     api = _api(
@@ -9,6 +9,7 @@ Covers the device-reconciliation pipeline:
   per-family attribute mapping).
 * ``_reset_expired_motion_detections`` (30 s impulse expiry).
 * ``_async_cleanup_stale_devices`` (HA registry pruning by known IDs).
+* ``async_queue_device_update`` (per-device write coalescing).
 
 Style: ``object.__new__`` the mixin, mock ``api``/``account``/``hass``, build
 realistic ``AjaxDevice``/``AjaxSpace`` objects. ``dr.async_get`` is patched in
@@ -17,11 +18,14 @@ the module under test so no real HA registry is needed.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from custom_components.ajax._coordinator_devices import AjaxDevicesMixin
 from custom_components.ajax._ids import device_identifier
 from custom_components.ajax.const import DOMAIN
@@ -1339,3 +1343,94 @@ async def test_update_devices_nested_attributes_respect_optimistic_guard() -> No
     # is_on stays optimistic-True; the non-guarded key still merges normally.
     assert dev.attributes["is_on"] is True
     assert dev.attributes.get("signal_level") == "GOOD" or "signalLevel" in dev.attributes
+
+
+# ---------------------------------------------------------------------------
+# async_queue_device_update
+# ---------------------------------------------------------------------------
+
+
+def _queue_mixin() -> AjaxDevicesMixin:
+    mixin = _make_mixin()
+    loop = asyncio.get_running_loop()
+    mixin.hass = SimpleNamespace(loop=loop, async_create_task=loop.create_task)
+    mixin.api.async_update_device = AsyncMock()
+    mixin._pending_device_updates = {}
+    return mixin
+
+
+async def test_queue_device_update_merges_concurrent_writes() -> None:
+    """Two sliders moved together on one device -> one GET+PUT, merged payload."""
+    mixin = _queue_mixin()
+    with patch("custom_components.ajax._coordinator_devices.DEVICE_UPDATE_BATCH_DELAY", 0):
+        await asyncio.gather(
+            mixin.async_queue_device_update("hub1", "d1", {"minBrightnessLimitCh1": 10}),
+            mixin.async_queue_device_update("hub1", "d1", {"maxBrightnessLimitCh1": 90}),
+            mixin.async_queue_device_update("hub1", "d2", {"touchSensitivity": 3}),
+        )
+    assert mixin.api.async_update_device.await_count == 2
+    mixin.api.async_update_device.assert_any_await(
+        "hub1", "d1", {"minBrightnessLimitCh1": 10, "maxBrightnessLimitCh1": 90}
+    )
+    mixin.api.async_update_device.assert_any_await("hub1", "d2", {"touchSensitivity": 3})
+    assert mixin._pending_device_updates == {}
+
+
+async def test_queue_device_update_propagates_error_to_every_caller() -> None:
+    mixin = _queue_mixin()
+    mixin.api.async_update_device.side_effect = RuntimeError("boom")
+    with patch("custom_components.ajax._coordinator_devices.DEVICE_UPDATE_BATCH_DELAY", 0):
+        results = await asyncio.gather(
+            mixin.async_queue_device_update("hub1", "d1", {"a": 1}),
+            mixin.async_queue_device_update("hub1", "d1", {"b": 2}),
+            return_exceptions=True,
+        )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    mixin.api.async_update_device.assert_awaited_once()
+
+
+async def test_queue_device_update_single_failure_raises() -> None:
+    mixin = _queue_mixin()
+    mixin.api.async_update_device.side_effect = RuntimeError("boom")
+    with (
+        patch("custom_components.ajax._coordinator_devices.DEVICE_UPDATE_BATCH_DELAY", 0),
+        pytest.raises(RuntimeError),
+    ):
+        await mixin.async_queue_device_update("hub1", "d1", {"a": 1})
+    assert mixin._pending_device_updates == {}
+
+
+async def test_queue_device_update_survives_first_caller_cancelled_in_window() -> None:
+    """Cancelling the caller that opened the batch keeps the merged write."""
+    mixin = _queue_mixin()
+    with patch("custom_components.ajax._coordinator_devices.DEVICE_UPDATE_BATCH_DELAY", 0.01):
+        first = asyncio.ensure_future(mixin.async_queue_device_update("hub1", "d1", {"a": 1}))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(mixin.async_queue_device_update("hub1", "d1", {"b": 2}))
+        await asyncio.sleep(0)
+        first.cancel()
+        await second
+    assert first.cancelled()
+    mixin.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"a": 1, "b": 2})
+
+
+async def test_queue_device_update_survives_first_caller_cancelled_during_put() -> None:
+    """A caller cancelled mid-PUT must not strand the merged callers."""
+    mixin = _queue_mixin()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_put(*_args: object) -> None:
+        started.set()
+        await release.wait()
+
+    mixin.api.async_update_device.side_effect = _slow_put
+    with patch("custom_components.ajax._coordinator_devices.DEVICE_UPDATE_BATCH_DELAY", 0):
+        first = asyncio.ensure_future(mixin.async_queue_device_update("hub1", "d1", {"a": 1}))
+        second = asyncio.ensure_future(mixin.async_queue_device_update("hub1", "d1", {"b": 2}))
+        await started.wait()
+        first.cancel()
+        release.set()
+        await asyncio.wait_for(second, 1)
+    assert first.cancelled()
+    mixin.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"a": 1, "b": 2})
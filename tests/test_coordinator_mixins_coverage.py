@@ -442,6 +442,31 @@ def test_find_video_edge_ignores_non_dict_channels() -> None:
     assert channel == "ch1"
 
 
+def test_find_video_edge_reuses_index_until_poll_replaces_channels() -> None:
+    mgr = _StubManager()
+    ve = _video_edge(channels=[{"id": "ch3", "name": "Backyard"}])
+    space = _space_with_edge(ve)
+    assert mgr._find_video_edge(space, source_name="", source_id="ch3") == (ve, "ch3")
+    index = mgr._video_edge_index[space.id]
+    assert mgr._find_video_edge(space, source_name="Backyard", source_id="") == (ve, "ch3")
+    assert mgr._video_edge_index[space.id] is index  # hit: no rebuild
+    # A poll swaps the channel list: the old channel id goes stale.
+    ve.channels = [{"id": "ch4", "name": "Backyard"}]
+    assert mgr._find_video_edge(space, source_name="", source_id="ch3") == (None, None)
+    assert mgr._find_video_edge(space, source_name="Backyard", source_id="") == (ve, "ch4")
+
+
+def test_find_video_edge_first_match_wins_across_edges() -> None:
+    """Edge name and channel names are matched in edge order, as the old scans did."""
+    mgr = _StubManager()
+    first = _video_edge(channels=[{"id": "ch1", "name": "Hall"}])
+    second = AjaxVideoEdge(id="ve2", name="Hall", space_id="s1", channels=[{"id": "ch1", "name": "Other"}])
+    space = _space_with_edge(first)
+    space.video_edges[second.id] = second
+    assert mgr._find_video_edge(space, source_name="Hall", source_id="") == (first, "ch1")
+    assert mgr._find_video_edge(space, source_name="", source_id="ch1") == (first, "ch1")
+
+
 def test_update_video_detection_autocreates_channel_when_empty() -> None:
     """No channels + no channel_id → a synthetic channel ``0`` is created."""
     mgr = _StubManager()
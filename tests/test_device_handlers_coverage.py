@@ -38,6 +38,7 @@ from custom_components.ajax.devices import (
     WireInputHandler,
     get_device_handler,
     is_dimmer_device,
+    is_lightswitch_device,
 )
 from custom_components.ajax.models import AjaxDevice, DeviceType
 
@@ -97,6 +98,20 @@ def test_is_dimmer_device(raw_type: str | None, is_dimmer: bool) -> None:
         assert get_device_handler(dev) is DimmerHandler
 
 
+@pytest.mark.parametrize(
+    "raw_type,is_lightswitch",
+    [
+        ("LightSwitchTwoGang", True),
+        ("light_switch one gang", True),
+        ("lightSwitchDimmer", False),  # dimmers are not plain light switches
+        ("Socket", False),
+        (None, False),
+    ],
+)
+def test_is_lightswitch_device(raw_type: str | None, is_lightswitch: bool) -> None:
+    assert is_lightswitch_device(_device(DeviceType.WALLSWITCH, raw_type=raw_type)) is is_lightswitch
+
+
 def test_get_device_handler_falls_back_to_registry() -> None:
     assert get_device_handler(_device(DeviceType.SIREN)) is SirenHandler
 
@@ -213,6 +213,7 @@ def _make_select(
     select._space_id = "s1"
     select._device_id = "d1"
     select.coordinator = SimpleNamespace(last_update_success=True, get_space=lambda sid: space)
+    select._refresh_device()
     return select
 
 
@@ -19,6 +19,7 @@ stubbed before importing the client — mirroring ``test_onvif_target_count``.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import sys
 from datetime import UTC, datetime
 from types import ModuleType, SimpleNamespace
@@ -130,6 +131,8 @@ def test_detection_event_str() -> None:
     assert "active=True" in str(evt)
     assert "Z1" in str(evt)
     assert isinstance(evt.timestamp, datetime)
+    assert abs((datetime.now(UTC) - evt.timestamp).total_seconds()) < 5
+    assert not hasattr(evt, "__dict__")  # slotted: events are created per ONVIF message
 
 
 def test_connected_property_false_initially() -> None:
@@ -161,6 +164,32 @@ async def test_connect_failure_resets_camera(monkeypatch: pytest.MonkeyPatch) ->
     assert client._camera is None
 
 
+async def test_connect_times_out_unreachable_camera(monkeypatch: pytest.MonkeyPatch) -> None:
+    camera = MagicMock()
+
+    async def _hang() -> None:
+        await asyncio.sleep(1)
+
+    camera.update_xaddrs = _hang
+    camera.close = AsyncMock()
+    monkeypatch.setattr(oc, "ONVIFCamera", MagicMock(return_value=camera))
+    monkeypatch.setattr(oc, "ONVIF_CONNECT_TIMEOUT", 0.01)
+    client = _client()
+    assert await client.async_connect() is False
+    assert client._camera is None
+    camera.close.assert_awaited_once()
+
+
+async def test_connect_failure_ignores_close_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    camera = MagicMock()
+    camera.update_xaddrs = AsyncMock(side_effect=OSError("unreachable"))
+    camera.close = AsyncMock(side_effect=RuntimeError("already closed"))
+    monkeypatch.setattr(oc, "ONVIFCamera", MagicMock(return_value=camera))
+    client = _client()
+    assert await client.async_connect() is False
+    assert client._camera is None
+
+
 # ===========================================================================
 # onvif_client.py — subscribe / poll / stop
 # ===========================================================================
@@ -186,6 +215,7 @@ async def test_subscribe_success_and_replaces_old_manager() -> None:
     old_manager.shutdown.assert_awaited_once()
     new_manager.set_synchronization_point.assert_awaited_once()
     assert client._pullpoint_manager is new_manager
+    assert client._pullpoint_service is new_manager.get_service.return_value
 
 
 async def test_subscribe_failure_returns_false() -> None:
@@ -248,14 +278,16 @@ async def test_stop_skips_shutdown_when_manager_closed() -> None:
 # ===========================================================================
 
 
-async def test_poll_loop_recreates_subscription_on_lost_flag() -> None:
+async def test_poll_loop_recreates_subscription_on_lost_flag(monkeypatch: pytest.MonkeyPatch) -> None:
     client = _client()
+    monkeypatch.setattr(oc.asyncio, "sleep", AsyncMock())
     client._running = True
     client._subscription_lost = True
     client.async_subscribe_events = AsyncMock(return_value=True)  # type: ignore[method-assign]
 
-    async def _pull() -> None:
+    async def _pull() -> bool:
         client._running = False  # stop after one successful pull
+        return True
 
     client._pull_messages = _pull  # type: ignore[method-assign]
     await client._poll_loop()
@@ -263,6 +295,101 @@ async def test_poll_loop_recreates_subscription_on_lost_flag() -> None:
     assert client._subscription_lost is False
 
 
+async def test_poll_loop_retries_failed_resubscribe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed resubscribe leaves no manager; the next pass must retry, not pull."""
+    client = _client()
+    client._running = True
+    client._pullpoint_manager = MagicMock(closed=True)
+    attempts = 0
+
+    async def _subscribe() -> bool:
+        nonlocal attempts
+        attempts += 1
+        client._pullpoint_manager = None
+        return attempts > 1
+
+    async def _pull() -> bool:
+        client._running = False
+        return True
+
+    monkeypatch.setattr(oc.asyncio, "sleep", AsyncMock())
+    client.async_subscribe_events = _subscribe  # type: ignore[method-assign]
+    client._pull_messages = _pull  # type: ignore[method-assign]
+    await client._poll_loop()
+    assert attempts == 2
+    assert client._subscription_lost is False
+
+
+async def test_poll_loop_rearms_without_sleep_after_successful_pull(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """PullMessages already long-polls: a good pull must not add a sleep."""
+    client = _client()
+    client._running = True
+    pulls = 0
+
+    async def _pull() -> bool:
+        nonlocal pulls
+        pulls += 1
+        client._running = pulls < 3
+        return True
+
+    # Every pull lasts the full long-poll Timeout.
+    clock = itertools.count(step=oc.PULLPOINT_PULL_TIMEOUT.total_seconds())
+    monkeypatch.setattr(oc, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+    sleep = AsyncMock()
+    monkeypatch.setattr(oc.asyncio, "sleep", sleep)
+    client._pull_messages = _pull  # type: ignore[method-assign]
+    await client._poll_loop()
+    assert pulls == 3
+    sleep.assert_not_awaited()
+
+
+async def test_poll_loop_paces_instant_empty_replies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A camera answering at once (ignoring Timeout) must not spin the loop."""
+    client = _client()
+    client._running = True
+    pulls = 0
+
+    async def _pull() -> bool:
+        nonlocal pulls
+        pulls += 1
+        client._running = pulls < 2
+        return True
+
+    monkeypatch.setattr(oc, "time", SimpleNamespace(monotonic=lambda: 100.0))
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(oc.asyncio, "sleep", _sleep)
+    client._pull_messages = _pull  # type: ignore[method-assign]
+    await client._poll_loop()
+    assert sleeps == [oc.PULLPOINT_POLL_INTERVAL, oc.PULLPOINT_POLL_INTERVAL]
+
+
+async def test_poll_loop_backs_off_when_nothing_pulled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No live subscription / failed pull → back off instead of spinning."""
+    client = _client()
+    client._running = True
+    client._pull_messages = AsyncMock(return_value=False)  # type: ignore[method-assign]
+
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        client._running = len(sleeps) < 2
+
+    monkeypatch.setattr(oc.asyncio, "sleep", _sleep)
+    await client._poll_loop()
+    assert sleeps == [oc.PULLPOINT_POLL_INTERVAL * 2, oc.PULLPOINT_POLL_INTERVAL * 4]
+
+
 async def test_poll_loop_backoff_when_resubscribe_fails(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -325,7 +452,7 @@ async def test_poll_loop_breaks_on_cancelled() -> None:
 async def test_pull_messages_no_manager_returns_early() -> None:
     client = _client()
     client._pullpoint_manager = None
-    await client._pull_messages()  # no exception
+    assert await client._pull_messages() is False
 
 
 async def test_pull_messages_processes_notifications() -> None:
@@ -340,8 +467,55 @@ async def test_pull_messages_processes_notifications() -> None:
 
     processed: list[Any] = []
     client._process_message = AsyncMock(side_effect=lambda m: processed.append(m))  # type: ignore[method-assign]
-    await client._pull_messages()
+    assert await client._pull_messages() is True
     assert processed == [msg]
+    service.PullMessages.assert_awaited_once_with(
+        {"MessageLimit": oc.PULLPOINT_MESSAGE_LIMIT, "Timeout": oc.PULLPOINT_PULL_TIMEOUT}
+    )
+
+    # The service proxy is cached for the rest of the subscription.
+    assert await client._pull_messages() is True
+    manager.get_service.assert_called_once()
+    client._on_subscription_lost()
+    assert client._pullpoint_service is None
+
+
+async def test_pull_messages_delivers_one_batch_per_response() -> None:
+    single = MagicMock()
+    batch_cb = MagicMock()
+    client = AjaxOnvifClient(_video_edge(), "u", "p", event_callback=single, batch_event_callback=batch_cb)
+    manager = MagicMock()
+    manager.closed = False
+    service = MagicMock()
+    messages = [
+        _message(topic="tns1:RuleEngine/tnsajax:MotionDetector/Detection", data_items={"State": "true"}),
+        _message(topic="tns1:RuleEngine/RingDetector/Detection", data_items={"Detected": "true"}),
+    ]
+    service.PullMessages = AsyncMock(return_value=SimpleNamespace(NotificationMessage=messages))
+    manager.get_service = MagicMock(return_value=service)
+    client._pullpoint_manager = manager
+
+    assert await client._pull_messages() is True
+    assert client._batch is None
+    await asyncio.sleep(0)
+    batch_cb.assert_called_once()
+    assert [e.detection_type for e in batch_cb.call_args[0][0]] == ["VIDEO_MOTION", "DOORBELL_RING"]
+    single.assert_not_called()
+
+
+async def test_pull_messages_empty_response_is_a_good_pull() -> None:
+    client = _client(MagicMock())
+    manager = MagicMock()
+    manager.closed = False
+    service = MagicMock()
+    service.PullMessages = AsyncMock(side_effect=[None, SimpleNamespace(NotificationMessage=[])])
+    manager.get_service = MagicMock(return_value=service)
+    client._pullpoint_manager = manager
+    client._process_message = AsyncMock()  # type: ignore[method-assign]
+
+    assert await client._pull_messages() is True
+    assert await client._pull_messages() is True
+    client._process_message.assert_not_awaited()
 
 
 async def test_pull_messages_swallows_timeout() -> None:
@@ -352,7 +526,7 @@ async def test_pull_messages_swallows_timeout() -> None:
     service.PullMessages = AsyncMock(side_effect=ONVIFError("Timeout occurred"))
     manager.get_service = MagicMock(return_value=service)
     client._pullpoint_manager = manager
-    await client._pull_messages()  # must not raise
+    assert await client._pull_messages() is True  # long poll expired normally
 
 
 async def test_pull_messages_logs_non_timeout_error() -> None:
@@ -363,7 +537,7 @@ async def test_pull_messages_logs_non_timeout_error() -> None:
     service.PullMessages = AsyncMock(side_effect=ONVIFError("connection reset"))
     manager.get_service = MagicMock(return_value=service)
     client._pullpoint_manager = manager
-    await client._pull_messages()  # must not raise
+    assert await client._pull_messages() is False  # must not raise; caller backs off
 
 
 # ===========================================================================
@@ -385,6 +559,14 @@ async def test_process_message_no_message_data_noop() -> None:
     cb.assert_not_called()
 
 
+async def test_process_message_topic_without_value_noop() -> None:
+    cb = MagicMock()
+    client = _client(cb)
+    await client._process_message(SimpleNamespace(Topic=SimpleNamespace(), Message=None))
+    await asyncio.sleep(0)
+    cb.assert_not_called()
+
+
 async def test_process_message_fires_callback_and_dedupes() -> None:
     cb = MagicMock()
     client = _client(cb)
@@ -393,12 +575,47 @@ async def test_process_message_fires_callback_and_dedupes() -> None:
         data_items={"State": "true"},
     )
     await client._process_message(msg)
+    cb.assert_not_called()  # delivered on the next loop iteration
+    await asyncio.sleep(0)
     assert cb.call_count == 1
     # Same state again → deduped (no second callback).
     await client._process_message(msg)
+    await asyncio.sleep(0)
     assert cb.call_count == 1
 
 
+async def test_process_message_without_callback_skips_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client()
+    parse = MagicMock()
+    monkeypatch.setattr(client, "_parse_event", parse)
+    msg = _message(
+        topic="tns1:RuleEngine/tnsajax:MotionDetector/Detection",
+        data_items={"State": "true"},
+    )
+    await client._process_message(msg)
+    parse.assert_not_called()
+    assert not client._last_states
+
+
+def test_duplicate_filter_is_lru_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Channels that vanish must not grow the duplicate filter forever."""
+    monkeypatch.setattr(oc, "LAST_STATES_MAX", 2)
+    client = _client()
+
+    def _evt(channel: str, active: bool = True) -> OnvifDetectionEvent:
+        return OnvifDetectionEvent(
+            video_edge_id="ve1", channel_id=channel, detection_type="VIDEO_MOTION", active=active
+        )
+
+    assert client._is_state_change(_evt("1")) is True
+    assert client._is_state_change(_evt("2")) is True
+    assert client._is_state_change(_evt("1")) is False  # duplicate, refreshes recency
+    assert client._is_state_change(_evt("3")) is True  # evicts channel 2 (least recent)
+    assert list(client._last_states) == [("1", "VIDEO_MOTION"), ("3", "VIDEO_MOTION")]
+    assert client._is_state_change(_evt("1")) is False  # still cached
+    assert client._is_state_change(_evt("2")) is True  # evicted → seen as new
+
+
 async def test_process_message_extracts_channel_and_rule() -> None:
     cb = MagicMock()
     client = _client(cb)
@@ -411,34 +628,33 @@ async def test_process_message_extracts_channel_and_rule() -> None:
         ],
     )
     await client._process_message(msg)
+    await asyncio.sleep(0)
     evt = cb.call_args[0][0]
     assert evt.channel_id == "3"
     assert evt.rule == "Zone Entree"
 
 
 def test_extract_source_info_defaults_and_token_without_dash() -> None:
-    client = _client()
-    msg = SimpleNamespace(Source=SimpleNamespace(SimpleItem=[_simple_item("VideoSourceToken", "nodash")]))
-    channel_id, rule = client._extract_source_info(msg)
+    channel_id, rule = AjaxOnvifClient._extract_source_info({"VideoSourceToken": "nodash"})
     assert channel_id == "0"  # no dash → unchanged default
     assert rule == ""
 
 
 def test_extract_source_info_handles_missing_source() -> None:
-    client = _client()
-    channel_id, rule = client._extract_source_info(SimpleNamespace())
-    assert (channel_id, rule) == ("0", "")
-
+    assert AjaxOnvifClient._extract_source_info({}) == ("0", "")
 
-def test_extract_source_info_swallows_exception() -> None:
-    client = _client()
-
-    # Source whose SimpleItem iteration raises → caught and defaults returned.
-    class _Boom:
-        Source = property(lambda self: (_ for _ in ()).throw(RuntimeError("x")))
 
-    channel_id, rule = client._extract_source_info(_Boom())
-    assert (channel_id, rule) == ("0", "")
+def test_simple_items_flattens_and_skips_incomplete() -> None:
+    element = SimpleNamespace(
+        SimpleItem=[
+            _simple_item("State", True),
+            _simple_item(None, "x"),
+            _simple_item("Rule", None),
+        ]
+    )
+    assert oc._simple_items(element) == {"State": "True"}
+    assert oc._simple_items(None) == {}
+    assert oc._simple_items(SimpleNamespace()) == {}
 
 
 async def test_process_message_swallows_exception() -> None:
@@ -455,16 +671,24 @@ async def test_process_message_swallows_exception() -> None:
     cb.assert_not_called()
 
 
-def test_parse_event_swallows_exception() -> None:
-    client = _client()
+async def test_process_message_swallows_data_exception() -> None:
+    cb = MagicMock()
+    client = _client(cb)
 
-    # message_data.Data access raises → caught by the try in _parse_event.
+    # message_data.Data access raises → caught by the outer try in _process_message.
     class _Boom:
+        Source = None
+
         @property
         def Data(self) -> Any:
             raise RuntimeError("data boom")
 
-    assert client._parse_event("tns1:RuleEngine/ObjectDetection/Object", _Boom(), "0") is None
+    msg = SimpleNamespace(
+        Topic=SimpleNamespace(_value_1="tns1:RuleEngine/ObjectDetection/Object"),
+        Message=SimpleNamespace(_value_1=_Boom()),
+    )
+    await client._process_message(msg)  # must not raise
+    cb.assert_not_called()
 
 
 # ===========================================================================
@@ -472,21 +696,22 @@ def test_parse_event_swallows_exception() -> None:
 # ===========================================================================
 
 
-def test_parse_object_detection_human_active() -> None:
+async def test_parse_object_detection_human_active() -> None:
     cb = MagicMock()
     client = _client(cb)
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("ClassTypes", "Human")]))
+    msg_data = {"ClassTypes": "Human"}
     evt = client._parse_event("tns1:RuleEngine/ObjectDetection/Object", msg_data, "0", "rule")
     assert evt is not None
     assert evt.detection_type == "VIDEO_HUMAN"
     assert evt.active is True
 
 
-def test_parse_object_detection_multiclass_emits_cleared_for_others() -> None:
+async def test_parse_object_detection_multiclass_emits_cleared_for_others() -> None:
     cb = MagicMock()
     client = _client(cb)
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("ClassTypes", "Animal,Vehicle")]))
+    msg_data = {"ClassTypes": "Animal,Vehicle"}
     first = client._parse_event("tns1:RuleEngine/tnsajax:ObjectDetector/Detection", msg_data, "1", "")
+    await asyncio.sleep(0)
     # First active event returned; the other types fired through callback.
     assert first is not None and first.active is True
     fired_types = {c.args[0].detection_type for c in cb.call_args_list}
@@ -494,9 +719,21 @@ def test_parse_object_detection_multiclass_emits_cleared_for_others() -> None:
     assert "VIDEO_HUMAN" in fired_types
 
 
+async def test_parse_object_detection_maps_class_synonyms() -> None:
+    cb = MagicMock()
+    client = _client(cb)
+    first = client._parse_event(
+        "tns1:RuleEngine/ObjectDetection/Object", {"ClassTypes": " Truck , Dog,unknown"}, "0", ""
+    )
+    await asyncio.sleep(0)
+    assert first is not None and first.detection_type == "VIDEO_VEHICLE"
+    fired = {c.args[0].detection_type: c.args[0].active for c in cb.call_args_list}
+    assert fired == {"VIDEO_HUMAN": False, "VIDEO_PET": True}
+
+
 def test_parse_motion_detector_state_false() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("State", "false")]))
+    msg_data = {"State": "false"}
     evt = client._parse_event("tns1:RuleEngine/tnsajax:MotionDetector/Detection", msg_data, "0")
     assert evt is not None
     assert evt.detection_type == "VIDEO_MOTION"
@@ -505,14 +742,14 @@ def test_parse_motion_detector_state_false() -> None:
 
 def test_parse_motion_detector_detected_fallback() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("Detected", "true")]))
+    msg_data = {"Detected": "true"}
     evt = client._parse_event("tns1:RuleEngine/tnsajax:MotionDetector/Detection", msg_data, "0")
     assert evt is not None and evt.active is True
 
 
 def test_parse_videosource_motionalarm() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("State", "true")]))
+    msg_data = {"State": "true"}
     evt = client._parse_event("tns1:VideoSource/MotionAlarm", msg_data, "0")
     assert evt is not None
     assert evt.detection_type == "VIDEO_MOTION"
@@ -521,7 +758,7 @@ def test_parse_videosource_motionalarm() -> None:
 
 def test_parse_line_crossing_active() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("ClassTypes", "Human")]))
+    msg_data = {"ClassTypes": "Human"}
     evt = client._parse_event("tns1:RuleEngine/tnsajax:LineDetector/Crossing", msg_data, "0")
     assert evt is not None
     assert evt.detection_type == "VIDEO_LINE_CROSSING"
@@ -530,14 +767,14 @@ def test_parse_line_crossing_active() -> None:
 
 def test_parse_line_crossing_empty_class_inactive() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[]))
+    msg_data: dict[str, str] = {}
     evt = client._parse_event("tns1:RuleEngine/LineDetector/Crossed", msg_data, "0")
     assert evt is not None and evt.active is False
 
 
 def test_parse_doorbell_ring() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[_simple_item("Detected", "true")]))
+    msg_data = {"Detected": "true"}
     evt = client._parse_event("tns1:RuleEngine/RingDetector/Detection", msg_data, "0")
     assert evt is not None
     assert evt.detection_type == "DOORBELL_RING"
@@ -546,7 +783,7 @@ def test_parse_doorbell_ring() -> None:
 
 def test_parse_unknown_topic_returns_none() -> None:
     client = _client()
-    msg_data = SimpleNamespace(Data=SimpleNamespace(SimpleItem=[]))
+    msg_data: dict[str, str] = {}
     assert client._parse_event("tns1:Unknown/Topic", msg_data, "0") is None
 
 
@@ -657,6 +894,16 @@ async def test_manager_remove_video_edge() -> None:
     assert "ve1" not in mgr._clients
 
 
+async def test_manager_remove_drops_edge_lock() -> None:
+    mgr = AjaxOnvifManager("u", "p")
+    client = MagicMock()
+    client.async_stop = AsyncMock()
+    mgr._clients["ve1"] = client
+    mgr._edge_lock("ve1")
+    await mgr.async_remove_video_edge("ve1")
+    assert "ve1" not in mgr._edge_locks
+
+
 async def test_manager_remove_unknown_noop() -> None:
     mgr = AjaxOnvifManager("u", "p")
     await mgr.async_remove_video_edge("nope")  # no exception
@@ -708,6 +955,48 @@ async def test_manager_start_no_nvr_logs_camera_only(
     assert mgr.target_count == 1
 
 
+async def test_manager_start_dedupes_targets_by_ip(monkeypatch: pytest.MonkeyPatch) -> None:
+    mgr = AjaxOnvifManager("u", "p")
+    added: list[str] = []
+
+    async def _add(ve: AjaxVideoEdge) -> bool:
+        added.append(ve.id)
+        return True
+
+    monkeypatch.setattr(mgr, "async_add_video_edge", _add)
+    cam = _video_edge("cam1", "Cam", VideoEdgeType.TURRET)
+    twin = _video_edge("cam2", "Twin", VideoEdgeType.TURRET)  # same default IP
+    no_ip = _video_edge("cam3", "No IP", VideoEdgeType.TURRET, ip=None)
+    await mgr.async_start([cam, twin, no_ip])
+    assert sorted(added) == ["cam1", "cam3"]
+    assert mgr.target_count == 2
+    assert mgr._edge_aliases == {"cam1": ("cam2",)}
+
+
+async def test_manager_on_events_copies_events_to_aliases() -> None:
+    """Edges sharing a subscription's IP receive its detections too."""
+    delivered: list[list[OnvifDetectionEvent]] = []
+    mgr = AjaxOnvifManager("u", "p", batch_event_callback=delivered.append)
+    mgr._edge_aliases = {"cam1": ("cam2",)}
+    event = OnvifDetectionEvent(video_edge_id="cam1", channel_id="0", detection_type="VIDEO_HUMAN", active=True)
+    other = OnvifDetectionEvent(video_edge_id="cam9", channel_id="0", detection_type="VIDEO_PET", active=True)
+    mgr._on_events([event, other])
+    (batch,) = delivered
+    assert [(e.video_edge_id, e.detection_type) for e in batch] == [
+        ("cam1", "VIDEO_HUMAN"),
+        ("cam9", "VIDEO_PET"),
+        ("cam2", "VIDEO_HUMAN"),
+    ]
+
+
+async def test_manager_on_events_falls_back_to_single_callback() -> None:
+    seen: list[str] = []
+    mgr = AjaxOnvifManager("u", "p", event_callback=lambda e: seen.append(e.video_edge_id))
+    mgr._edge_aliases = {"cam1": ("cam2",)}
+    mgr._on_events([OnvifDetectionEvent("cam1", "0", "VIDEO_MOTION", True)])
+    assert seen == ["cam1", "cam2"]
+
+
 async def test_manager_stop_stops_all_clients() -> None:
     mgr = AjaxOnvifManager("u", "p")
     c1 = MagicMock()
@@ -720,6 +1009,35 @@ async def test_manager_stop_stops_all_clients() -> None:
     assert mgr._clients == {}
 
 
+async def test_manager_stop_during_add_stops_late_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A camera still connecting when the manager stops must not be kept."""
+    connecting = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _connect() -> bool:
+        connecting.set()
+        await release.wait()
+        return True
+
+    client = MagicMock()
+    client.async_connect = _connect
+    client.async_subscribe_events = AsyncMock(return_value=True)
+    client.async_start_polling = AsyncMock()
+    client.async_stop = AsyncMock()
+    monkeypatch.setattr(
+        "custom_components.ajax.onvif_manager.AjaxOnvifClient",
+        MagicMock(return_value=client),
+    )
+    mgr = AjaxOnvifManager("u", "p")
+    add = asyncio.ensure_future(mgr.async_add_video_edge(_video_edge()))
+    await connecting.wait()
+    await mgr.async_stop()
+    release.set()
+    assert await add is False
+    client.async_stop.assert_awaited_once()
+    assert mgr._clients == {}
+
+
 async def test_manager_update_adds_and_removes(monkeypatch: pytest.MonkeyPatch) -> None:
     mgr = AjaxOnvifManager("u", "p")
     old = MagicMock()
@@ -744,6 +1062,42 @@ async def test_manager_update_adds_and_removes(monkeypatch: pytest.MonkeyPatch)
     assert mgr.target_count == 1  # NVR excluded
 
 
+async def test_manager_update_logs_add_and_remove_failures(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    mgr = AjaxOnvifManager("u", "p")
+    old = MagicMock()
+    old.async_stop = AsyncMock(side_effect=RuntimeError("stop boom"))
+    mgr._clients = {"gone": old}
+
+    async def _add(ve: AjaxVideoEdge) -> bool:
+        raise RuntimeError("connect boom")
+
+    monkeypatch.setattr(mgr, "async_add_video_edge", _add)
+    await mgr.async_update_video_edges([_video_edge("cam_new", "New", VideoEdgeType.BULLET)])
+    assert "ONVIF client removal failed: stop boom" in caplog.text
+    assert "ONVIF client connect failed: connect boom" in caplog.text
+
+
+async def test_manager_update_adds_cameras_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    mgr = AjaxOnvifManager("u", "p")
+    events: list[str] = []
+
+    async def _add(ve: AjaxVideoEdge) -> bool:
+        events.append(f"start:{ve.id}")
+        await asyncio.sleep(0)
+        events.append(f"end:{ve.id}")
+        return True
+
+    monkeypatch.setattr(mgr, "async_add_video_edge", _add)
+
+    cams = [_video_edge(f"cam{i}", f"Cam {i}", VideoEdgeType.BULLET, ip=f"192.168.1.{i}") for i in range(2)]
+    await mgr.async_update_video_edges(cams)
+
+    # Both connects start before either finishes.
+    assert events[:2] == ["start:cam0", "start:cam1"]
+
+
 # ===========================================================================
 # _coordinator_onvif.py — _find_camera_for_nvr_channel
 # ===========================================================================
@@ -911,6 +1265,35 @@ def test_handle_event_motion_clear_resets_ai(monkeypatch: pytest.MonkeyPatch) ->
     assert cam.detections["video_pet"] is False
 
 
+def test_handle_events_batch_refreshes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "custom_components.ajax._coordinator_onvif.resolve_camera_entity_id",
+        lambda *_a: None,
+    )
+    cam = _video_edge("cam1", "Cam", VideoEdgeType.TURRET)
+    space = AjaxSpace(id="s1", name="Home")
+    space.video_edges["cam1"] = cam
+    m = _handler_mixin(_account_with(space))
+
+    m._handle_onvif_events(
+        [
+            OnvifDetectionEvent("cam1", "0", "VIDEO_MOTION", True),
+            OnvifDetectionEvent("cam1", "0", "VIDEO_HUMAN", True),
+            OnvifDetectionEvent("ghost", "0", "VIDEO_HUMAN", True),
+        ]
+    )
+    assert cam.detections["video_motion"] is True
+    assert cam.detections["video_human"] is True
+    assert m.stats["events_onvif_received"] == 3
+    m.async_set_updated_data.assert_called_once()
+
+
+def test_handle_events_batch_untracked_does_not_refresh() -> None:
+    m = _handler_mixin(_account_with(AjaxSpace(id="s1", name="Home")))
+    m._handle_onvif_events([OnvifDetectionEvent("ghost", "0", "VIDEO_HUMAN", True)])
+    m.async_set_updated_data.assert_not_called()
+
+
 def test_handle_event_doorbell_ring_routes_to_doorbell(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -229,6 +229,7 @@ def test_handler_select_unavailable_when_coordinator_failed() -> None:
     sel._space_id = "s1"
     sel._device_id = "d1"
     sel.coordinator = SimpleNamespace(last_update_success=False, get_space=lambda sid: space)
+    sel._refresh_device()
     assert sel.available is False
 
 
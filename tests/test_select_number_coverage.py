@@ -20,8 +20,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.ajax import number as number_mod, select as select_mod
+from custom_components.ajax.api import AjaxRestApiError
 from custom_components.ajax.models import AjaxDevice, DeviceType, SecurityState
 from custom_components.ajax.number import (
     AjaxCurrentThresholdNumber,
@@ -34,6 +36,7 @@ from custom_components.ajax.select import (
     INDICATION_MODE_OPTIONS,
     LIGHTSWITCH_TOUCH_MODE_SELECT,
     SHOCK_SENSITIVITY_OPTIONS,
+    AjaxBaseSelect,
     AjaxDimmerSelect,
     AjaxHandlerSelect,
     AjaxIndicationModeSelect,
@@ -86,7 +89,9 @@ def _coordinator_for(
     coordinator.api = MagicMock()
     coordinator.api.async_update_device = AsyncMock()
     coordinator.api.async_update_device_nested = AsyncMock()
+    coordinator.async_queue_device_update = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_update_listeners = MagicMock()
     return coordinator
 
 
@@ -95,15 +100,22 @@ def _coordinator_no_space() -> SimpleNamespace:
     coordinator.api = MagicMock()
     coordinator.api.async_update_device = AsyncMock()
     coordinator.api.async_update_device_nested = AsyncMock()
+    coordinator.async_queue_device_update = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_update_listeners = MagicMock()
     return coordinator
 
 
 def _build_select(cls, coordinator, **extra):
     ent = object.__new__(cls)
-    ent._space_id = "s1"
-    ent._device_id = "d1"
-    ent.coordinator = coordinator
+    if issubclass(cls, AjaxBaseSelect):
+        # Run the shared select init (device cache, device info); the
+        # subclass specifics come in through ``extra``.
+        AjaxBaseSelect.__init__(ent, coordinator, "s1", "d1")
+    else:
+        ent._space_id = "s1"
+        ent._device_id = "d1"
+        ent.coordinator = coordinator
     for key, value in extra.items():
         setattr(ent, key, value)
     return ent
@@ -185,12 +197,25 @@ def test_shock_handle_coordinator_update_writes_state() -> None:
     ent.async_write_ha_state.assert_called_once()
 
 
+def test_select_handle_coordinator_update_refreshes_cached_device() -> None:
+    ent = _shock(value=0)
+    ent.async_write_ha_state = MagicMock()
+    replacement = _device(dtype=DeviceType.DOOR_CONTACT, attributes={"shock_sensor_sensitivity": 7})
+    ent.coordinator.get_space("s1").devices["d1"] = replacement
+    assert ent.current_option == "low"  # cached until the coordinator pushes an update
+    ent._handle_coordinator_update()
+    assert ent.current_option == "high"
+
+
 @pytest.mark.asyncio
-async def test_shock_select_success_calls_api_and_refresh() -> None:
+async def test_shock_select_success_updates_locally_without_refresh() -> None:
     ent = _shock(value=0)
     await ent.async_select_option("high")
     ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"shockSensorSensitivity": 7})
-    ent.coordinator.async_request_refresh.assert_awaited_once()
+    assert ent.current_option == "high"
+    assert ent._device.is_optimistic("shock_sensor_sensitivity") is True
+    ent.coordinator.async_update_listeners.assert_called_once()
+    ent.coordinator.async_request_refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -222,7 +247,7 @@ async def test_shock_select_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_shock_select_wraps_api_error() -> None:
     ent = _shock(value=0)
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.api.async_update_device.side_effect = AjaxRestApiError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("normal")
 
@@ -271,12 +296,29 @@ def test_led_device_info_and_handle_update() -> None:
     ent.async_write_ha_state.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_led_select_survives_in_flight_poll() -> None:
+    from custom_components.ajax._device_apply import apply_device_payload
+
+    ent = _led(value="MIN")
+    device = ent._device
+    await ent.async_select_option("max")
+    assert device.is_optimistic("indicationBrightness") is True
+    # A poll that started before the write still reports the old level,
+    # through either the V1 or the V2 source key.
+    apply_device_payload(device, {"indicationBrightness": "MIN", "indicationBrightnessV2": "MIN"})
+    assert device.attributes["indicationBrightness"] == "MAX"
+    assert ent.current_option == "max"
+
+
 @pytest.mark.asyncio
 async def test_led_select_uppercases_for_api() -> None:
     ent = _led(value="MIN")
     await ent.async_select_option("max")
     ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"indicationBrightness": "MAX"})
-    ent.coordinator.async_request_refresh.assert_awaited_once()
+    assert ent.current_option == "max"
+    ent.coordinator.async_update_listeners.assert_called_once()
+    ent.coordinator.async_request_refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -295,7 +337,7 @@ async def test_led_select_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_led_select_wraps_api_error() -> None:
     ent = _led(value="MIN")
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.api.async_update_device.side_effect = AjaxRestApiError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("max")
 
@@ -335,6 +377,24 @@ async def test_indication_select_maps_option_to_api() -> None:
     ent = _indication(value="ENABLED")
     await ent.async_select_option("if_on")
     ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"indicationMode": "IF_ON"})
+    assert ent.current_option == "if_on"
+
+
+@pytest.mark.asyncio
+async def test_indication_select_keeps_derived_flag_and_survives_poll() -> None:
+    from custom_components.ajax._device_apply import apply_device_payload
+
+    ent = _indication(value="ENABLED")
+    device = ent._device
+    device.attributes["indicationEnabled"] = True
+    await ent.async_select_option("off")
+    # The LED brightness select reads indicationEnabled for availability.
+    assert device.attributes["indicationEnabled"] is False
+    assert device.is_optimistic("indicationMode") is True
+    # A poll that started before the write still reports the old mode.
+    apply_device_payload(device, {"indicationMode": "ENABLED", "indicationEnabled": True})
+    assert device.attributes["indicationMode"] == "DISABLED"
+    assert device.attributes["indicationEnabled"] is False
 
 
 @pytest.mark.asyncio
@@ -360,9 +420,45 @@ async def test_indication_select_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_indication_select_wraps_api_error() -> None:
     ent = _indication(value="ENABLED")
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.api.async_update_device.side_effect = AjaxRestApiError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("off")
+    assert ent.current_option == "always"
+    ent.coordinator.async_update_listeners.assert_not_called()
+
+
+def test_mapped_selects_derive_ids_from_class_spec() -> None:
+    device = _device(attributes={"indicationBrightness": ["MIN"]})
+    coordinator = _coordinator_for(device)
+    for cls, key in (
+        (AjaxShockSensitivitySelect, "shock_sensitivity"),
+        (AjaxLedBrightnessSelect, "led_brightness"),
+        (AjaxIndicationModeSelect, "indication_mode"),
+    ):
+        ent = cls(coordinator, "s1", "d1")
+        assert ent._attr_unique_id == f"entry_test_d1_{key}"
+        assert ent.translation_key == key
+    # An unhashable payload value reads as unknown instead of raising.
+    assert AjaxLedBrightnessSelect(coordinator, "s1", "d1").current_option is None
+
+
+@pytest.mark.parametrize(
+    ("cls", "option", "expected"),
+    [
+        (AjaxShockSensitivitySelect, "high", 7),
+        (AjaxShockSensitivitySelect, "bogus", 0),
+        (AjaxLedBrightnessSelect, "min", "MIN"),
+        (AjaxLedBrightnessSelect, "bogus", "MIN"),
+        (AjaxIndicationModeSelect, "if_on", "IF_ON"),
+        (AjaxIndicationModeSelect, "bogus", "ENABLED"),
+    ],
+)
+def test_mapped_selects_translate_options_from_tables(cls, option: str, expected: object) -> None:
+    ent = cls(_coordinator_for(_device()), "s1", "d1")
+    assert ent._api_value(option) == expected
+    # Every declared option round-trips through both tables.
+    for declared in ent.options:
+        assert ent._from_api[ent._api_value(declared)] == declared
 
 
 # ===========================================================================
@@ -378,7 +474,7 @@ def _dimmer(
 ) -> AjaxDimmerSelect:
     device = _device(raw_type="LightSwitchDimmer", online=online, attributes=attributes or {})
     coordinator = _coordinator_for(device, hub_id=hub_id, last_update_success=last_update_success)
-    return _build_select(AjaxDimmerSelect, coordinator, _select_def=select_def)
+    return AjaxDimmerSelect(coordinator, "s1", "d1", select_def)
 
 
 def test_dimmer_current_option_flat() -> None:
@@ -391,13 +487,18 @@ def test_dimmer_current_option_nested() -> None:
     assert ent.current_option == "curve_type_linear"
 
 
+def test_dimmer_current_option_maps_api_enum() -> None:
+    ent = _dimmer(_CURVE_DEF, attributes={"dimmerSettings": {"curveType": "CURVE_TYPE_LOGARITHMIC"}})
+    assert ent.current_option == "curve_type_logarithmic"
+
+
 def test_dimmer_current_option_none_paths() -> None:
     # Value not in option list
     assert _dimmer(_TOUCH_DEF, attributes={"touchMode": "WHATEVER"}).current_option is None
     # Attribute missing
     assert _dimmer(_TOUCH_DEF, attributes={}).current_option is None
     # Device missing
-    ent = _build_select(AjaxDimmerSelect, _coordinator_no_space(), _select_def=_TOUCH_DEF)
+    ent = AjaxDimmerSelect(_coordinator_no_space(), "s1", "d1", _TOUCH_DEF)
     assert ent.current_option is None
 
 
@@ -405,7 +506,7 @@ def test_dimmer_available_and_device_info() -> None:
     assert _dimmer(_TOUCH_DEF, online=True).available is True
     assert _dimmer(_TOUCH_DEF, online=False).available is False
     assert _dimmer(_TOUCH_DEF, last_update_success=False).available is False
-    ent = _build_select(AjaxDimmerSelect, _coordinator_no_space(), _select_def=_TOUCH_DEF)
+    ent = AjaxDimmerSelect(_coordinator_no_space(), "s1", "d1", _TOUCH_DEF)
     assert ent.available is False
     assert (select_mod.DOMAIN, "entry_test_d1") in _dimmer(_TOUCH_DEF).device_info["identifiers"]
 
@@ -426,11 +527,15 @@ async def test_dimmer_select_nested_uses_nested_update() -> None:
         "hub1", "d1", {"dimmerSettings": {"curveType": "CURVE_TYPE_LOGARITHMIC"}}
     )
     ent.coordinator.api.async_update_device.assert_not_called()
+    assert ent.current_option == "curve_type_logarithmic"
+    ent.coordinator.async_request_refresh.assert_not_awaited()
+    # Nested writes reserve the root attribute the poller replaces wholesale.
+    assert ent._device.is_optimistic("dimmerSettings") is True
 
 
 @pytest.mark.asyncio
 async def test_dimmer_select_raises_when_space_missing() -> None:
-    ent = _build_select(AjaxDimmerSelect, _coordinator_no_space(), _select_def=_TOUCH_DEF)
+    ent = AjaxDimmerSelect(_coordinator_no_space(), "s1", "d1", _TOUCH_DEF)
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("touch_mode_toggle")
 
@@ -445,7 +550,7 @@ async def test_dimmer_select_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_dimmer_select_wraps_api_error() -> None:
     ent = _dimmer(_TOUCH_DEF, attributes={"touchMode": "touch_mode_toggle"})
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.api.async_update_device.side_effect = AjaxRestApiError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("touch_mode_blocked")
 
@@ -458,7 +563,7 @@ async def test_dimmer_select_wraps_api_error() -> None:
 def _handler_select(select_desc, *, online: bool = True, hub_id: str | None = "hub1") -> AjaxHandlerSelect:
     device = _device(dtype=DeviceType.SIREN, online=online)
     coordinator = _coordinator_for(device, hub_id=hub_id)
-    return _build_select(AjaxHandlerSelect, coordinator, _select_desc=select_desc)
+    return AjaxHandlerSelect(coordinator, "s1", "d1", select_desc)
 
 
 def test_handler_current_option_uses_value_fn() -> None:
@@ -472,7 +577,7 @@ def test_handler_available_and_device_info() -> None:
     desc = {"key": "x", "value_fn": lambda: "loud"}
     assert _handler_select(desc, online=True).available is True
     assert _handler_select(desc, online=False).available is False
-    ent = _build_select(AjaxHandlerSelect, _coordinator_no_space(), _select_desc=desc)
+    ent = AjaxHandlerSelect(_coordinator_no_space(), "s1", "d1", desc)
     assert ent.available is False
     assert (select_mod.DOMAIN, "entry_test_d1") in _handler_select(desc).device_info["identifiers"]
     ent2 = _handler_select(desc)
@@ -515,9 +620,27 @@ async def test_handler_select_nested() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_handler_select_with_attr_key_updates_locally() -> None:
+    desc = {"key": "vol", "api_key": "volKey", "api_transform": lambda x: x.upper(), "attr_key": "vol_level"}
+    ent = _handler_select(desc)
+    await ent.async_select_option("loud")
+    assert ent._device.attributes["vol_level"] == "LOUD"
+    ent.coordinator.async_update_listeners.assert_called_once()
+    ent.coordinator.async_request_refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_handler_select_without_attr_key_requests_refresh() -> None:
+    ent = _handler_select({"key": "vol", "api_key": "volKey"})
+    await ent.async_select_option("loud")
+    ent.coordinator.async_request_refresh.assert_awaited_once()
+    ent.coordinator.async_update_listeners.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_handler_select_raises_when_space_missing() -> None:
-    ent = _build_select(AjaxHandlerSelect, _coordinator_no_space(), _select_desc={"key": "x", "api_key": "k"})
+    ent = AjaxHandlerSelect(_coordinator_no_space(), "s1", "d1", {"key": "x", "api_key": "k"})
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("v")
 
@@ -529,6 +652,14 @@ async def test_handler_select_raises_when_hub_missing() -> None:
         await ent.async_select_option("v")
 
 
+@pytest.mark.asyncio
+async def test_select_does_not_mask_unexpected_errors() -> None:
+    ent = _handler_select({"key": "x", "api_key": "k"})
+    ent.coordinator.api.async_update_device.side_effect = RuntimeError("bug")
+    with pytest.raises(RuntimeError):
+        await ent.async_select_option("v")
+
+
 @pytest.mark.asyncio
 async def test_handler_select_raises_when_no_api_key() -> None:
     ent = _handler_select({"key": "x"})
@@ -539,7 +670,7 @@ async def test_handler_select_raises_when_no_api_key() -> None:
 @pytest.mark.asyncio
 async def test_handler_select_wraps_api_error() -> None:
     ent = _handler_select({"key": "x", "api_key": "k"})
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.api.async_update_device.side_effect = AjaxRestApiError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_select_option("v")
 
@@ -613,6 +744,17 @@ async def test_select_setup_entry_creates_all_entity_kinds() -> None:
     mock_connect.assert_called_once()
 
 
+def test_select_setup_tables_are_constant_time_lookups() -> None:
+    assert isinstance(select_mod.DEVICES_WITH_DOOR_PLUS_SELECTS, frozenset)
+    assert all(hasattr(handler, "get_selects") for handler in select_mod.SELECT_DEVICE_HANDLERS.values())
+
+
+def test_dimmer_select_root_attrs_cover_every_definition() -> None:
+    assert {"touchMode", "dimmerSettings"} == select_mod.DIMMER_SELECT_ROOT_ATTRS
+    for select_def in DIMMER_SELECT_DEFINITIONS:
+        assert select_def["attr_key"].split(".")[0] in select_mod.DIMMER_SELECT_ROOT_ATTRS
+
+
 @pytest.mark.asyncio
 async def test_select_setup_entry_no_entities_skips_add() -> None:
     # A device that produces no select entities.
@@ -706,6 +848,19 @@ def test_number_is_dimmer_and_lightswitch() -> None:
     assert number_mod.is_lightswitch_device(_device(raw_type="LightSwitchDimmer")) is False
 
 
+def test_dimmer_number_attr_index_covers_every_definition() -> None:
+    """A duplicated attr_key would silently drop a definition from setup."""
+    from custom_components.ajax._number_entities import (
+        DIMMER_NUMBER_ATTR_ORDER,
+        DIMMER_NUMBER_DEFS_BY_ATTR_KEY,
+    )
+
+    attr_keys = [d["attr_key"] for d in number_mod.DIMMER_NUMBER_DEFINITIONS]
+    assert list(DIMMER_NUMBER_DEFS_BY_ATTR_KEY) == attr_keys
+    # The sort key used by setup restores definition order.
+    assert sorted(set(attr_keys), key=DIMMER_NUMBER_ATTR_ORDER.__getitem__) == attr_keys
+
+
 # ===========================================================================
 # AjaxTiltDegreesNumber
 # ===========================================================================
@@ -744,7 +899,7 @@ def test_tilt_available_and_device_info() -> None:
 async def test_tilt_set_value_success() -> None:
     ent = _tilt(value=5)
     await ent.async_set_native_value(20.0)
-    ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"accelerometerTiltDegrees": 20})
+    ent.coordinator.async_queue_device_update.assert_awaited_once_with("hub1", "d1", {"accelerometerTiltDegrees": 20})
     ent.coordinator.async_request_refresh.assert_awaited_once()
 
 
@@ -770,7 +925,7 @@ async def test_tilt_set_value_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_tilt_set_value_wraps_api_error() -> None:
     ent = _tilt(value=5)
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.async_queue_device_update.side_effect = RuntimeError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_set_native_value(10)
 
@@ -807,7 +962,7 @@ def test_threshold_available_and_device_info() -> None:
 async def test_threshold_set_value_success() -> None:
     ent = _threshold(value=5)
     await ent.async_set_native_value(12.0)
-    ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"currentThresholdAmpere": 12})
+    ent.coordinator.async_queue_device_update.assert_awaited_once_with("hub1", "d1", {"currentThresholdAmpere": 12})
     ent.coordinator.async_request_refresh.assert_awaited_once()
 
 
@@ -827,7 +982,7 @@ async def test_threshold_set_value_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_threshold_set_value_wraps_api_error() -> None:
     ent = _threshold(value=5)
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.async_queue_device_update.side_effect = RuntimeError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_set_native_value(5)
 
@@ -873,7 +1028,7 @@ def test_ledv2_device_info_and_handle_update() -> None:
 async def test_ledv2_set_value_success() -> None:
     ent = _ledv2(value=4)
     await ent.async_set_native_value(6.0)
-    ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {"indicationBrightnessV2": 6})
+    ent.coordinator.async_queue_device_update.assert_awaited_once_with("hub1", "d1", {"indicationBrightnessV2": 6})
     ent.coordinator.async_request_refresh.assert_awaited_once()
 
 
@@ -893,7 +1048,7 @@ async def test_ledv2_set_value_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_ledv2_set_value_wraps_api_error() -> None:
     ent = _ledv2(value=4)
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.async_queue_device_update.side_effect = RuntimeError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_set_native_value(4)
 
@@ -912,7 +1067,7 @@ def _dimmer_num(
     attrs = {number_def["attr_key"]: value} if value is not None else {}
     device = _device(raw_type="LightSwitchDimmer", online=online, attributes=attrs)
     coordinator = _coordinator_for(device, hub_id=hub_id, last_update_success=last_update_success)
-    return _build_select(AjaxDimmerNumber, coordinator, _number_def=number_def)
+    return _build_select(AjaxDimmerNumber, coordinator, _number_def=number_def, _value_key=number_def["attr_key"])
 
 
 def test_dimmer_number_init_sets_attrs_config_and_diagnostic() -> None:
@@ -934,7 +1089,7 @@ def test_dimmer_number_init_sets_attrs_config_and_diagnostic() -> None:
         "entity_category": "diagnostic",
     }
     ent2 = AjaxDimmerNumber(coordinator, "s1", "d1", diag_def)
-    assert ent2._attr_entity_category is not None
+    assert ent2._attr_entity_category is EntityCategory.DIAGNOSTIC
     # no category branch
     plain_def = {
         "key": "y",
@@ -947,12 +1102,16 @@ def test_dimmer_number_init_sets_attrs_config_and_diagnostic() -> None:
     }
     ent3 = AjaxDimmerNumber(coordinator, "s1", "d1", plain_def)
     assert ent3._attr_native_unit_of_measurement is None
+    assert ent3._attr_entity_category is None
+    assert ent3._value_key == "y"
 
 
 def test_dimmer_number_native_value() -> None:
     assert _dimmer_num(_TOUCH_NUM_DEF, value=4).native_value == 4
     assert _dimmer_num(_TOUCH_NUM_DEF, value=None).native_value is None
-    ent = _build_select(AjaxDimmerNumber, _coordinator_no_space(), _number_def=_TOUCH_NUM_DEF)
+    ent = _build_select(
+        AjaxDimmerNumber, _coordinator_no_space(), _number_def=_TOUCH_NUM_DEF, _value_key=_TOUCH_NUM_DEF["attr_key"]
+    )
     assert ent.native_value is None
 
 
@@ -969,7 +1128,7 @@ def test_dimmer_number_available_and_device_info() -> None:
 async def test_dimmer_number_set_value_success() -> None:
     ent = _dimmer_num(_BRIGHT_NUM_DEF, value=10)
     await ent.async_set_native_value(50.0)
-    ent.coordinator.api.async_update_device.assert_awaited_once_with("hub1", "d1", {_BRIGHT_NUM_DEF["api_key"]: 50})
+    ent.coordinator.async_queue_device_update.assert_awaited_once_with("hub1", "d1", {_BRIGHT_NUM_DEF["api_key"]: 50})
     ent.coordinator.async_request_refresh.assert_awaited_once()
 
 
@@ -990,7 +1149,7 @@ async def test_dimmer_number_set_value_raises_when_hub_missing() -> None:
 @pytest.mark.asyncio
 async def test_dimmer_number_set_value_wraps_api_error() -> None:
     ent = _dimmer_num(_TOUCH_NUM_DEF, value=4)
-    ent.coordinator.api.async_update_device.side_effect = RuntimeError("boom")
+    ent.coordinator.async_queue_device_update.side_effect = RuntimeError("boom")
     with pytest.raises(HomeAssistantError):
         await ent.async_set_native_value(4)
 
@@ -93,6 +93,7 @@ def _make_manager() -> SQSManager:
     mgr._language = "en"
     mgr._last_discovery_refresh = 0.0
     mgr._pending_timers = set()
+    mgr._video_resets = {}
     mgr._background_tasks = set()
     mgr._security_event_lock = asyncio.Lock()
     return mgr
@@ -15,12 +15,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from custom_components.ajax import sse_manager as sse_manager_mod
 from custom_components.ajax.event_codes import DEFAULT_LANGUAGE
+from custom_components.ajax.event_maps import DOOR_EVENTS, EVENT_TAG_TO_STATE
 from custom_components.ajax.models import (
     AjaxDevice,
     AjaxSmartLock,
@@ -41,10 +44,14 @@ def _make_manager() -> SSEManager:
     mgr = object.__new__(SSEManager)
     mgr._language = DEFAULT_LANGUAGE
     mgr._last_state_update = {}
-    mgr._recent_events = {}
+    mgr._recent_events = OrderedDict()
+    mgr._spaces_by_hub = {}
+    mgr._device_index = {}
+    mgr._push_scheduled = False
     mgr._dedup_window = 5
     mgr._last_discovery_refresh = 0.0
     mgr._pending_timers = set()
+    mgr._video_resets = {}
     mgr._background_tasks = set()
     mgr._security_event_lock = asyncio.Lock()
 
@@ -77,6 +84,14 @@ def _make_manager() -> SSEManager:
     return mgr
 
 
+def _fire_push(mgr: SSEManager) -> None:
+    """Run the debounced coordinator push the way the loop timer would."""
+    assert mgr._push_scheduled is True
+    delay, callback = mgr.coordinator.hass.loop.call_later.call_args[0]
+    assert delay == SSEManager.PUSH_DEBOUNCE_SECONDS
+    callback()
+
+
 def _consume(coro: object) -> MagicMock:
     """Close a coroutine handed to async_create_task to avoid 'never awaited'."""
     if asyncio.iscoroutine(coro):
@@ -170,6 +185,17 @@ def test_schedule_later_tracks_and_self_removes_handle() -> None:
     assert mgr._pending_timers == set()
 
 
+def test_schedule_later_forwards_positional_args() -> None:
+    mgr = _make_manager()
+    mgr._reset_doorbell_ring = MagicMock()
+    mgr._schedule_later(10.0, mgr._reset_doorbell_ring, "s1", "d1")
+    delay, wrapped, *args = mgr.coordinator.hass.loop.call_later.call_args[0]
+    assert (delay, args) == (10.0, ["s1", "d1"])
+    wrapped(*args)
+    mgr._reset_doorbell_ring.assert_called_once_with("s1", "d1")
+    assert mgr._pending_timers == set()
+
+
 async def test_spawn_background_tracks_then_discards_task() -> None:
     mgr = _make_manager()
 
@@ -224,6 +250,24 @@ async def test_handle_event_unknown_hub_returns_early() -> None:
     mgr.coordinator.async_set_updated_data.assert_not_called()
 
 
+def test_space_for_hub_reuses_index_and_rebuilds_when_stale() -> None:
+    mgr = _make_manager()
+    space = _space()  # hub_id = hub1
+    _attach(mgr, space)
+    assert mgr._space_for_hub("hub1") is space
+    index = mgr._spaces_by_hub
+    assert mgr._space_for_hub("hub1") is space
+    assert mgr._spaces_by_hub is index  # hit: no rebuild
+    # The poll replaced the space object: the stale entry is not trusted.
+    replacement = _space()
+    _attach(mgr, replacement)
+    assert mgr._space_for_hub("hub1") is replacement
+    # A space re-bound to another hub is found under its new hub id.
+    replacement.hub_id = "hub2"
+    assert mgr._space_for_hub("hub1") is None
+    assert mgr._space_for_hub("hub2") is replacement
+
+
 async def test_handle_event_lifecycle_ignored_without_warning(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -242,6 +286,18 @@ async def test_handle_event_lifecycle_ignored_without_warning(
     assert "not handled" not in caplog.text
 
 
+@pytest.mark.parametrize(("level", "logged"), [(logging.DEBUG, True), (logging.INFO, False)])
+async def test_handle_event_debug_trace_only_when_enabled(
+    caplog: pytest.LogCaptureFixture, level: int, logged: bool
+) -> None:
+    mgr = _make_manager()
+    _attach(mgr, _space())
+    with caplog.at_level(level, logger="custom_components.ajax.sse_manager"):
+        await mgr._handle_event({"eventTag": "hubonline", "hubId": "hub1", "deviceId": "hub1"})
+    assert ("SSE raw event data" in caplog.text) is logged
+    assert ("SSE event: type=" in caplog.text) is logged
+
+
 async def test_handle_event_nested_format_dispatches_door() -> None:
     mgr = _make_manager()
     dev = _device()
@@ -258,9 +314,23 @@ async def test_handle_event_nested_format_dispatches_door() -> None:
         }
     )
     assert dev.attributes["door_opened"] is True
+    mgr.coordinator.async_set_updated_data.assert_not_called()
+    _fire_push(mgr)
     mgr.coordinator.async_set_updated_data.assert_called_once()
 
 
+async def test_handle_event_ignores_non_dict_device_and_source() -> None:
+    mgr = _make_manager()
+    dev = _device()
+    space = _space()
+    space.devices[dev.id] = dev
+    _attach(mgr, space)
+    await mgr._handle_event(
+        {"eventTag": "DoorOpened", "hubId": "hub1", "device": "junk", "source": None, "sourceObjectId": "d1"}
+    )
+    assert dev.attributes["door_opened"] is True
+
+
 async def test_handle_event_dedup_drops_second_identical() -> None:
     mgr = _make_manager()
     dev = _device(dtype=DeviceType.MOTION_DETECTOR)
@@ -269,10 +339,11 @@ async def test_handle_event_dedup_drops_second_identical() -> None:
     _attach(mgr, space)
     payload = {"eventTag": "motiondetected", "hubId": "hub1", "deviceId": "d1"}
     await mgr._handle_event(payload)
-    first_calls = mgr.coordinator.async_set_updated_data.call_count
+    _fire_push(mgr)
     await mgr._handle_event(payload)
-    # Second one is deduped → no further updated_data call.
-    assert mgr.coordinator.async_set_updated_data.call_count == first_calls
+    # Second one is deduped → no further push scheduled.
+    assert mgr._push_scheduled is False
+    mgr.coordinator.async_set_updated_data.assert_called_once()
 
 
 async def test_handle_event_group_event_uses_group_id_in_dedup_key() -> None:
@@ -289,6 +360,13 @@ async def test_handle_event_group_event_uses_group_id_in_dedup_key() -> None:
     assert "G1" in key
 
 
+async def test_handle_event_coerces_numeric_source_id() -> None:
+    mgr = _make_manager()
+    _attach(mgr, _space())
+    await mgr._handle_event({"eventTag": "hubonline", "hubId": "hub1", "deviceId": 123})
+    assert next(iter(mgr._recent_events))[0] == "123"
+
+
 async def test_handle_event_cleans_expired_dedup_entries() -> None:
     mgr = _make_manager()
     space = _space()
@@ -299,20 +377,41 @@ async def test_handle_event_cleans_expired_dedup_entries() -> None:
     assert "stale" not in mgr._recent_events
 
 
-async def test_handle_event_unhandled_tag_logs_and_still_updates() -> None:
+async def test_handle_event_dedup_cleanup_stops_at_first_live_entry() -> None:
     mgr = _make_manager()
     space = _space()
+    space.devices["d1"] = _device(dtype=DeviceType.MOTION_DETECTOR)
     _attach(mgr, space)
-    await mgr._handle_event({"eventTag": "somethingweird", "hubId": "hub1", "deviceId": "x"})
-    mgr.coordinator.async_set_updated_data.assert_called_once()
+    mgr._recent_events["stale"] = time.time() - 120
+    mgr._recent_events["live"] = time.time() - 10
+    await mgr._handle_event({"eventTag": "motiondetected", "hubId": "hub1", "deviceId": "d1"})
+    assert list(mgr._recent_events)[0] == "live"
+    assert len(mgr._recent_events) == 2
 
 
-async def test_handle_event_hub_event_logs_info() -> None:
+async def test_handle_event_dedup_table_is_capped() -> None:
     mgr = _make_manager()
+    mgr.RECENT_EVENTS_MAX = 2
     space = _space()
+    space.devices["d1"] = _device(dtype=DeviceType.MOTION_DETECTOR)
     _attach(mgr, space)
-    await mgr._handle_event({"eventTag": "hubonline", "hubId": "hub1", "deviceId": "hub1"})
-    mgr.coordinator.async_set_updated_data.assert_called_once()
+    now = time.time()
+    mgr._recent_events["a"] = now - 10
+    mgr._recent_events["b"] = now - 9
+    await mgr._handle_event({"eventTag": "motiondetected", "hubId": "hub1", "deviceId": "d1"})
+    assert "a" not in mgr._recent_events
+    assert len(mgr._recent_events) == 2
+
+
+@pytest.mark.parametrize("tag", ["somethingweird", "hubonline"])
+async def test_handle_event_log_only_tags_skip_push(tag: str) -> None:
+    mgr = _make_manager()
+    space = _space()
+    _attach(mgr, space)
+    await mgr._handle_event({"eventTag": tag, "hubId": "hub1", "deviceId": "hub1"})
+    assert mgr._push_scheduled is False
+    mgr.coordinator.hass.loop.call_later.assert_not_called()
+    mgr.coordinator.async_set_updated_data.assert_not_called()
 
 
 async def test_handle_event_swallows_handler_exception() -> None:
@@ -323,7 +422,36 @@ async def test_handle_event_swallows_handler_exception() -> None:
     # raise *after* a normal handler — actually make the account access blow up.
     mgr.coordinator.async_set_updated_data = MagicMock(side_effect=RuntimeError("boom"))
     # Should not propagate.
+    await mgr._handle_event({"eventTag": "motiondetected", "hubId": "hub1", "deviceId": "d1"})
+    _fire_push(mgr)
+    assert mgr._push_scheduled is False
+
+
+async def test_handle_event_burst_coalesces_into_one_push() -> None:
+    mgr = _make_manager()
+    dev = _device(dtype=DeviceType.MOTION_DETECTOR)
+    space = _space()
+    space.devices[dev.id] = dev
+    _attach(mgr, space)
+    await mgr._handle_event({"eventTag": "motiondetected", "hubId": "hub1", "deviceId": "d1"})
+    await mgr._handle_event({"eventTag": "DoorOpened", "hubId": "hub1", "deviceId": "d1"})
     await mgr._handle_event({"eventTag": "hubonline", "hubId": "hub1", "deviceId": "hub1"})
+    assert mgr.coordinator.hass.loop.call_later.call_count == 1
+    _fire_push(mgr)
+    mgr.coordinator.async_set_updated_data.assert_called_once()
+
+
+async def test_handle_event_security_pushes_immediately() -> None:
+    mgr = _make_manager()
+    mgr._schedule_coordinator_push()
+    space = _space()
+    _attach(mgr, space)
+    mgr._handle_security_event = AsyncMock()
+    await mgr._handle_event({"eventTag": "arm", "hubId": "hub1", "deviceId": "hub1"})
+    mgr.coordinator.async_set_updated_data.assert_called_once()
+    # The pending debounced push is now redundant and must not fire again.
+    mgr.coordinator.hass.loop.call_later.call_args[0][1]()
+    mgr.coordinator.async_set_updated_data.assert_called_once()
 
 
 async def test_handle_event_flat_source_fields_resolve() -> None:
@@ -472,6 +600,7 @@ def test_record_alarm_event_inserts_and_caps_history() -> None:
     assert space.recent_events[0]["action"] == "smoke_detected"
     assert space.recent_events[0]["is_alarm"] is True
     assert space.recent_events[0]["room_name"] == "Hall"
+    assert space.recent_events[0]["timestamp"] == space.recent_events[0]["event_time"].isoformat()
     # Persistent notification spawned in background.
     mgr.coordinator.hass.async_create_task.assert_called()
 
@@ -861,6 +990,7 @@ def test_lock_event_locks_existing_lock_by_code() -> None:
     assert lock.is_locked is True
     assert lock.last_changed_by == "Bob"
     assert lock.last_event_tag == "smartlockunlockedbyuser"
+    assert lock.last_event_time is lock.last_sse_event_time
 
 
 def test_lock_event_auto_discovers_new_lock() -> None:
@@ -940,6 +1070,26 @@ def test_video_event_updates_detection_and_schedules_reset() -> None:
     assert len(mgr._pending_timers) == 1
 
 
+def test_video_event_burst_rearms_single_reset_timer() -> None:
+    mgr = _make_manager()
+    mgr.coordinator.hass.loop.call_later = MagicMock(side_effect=lambda *args: MagicMock())
+    space = _space()
+    ve = AjaxVideoEdge(id="ve1", name="Cam", space_id="s1", channels=[{"id": "0", "state": []}])
+    space.video_edges[ve.id] = ve
+    _attach(mgr, space)
+    mgr._handle_video_event(space, "videomotiondetected", "", "Cam", "ve1")
+    first = mgr._video_resets[("s1", "ve1", None, "VIDEO_MOTION")]
+    mgr._handle_video_event(space, "videomotiondetected", "", "Cam", "ve1")
+    first.cancel.assert_called_once()
+    assert len(mgr._pending_timers) == 1
+    assert mgr._video_resets[("s1", "ve1", None, "VIDEO_MOTION")] is not first
+    # The surviving timer clears the detection and forgets its key.
+    delay, wrapped, *args = mgr.coordinator.hass.loop.call_later.call_args[0]
+    wrapped(*args)
+    assert mgr._video_resets == {}
+    assert not ve.channels[0]["state"][0]["active"]
+
+
 def test_video_event_via_event_type_v2() -> None:
     mgr = _make_manager()
     space = _space()
@@ -1199,6 +1349,29 @@ async def test_handle_event_dispatches_video_via_type_v2() -> None:
     assert any(e["type"] == "VIDEO_HUMAN" for e in ve.channels[0]["state"])
 
 
+async def test_handle_event_video_type_v2_takes_over_doorbell_tag() -> None:
+    mgr = _make_manager()
+    space = _space()
+    ve = AjaxVideoEdge(id="ve1", name="Cam", space_id="s1", channels=[{"id": "0", "state": []}])
+    space.video_edges[ve.id] = ve
+    _attach(mgr, space)
+    await mgr._handle_event(
+        {"eventTag": "doorbellring", "hubId": "hub1", "sourceObjectId": "ve1", "eventTypeV2": "VIDEO_HUMAN"}
+    )
+    assert any(e["type"] == "VIDEO_HUMAN" for e in ve.channels[0]["state"])
+
+
+def test_tag_category_table_keeps_chain_precedence() -> None:
+    assert sse_manager_mod._TAG_CATEGORY["disarm"] == "security"
+    assert sse_manager_mod._TAG_CATEGORY["doorbellpressed"] == "doorbell"
+    # Every tag lands in the first category of the chain that lists it.
+    for tag, category in sse_manager_mod._TAG_CATEGORY.items():
+        if tag in EVENT_TAG_TO_STATE:
+            assert category == "security"
+        elif tag in DOOR_EVENTS:
+            assert category == "door"
+
+
 async def test_handle_event_dispatches_doorbell() -> None:
     mgr = _make_manager()
     dev = _device(dtype=DeviceType.DOORBELL)
@@ -15,6 +15,7 @@ We test the bits that don't need a network round-trip:
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -26,7 +27,10 @@ def _make_manager() -> SSEManager:
     """Build a manager wired to a fake coordinator (no SSE client / no asyncio)."""
     mgr = object.__new__(SSEManager)
     mgr._last_state_update = {}
-    mgr._recent_events = {}
+    mgr._recent_events = OrderedDict()
+    mgr._push_scheduled = False
+    mgr._spaces_by_hub = {}
+    mgr._device_index = {}
     mgr._dedup_window = 5
     mgr._last_discovery_refresh = 0.0
     mgr.coordinator = SimpleNamespace(
@@ -83,6 +87,31 @@ def test_find_device_by_name_fallback() -> None:
     assert mgr._find_device(space, source_name="Garage Door", source_id="") is dev
 
 
+def test_find_device_reuses_index_until_stale() -> None:
+    mgr = _make_manager()
+    dev = _door(name="Garage Door")
+    space = _space_with(dev)
+    assert mgr._find_device(space, source_name="Garage Door", source_id="") is dev
+    index = mgr._device_index[space.id]
+    assert mgr._find_device(space, source_name="Garage Door", source_id="") is dev
+    assert mgr._device_index[space.id] is index  # hit: no rebuild
+    # Renamed by a poll: the old name is stale and the new one resolves.
+    dev.name = "Side Door"
+    assert mgr._find_device(space, source_name="Garage Door", source_id="") is None
+    assert mgr._find_device(space, source_name="Side Door", source_id="") is dev
+
+
+def test_find_device_index_drops_removed_device() -> None:
+    mgr = _make_manager()
+    old = AjaxDevice(id="ABCDEFGH12345678", name="Wire 1", type=DeviceType.WIRE_INPUT, space_id="s1", hub_id="hub1")
+    space = _space_with(old)
+    assert mgr._find_device(space, source_name="", source_id="12345678") is old
+    del space.devices[old.id]
+    new = AjaxDevice(id="ZZZZZZZZ12345678", name="Wire 2", type=DeviceType.WIRE_INPUT, space_id="s1", hub_id="hub1")
+    space.devices[new.id] = new
+    assert mgr._find_device(space, source_name="", source_id="12345678") is new
+
+
 def test_find_device_returns_none_and_triggers_discovery_refresh() -> None:
     """Unknown source_id → return None *and* nudge the coordinator to refresh."""
     mgr = _make_manager()